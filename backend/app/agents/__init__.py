@@ -3,6 +3,7 @@ from app.agents.graph import (
     WorkflowRunner,
     create_workflow_graph,
     get_compiled_workflow,
+    get_workflow_runner,
     workflow_runner,
 )
 from app.agents.state import (
@@ -34,5 +35,6 @@ __all__ = [
     "create_workflow_graph",
     "get_compiled_workflow",
     "WorkflowRunner",
+    "get_workflow_runner",
     "workflow_runner",
 ]
@@ -1,5 +1,6 @@
 """Main LangGraph workflow for product-to-code transformation."""
 import asyncio
+from functools import lru_cache
 from typing import Any, Literal
 
 from langgraph.checkpoint.memory import MemorySaver
@@ -523,6 +524,14 @@ class WorkflowRunner:
         state = await self.workflow.aget_state(config)
         return dict(state.values) if state and state.values else {}
 
+    async def restore_state(self, run_id: int, state: dict[str, Any]) -> None:
+        """Seed a run's checkpoint with a saved state paused at its review gate."""
+        config = {"configurable": {"thread_id": str(run_id)}}
+        await self.workflow.aupdate_state(
+            config, state, as_node=f"{state['approval_type']}_review"
+        )
+        logger.info(f"Restored state for run {run_id} at {state['approval_type']} review")
+
     async def approve_items(
         self,
         run_id: int,
@@ -583,8 +592,14 @@ class WorkflowRunner:
         )
 
 
+@lru_cache(maxsize=1)
+def get_workflow_runner() -> WorkflowRunner:
+    """Get the process-wide workflow runner; cache_clear() gives tests a fresh one."""
+    return WorkflowRunner()
+
+
 # Global workflow runner instance
-workflow_runner = WorkflowRunner()
+workflow_runner = get_workflow_runner()
 
 
 def get_compiled_workflow(checkpointer=None):
@@ -21,6 +21,7 @@ from app.schemas.code import (
     CodeArtifactResponse,
     CodeArtifactUpdate,
     CodeExportResponse,
+    CodeValidationReportsRequest,
 )
 from app.schemas.common import MessageResponse, PaginatedResponse
 
@@ -301,8 +302,35 @@ async def get_validation_report(
             detail="Code artifact not found",
         )
 
+    return _validation_report(artifact)
+
+
+@router.post("/validation-reports")
+async def get_validation_reports(
+    request: CodeValidationReportsRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Get the validation reports for several code artifacts in one request.
+
+    Artifacts that don't exist or belong to another user are left out.
+    """
+    result = await db.execute(
+        select(CodeArtifact)
+        .join(Spec)
+        .join(Story)
+        .join(Epic)
+        .join(Project)
+        .where(CodeArtifact.id.in_(request.ids), Project.user_id == current_user.id)
+    )
+
+    return {"reports": [_validation_report(artifact) for artifact in result.scalars().all()]}
+
+
+def _validation_report(artifact: CodeArtifact) -> dict:
+    """Build the validation report payload for an artifact."""
     return {
-        "artifact_id": artifact_id,
+        "artifact_id": artifact.id,
         "status": artifact.status.value,
         "validation_report": artifact.validation_report,
         "lint_results": artifact.lint_results,
@@ -15,6 +15,7 @@ from app.models.user import User
 from app.schemas.common import MessageResponse, PaginatedResponse
 from app.schemas.epic import (
     EpicApproval,
+    EpicBulkApproval,
     EpicCreate,
     EpicResponse,
     EpicUpdate,
@@ -246,6 +247,54 @@ async def approve_epic(
     return epic
 
 
+@router.post("/bulk-approve", response_model=list[EpicResponse])
+async def bulk_approve_epics(
+    approval: EpicBulkApproval,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> list[Epic]:
+    """Approve or reject several epics in one request.
+
+    Either every epic is updated or none is.
+    """
+    ids = list(dict.fromkeys(approval.ids))
+    result = await db.execute(
+        select(Epic)
+        .join(Project)
+        .where(Epic.id.in_(ids), Project.user_id == current_user.id)
+    )
+    epics = {epic.id: epic for epic in result.scalars().all()}
+
+    if len(epics) != len(ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Epic not found",
+        )
+
+    if any(epic.status != EpicStatus.PENDING_REVIEW for epic in epics.values()):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Epic is not pending review",
+        )
+
+    for epic in epics.values():
+        if approval.approved:
+            epic.status = EpicStatus.APPROVED
+        else:
+            epic.status = EpicStatus.REJECTED
+            epic.feedback = approval.feedback
+
+    await db.flush()
+    # Reload server-set columns such as updated_at for all epics in one query
+    await db.execute(
+        select(Epic)
+        .where(Epic.id.in_(ids))
+        .execution_options(populate_existing=True)
+    )
+
+    return [epics[epic_id] for epic_id in ids]
+
+
 @router.get("/project/{project_id}/dependency-graph")
 async def get_epic_dependency_graph(
     project_id: int,
@@ -16,6 +16,7 @@ from app.models.user import User
 from app.schemas.common import MessageResponse, PaginatedResponse
 from app.schemas.spec import (
     SpecApproval,
+    SpecBulkApproval,
     SpecCreate,
     SpecResponse,
     SpecUpdate,
@@ -243,6 +244,56 @@ async def approve_spec(
     return spec
 
 
+@router.post("/bulk-approve", response_model=list[SpecResponse])
+async def bulk_approve_specs(
+    approval: SpecBulkApproval,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> list[Spec]:
+    """Approve or reject several specs in one request.
+
+    Either every spec is updated or none is.
+    """
+    ids = list(dict.fromkeys(approval.ids))
+    result = await db.execute(
+        select(Spec)
+        .join(Story)
+        .join(Epic)
+        .join(Project)
+        .where(Spec.id.in_(ids), Project.user_id == current_user.id)
+    )
+    specs = {spec.id: spec for spec in result.scalars().all()}
+
+    if len(specs) != len(ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Spec not found",
+        )
+
+    if any(spec.status != SpecStatus.PENDING_REVIEW for spec in specs.values()):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Spec is not pending review",
+        )
+
+    for spec in specs.values():
+        if approval.approved:
+            spec.status = SpecStatus.APPROVED
+        else:
+            spec.status = SpecStatus.REJECTED
+            spec.feedback = approval.feedback
+
+    await db.flush()
+    # Reload server-set columns such as updated_at for all specs in one query
+    await db.execute(
+        select(Spec)
+        .where(Spec.id.in_(ids))
+        .execution_options(populate_existing=True)
+    )
+
+    return [specs[spec_id] for spec_id in ids]
+
+
 @router.get("/{spec_id}/diagrams")
 async def get_spec_diagrams(
     spec_id: int,
@@ -15,6 +15,7 @@ from app.models.user import User
 from app.schemas.common import MessageResponse, PaginatedResponse
 from app.schemas.story import (
     StoryApproval,
+    StoryBulkApproval,
     StoryCreate,
     StoryResponse,
     StoryUpdate,
@@ -248,6 +249,55 @@ async def approve_story(
     return story
 
 
+@router.post("/bulk-approve", response_model=list[StoryResponse])
+async def bulk_approve_stories(
+    approval: StoryBulkApproval,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> list[Story]:
+    """Approve or reject several stories in one request.
+
+    Either every story is updated or none is.
+    """
+    ids = list(dict.fromkeys(approval.ids))
+    result = await db.execute(
+        select(Story)
+        .join(Epic)
+        .join(Project)
+        .where(Story.id.in_(ids), Project.user_id == current_user.id)
+    )
+    stories = {story.id: story for story in result.scalars().all()}
+
+    if len(stories) != len(ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Story not found",
+        )
+
+    if any(story.status != StoryStatus.PENDING_REVIEW for story in stories.values()):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Story is not pending review",
+        )
+
+    for story in stories.values():
+        if approval.approved:
+            story.status = StoryStatus.APPROVED
+        else:
+            story.status = StoryStatus.REJECTED
+            story.feedback = approval.feedback
+
+    await db.flush()
+    # Reload server-set columns such as updated_at for all stories in one query
+    await db.execute(
+        select(Story)
+        .where(Story.id.in_(ids))
+        .execution_options(populate_existing=True)
+    )
+
+    return [stories[story_id] for story_id in ids]
+
+
 @router.get("/epic/{epic_id}/summary")
 async def get_epic_stories_summary(
     epic_id: int,
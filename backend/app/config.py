@@ -35,6 +35,7 @@ class Settings(BaseSettings):
 
     # Agent Configuration
     max_retries: int = 3
+    max_concurrent_workflows: int = 8
     checkpoint_dir: str = "./checkpoints"
 
     model_config = {
@@ -11,12 +11,23 @@ DATABASE_URL = settings.database_url.replace(
     "postgresql://", "postgresql+asyncpg://"
 )
 
+# Keep compiled SQL and asyncpg prepared statements around for the hot
+# session.get / update(...).where(Run.id == ...) paths used by the services
+connect_args = (
+    {"prepared_statement_cache_size": 500}
+    if DATABASE_URL.startswith("postgresql+asyncpg://")
+    else {}
+)
+
 engine = create_async_engine(
     DATABASE_URL,
     echo=settings.debug,
     pool_pre_ping=True,
-    pool_size=5,
+    pool_size=20,
     max_overflow=10,
+    pool_recycle=1800,
+    query_cache_size=1200,
+    connect_args=connect_args,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -27,7 +38,7 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
-# Alias for use in background tasks
+# Alias for use in background tasks; shares the engine (and pool) with request sessions
 async_session_maker = AsyncSessionLocal
 
 
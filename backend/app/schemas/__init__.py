@@ -7,6 +7,7 @@ from app.schemas.code import (
     CodeExportResponse,
     CodeFile,
     CodeGenerationRequest,
+    CodeValidationReportsRequest,
     CodeValidationRequest,
     LintResult,
     TestResult,
@@ -22,6 +23,7 @@ from app.schemas.common import (
 )
 from app.schemas.epic import (
     EpicApproval,
+    EpicBulkApproval,
     EpicCreate,
     EpicGenerationRequest,
     EpicResponse,
@@ -45,6 +47,7 @@ from app.schemas.spec import (
     DataModelField,
     SecurityRequirement,
     SpecApproval,
+    SpecBulkApproval,
     SpecCreate,
     SpecGenerationRequest,
     SpecResponse,
@@ -55,6 +58,7 @@ from app.schemas.spec import (
 from app.schemas.story import (
     AcceptanceCriterion,
     StoryApproval,
+    StoryBulkApproval,
     StoryCreate,
     StoryGenerationRequest,
     StoryResponse,
@@ -101,6 +105,7 @@ __all__ = [
     "EpicCreate",
     "EpicUpdate",
     "EpicApproval",
+    "EpicBulkApproval",
     "EpicResponse",
     "EpicWithStoriesResponse",
     "EpicGenerationRequest",
@@ -109,6 +114,7 @@ __all__ = [
     "StoryCreate",
     "StoryUpdate",
     "StoryApproval",
+    "StoryBulkApproval",
     "StoryResponse",
     "StoryWithSpecsResponse",
     "StoryGenerationRequest",
@@ -121,6 +127,7 @@ __all__ = [
     "SpecCreate",
     "SpecUpdate",
     "SpecApproval",
+    "SpecBulkApproval",
     "SpecResponse",
     "SpecWithCodeResponse",
     "SpecGenerationRequest",
@@ -134,6 +141,7 @@ __all__ = [
     "CodeArtifactResponse",
     "CodeGenerationRequest",
     "CodeValidationRequest",
+    "CodeValidationReportsRequest",
     "CodeExportRequest",
     "CodeExportResponse",
 ]
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.models.code_artifact import CodeArtifactStatus
 from app.schemas.common import BaseSchema
@@ -97,6 +97,12 @@ class CodeValidationRequest(BaseModel):
     auto_fix: bool = True
 
 
+class CodeValidationReportsRequest(BaseModel):
+    """Request schema for fetching several validation reports at once."""
+
+    ids: list[int] = Field(..., min_length=1, max_length=100)
+
+
 class CodeExportRequest(BaseModel):
     """Request schema for code export."""
 
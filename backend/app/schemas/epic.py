@@ -44,6 +44,12 @@ class EpicApproval(BaseModel):
     feedback: Optional[str] = None
 
 
+class EpicBulkApproval(EpicApproval):
+    """Schema for approving/rejecting several epics at once."""
+
+    ids: list[int] = Field(..., min_length=1, max_length=100)
+
+
 class EpicResponse(EpicBase, BaseSchema):
     """Schema for epic response."""
 
@@ -92,6 +92,12 @@ class SpecApproval(BaseModel):
     feedback: Optional[str] = None
 
 
+class SpecBulkApproval(SpecApproval):
+    """Schema for approving/rejecting several specs at once."""
+
+    ids: list[int] = Field(..., min_length=1, max_length=100)
+
+
 class SpecResponse(SpecBase, BaseSchema):
     """Schema for spec response."""
 
@@ -52,6 +52,12 @@ class StoryApproval(BaseModel):
     feedback: Optional[str] = None
 
 
+class StoryBulkApproval(StoryApproval):
+    """Schema for approving/rejecting several stories at once."""
+
+    ids: list[int] = Field(..., min_length=1, max_length=100)
+
+
 class StoryResponse(StoryBase, BaseSchema):
     """Schema for story response."""
 
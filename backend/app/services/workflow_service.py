@@ -2,6 +2,7 @@
 import asyncio
 from typing import Any, Optional
 
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -19,6 +20,72 @@ from app.services.project_service import ProjectService
 
 logger = get_logger("workflow_service")
 
+# Caps how many LangGraph runs execute at once; each holds a DB session and LLM client
+_workflow_semaphore = asyncio.Semaphore(settings.max_concurrent_workflows)
+
+# Strong references to in-flight background tasks so they are not garbage collected
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _spawn_background(coro, name: Optional[str] = None) -> asyncio.Task:
+    """Schedule a coroutine without awaiting it, holding a reference until it finishes."""
+    task = asyncio.create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def _artifact_counts(result: dict[str, Any]) -> dict[str, int]:
+    """Build the artifact count summary published on workflow completion."""
+    return {
+        f"{key}_count": len(result.get(key) or ())
+        for key in ("epics", "stories", "specs", "code_artifacts")
+    }
+
+
+def _epic_values(run_id: int, project_id: int, data: dict) -> dict[str, Any]:
+    """Map generated epic data onto Epic column values."""
+    return {
+        "project_id": project_id,
+        "run_id": run_id,
+        "title": data.get("title", ""),
+        "goal": data.get("goal", ""),
+        "scope": data.get("scope", ""),
+        "priority": data.get("priority", "medium"),
+        "dependencies": data.get("dependencies"),
+        "mermaid_diagram": data.get("mermaid_diagram"),
+        "status": EpicStatus.PENDING_REVIEW,
+    }
+
+
+def _story_values(epic_id: int, data: dict) -> dict[str, Any]:
+    """Map generated story data onto Story column values."""
+    return {
+        "epic_id": epic_id,
+        "title": data.get("title", ""),
+        "description": data.get("description", ""),
+        "acceptance_criteria": data.get("acceptance_criteria", []),
+        "priority": data.get("priority", "medium"),
+        "story_points": data.get("story_points"),
+        "edge_cases": data.get("edge_cases", []),
+        "status": StoryStatus.PENDING_REVIEW,
+    }
+
+
+def _spec_values(story_id: int, data: dict) -> dict[str, Any]:
+    """Map generated spec data onto Spec column values."""
+    return {
+        "story_id": story_id,
+        "content": data.get("content", ""),
+        "requirements": data.get("requirements"),
+        "api_design": data.get("api_design"),
+        "data_model": data.get("data_model"),
+        "security_requirements": data.get("security_requirements"),
+        "test_plan": data.get("test_plan"),
+        "mermaid_diagrams": data.get("mermaid_diagrams"),
+        "status": SpecStatus.PENDING_REVIEW,
+    }
+
 
 class WorkflowService:
     """Service for workflow execution and management."""
@@ -46,8 +113,14 @@ class WorkflowService:
         """
         logger.info(f"Starting workflow for project {project_id} (user {user_id})")
 
-        # Get project
-        project = await self.project_service.get_project(project_id, user_id)
+        # Get project; only two columns are read, so skip hydrating the Project and its runs
+        project = (
+            await self.db.execute(
+                select(Project.name, Project.product_request).where(
+                    Project.id == project_id, Project.user_id == user_id
+                )
+            )
+        ).one_or_none()
         if not project:
             raise ValueError("Project not found")
 
@@ -63,28 +136,34 @@ class WorkflowService:
         )
 
         # Update project status
-        project.status = ProjectStatus.IN_PROGRESS
-        await self.db.flush()
+        await self.db.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(status=ProjectStatus.IN_PROGRESS)
+        )
 
-        # Publish SSE event
-        await sse_manager.publish_stage_update(
-            run.id,
-            "research",
-            "Starting research phase...",
-            0.0,
+        # Publish SSE event (fire-and-forget so the workflow never waits on notifiers)
+        _spawn_background(
+            sse_manager.publish_stage_update(
+                run.id,
+                "research",
+                "Starting research phase...",
+                0.0,
+            )
         )
 
         # Start workflow in background
         if launch_background:
             logger.info(f"Launching background task for run {run.id}")
-            asyncio.create_task(
+            _spawn_background(
                 self._execute_workflow(
                     run.id,
                     project_id,
                     user_id,
                     project.product_request,
                     constraints,
-                )
+                ),
+                name=f"workflow-{run.id}",
             )
 
         return run
@@ -120,13 +199,14 @@ class WorkflowService:
         logger.info(f"Background workflow execution started for run {run_id}")
 
         try:
-            result = await self.runner.start_workflow(
-                run_id=run_id,
-                project_id=project_id,
-                user_id=user_id,
-                product_request=product_request,
-                constraints=constraints,
-            )
+            async with _workflow_semaphore:
+                result = await self.runner.start_workflow(
+                    run_id=run_id,
+                    project_id=project_id,
+                    user_id=user_id,
+                    product_request=product_request,
+                    constraints=constraints,
+                )
 
             logger.info(f"Workflow returned for run {run_id}, processing result...")
 
@@ -136,21 +216,33 @@ class WorkflowService:
         except Exception as e:
             logger.error(f"Workflow execution failed for run {run_id}: {e}")
 
-            # Update run status to failed using a new session
-            try:
-                from app.database import async_session_maker
+            # Mark the run failed and notify subscribers concurrently; a failed
+            # SSE publish must not cancel the status update, so neither raises
+            outcomes = await asyncio.gather(
+                self._mark_failed_new_session(run_id, str(e)),
+                sse_manager.publish_error(run_id, str(e), recoverable=False),
+                return_exceptions=True,
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Failure handling for run {run_id} raised: {outcome!r}")
 
-                async with async_session_maker() as session:
-                    run = await session.get(Run, run_id)
-                    if run:
-                        run.status = RunStatus.FAILED
-                        run.error_message = str(e)
-                        await session.commit()
-                        logger.info(f"Updated run {run_id} status to FAILED")
-            except Exception as db_error:
-                logger.error(f"Failed to update run status: {db_error}")
+    async def _mark_failed_new_session(self, run_id: int, error_message: str) -> None:
+        """Set a run to FAILED using a new database session (for background tasks)."""
+        try:
+            from app.database import async_session_maker
 
-            await sse_manager.publish_error(run_id, str(e), recoverable=False)
+            async with async_session_maker() as session:
+                result = await session.execute(
+                    update(Run)
+                    .where(Run.id == run_id)
+                    .values(status=RunStatus.FAILED, error_message=error_message)
+                )
+                await session.commit()
+                if result.rowcount:
+                    logger.info(f"Updated run {run_id} status to FAILED")
+        except Exception as db_error:
+            logger.error(f"Failed to update run status: {db_error}")
 
     async def _process_workflow_result_with_new_session(
         self,
@@ -162,23 +254,31 @@ class WorkflowService:
 
         async with async_session_maker() as session:
             try:
-                current_stage = result.get("current_stage")
-                logger.info(f"Processing result for run {run_id}, stage: {current_stage}")
-
-                # Handle different stages
-                if result.get("awaiting_approval"):
-                    await self._handle_approval_required_with_session(session, run_id, result)
-                elif current_stage == WorkflowStage.COMPLETED:
-                    await self._handle_completion_with_session(session, run_id, result)
-                elif current_stage == WorkflowStage.FAILED:
-                    await self._handle_failure_with_session(session, run_id, result)
-
+                await self._process_workflow_result(session, run_id, result)
                 await session.commit()
             except Exception as e:
                 logger.error(f"Error processing workflow result: {e}")
                 await session.rollback()
                 raise
 
+    async def _process_workflow_result(
+        self,
+        session: AsyncSession,
+        run_id: int,
+        result: dict[str, Any],
+    ) -> None:
+        """Process workflow result and update database using the given session."""
+        current_stage = result.get("current_stage")
+        logger.info(f"Processing result for run {run_id}, stage: {current_stage}")
+
+        # Handle different stages
+        if result.get("awaiting_approval"):
+            await self._handle_approval_required_with_session(session, run_id, result)
+        elif current_stage == WorkflowStage.COMPLETED:
+            await self._handle_completion_with_session(session, run_id, result)
+        elif current_stage == WorkflowStage.FAILED:
+            await self._handle_failure_with_session(session, run_id, result)
+
     async def _handle_approval_required_with_session(
         self,
         session: AsyncSession,
@@ -186,21 +286,32 @@ class WorkflowService:
         result: dict[str, Any],
     ) -> None:
         """Handle workflow paused for approval (with explicit session)."""
+        stage = result.get("current_stage", "unknown")
+        stage_str = stage.value if hasattr(stage, "value") else str(stage)
         approval_type = result.get("approval_type")
         approval_ids = result.get("approval_ids", [])
 
-        run = await session.get(Run, run_id)
-        if run:
-            run.status = RunStatus.PAUSED
-            run.checkpoint_data = serialize_state(result)
+        # Serialize off the event loop; workflow states can carry large artifact lists.
+        # The full state is written every time, so the row never depends on an
+        # earlier write having committed in this process
+        checkpoint = await asyncio.to_thread(serialize_state, result)
+
+        updated = await session.execute(
+            update(Run)
+            .where(Run.id == run_id)
+            .values(status=RunStatus.PAUSED, checkpoint_data=checkpoint)
+        )
+        if updated.rowcount:
             logger.info(f"Run {run_id} paused for {approval_type} approval")
 
-        await sse_manager.publish_approval_required(
-            run_id,
-            result.get("current_stage", "unknown").value if hasattr(result.get("current_stage"), "value") else str(result.get("current_stage")),
-            approval_type,
-            approval_ids,
-            f"Awaiting approval for {len(approval_ids)} {approval_type}(s)",
+        _spawn_background(
+            sse_manager.publish_approval_required(
+                run_id,
+                stage_str,
+                approval_type,
+                approval_ids,
+                f"Awaiting approval for {len(approval_ids)} {approval_type}(s)",
+            )
         )
 
     async def _handle_completion_with_session(
@@ -210,26 +321,29 @@ class WorkflowService:
         result: dict[str, Any],
     ) -> None:
         """Handle workflow completion (with explicit session)."""
-        run = await session.get(Run, run_id)
-        if run:
-            run.status = RunStatus.COMPLETED
-            run.current_stage = WorkflowStage.COMPLETED
+        project_id = (
+            await session.execute(
+                update(Run)
+                .where(Run.id == run_id)
+                .values(status=RunStatus.COMPLETED, current_stage=WorkflowStage.COMPLETED)
+                .returning(Run.project_id)
+            )
+        ).scalar_one_or_none()
+        if project_id is not None:
             logger.info(f"Run {run_id} completed successfully")
+            await session.execute(
+                update(Project)
+                .where(Project.id == project_id)
+                .values(status=ProjectStatus.COMPLETED)
+            )
 
-            project = await session.get(Project, run.project_id)
-            if project:
-                project.status = ProjectStatus.COMPLETED
-
-        await sse_manager.publish_completion(
-            run_id,
-            success=True,
-            message="Workflow completed successfully",
-            artifacts={
-                "epics_count": len(result.get("epics", [])),
-                "stories_count": len(result.get("stories", [])),
-                "specs_count": len(result.get("specs", [])),
-                "code_artifacts_count": len(result.get("code_artifacts", [])),
-            },
+        _spawn_background(
+            sse_manager.publish_completion(
+                run_id,
+                success=True,
+                message="Workflow completed successfully",
+                artifacts=_artifact_counts(result),
+            )
         )
 
     async def _handle_failure_with_session(
@@ -241,111 +355,23 @@ class WorkflowService:
         """Handle workflow failure (with explicit session)."""
         error_message = result.get("error_message", "Unknown error")
 
-        run = await session.get(Run, run_id)
-        if run:
-            run.status = RunStatus.FAILED
-            run.error_message = error_message
+        project_id = (
+            await session.execute(
+                update(Run)
+                .where(Run.id == run_id)
+                .values(status=RunStatus.FAILED, error_message=error_message)
+                .returning(Run.project_id)
+            )
+        ).scalar_one_or_none()
+        if project_id is not None:
             logger.error(f"Run {run_id} failed: {error_message}")
+            await session.execute(
+                update(Project)
+                .where(Project.id == project_id)
+                .values(status=ProjectStatus.FAILED)
+            )
 
-            project = await session.get(Project, run.project_id)
-            if project:
-                project.status = ProjectStatus.FAILED
-
-        await sse_manager.publish_error(run_id, error_message, recoverable=False)
-
-    async def _process_workflow_result(
-        self,
-        run_id: int,
-        result: dict[str, Any],
-    ) -> None:
-        """Process workflow result and update database (uses existing session)."""
-        current_stage = result.get("current_stage")
-
-        # Handle different stages
-        if result.get("awaiting_approval"):
-            await self._handle_approval_required(run_id, result)
-        elif current_stage == WorkflowStage.COMPLETED:
-            await self._handle_completion(run_id, result)
-        elif current_stage == WorkflowStage.FAILED:
-            await self._handle_failure(run_id, result)
-
-    async def _handle_approval_required(
-        self,
-        run_id: int,
-        result: dict[str, Any],
-    ) -> None:
-        """Handle workflow paused for approval."""
-        approval_type = result.get("approval_type")
-        approval_ids = result.get("approval_ids", [])
-
-        # Update run status to paused
-        run = await self.db.get(Run, run_id)
-        if run:
-            run.status = RunStatus.PAUSED
-            run.checkpoint_data = serialize_state(result)
-            await self.db.flush()
-
-        # Publish SSE event
-        await sse_manager.publish_approval_required(
-            run_id,
-            result.get("current_stage", "unknown").value,
-            approval_type,
-            approval_ids,
-            f"Awaiting approval for {len(approval_ids)} {approval_type}(s)",
-        )
-
-    async def _handle_completion(
-        self,
-        run_id: int,
-        result: dict[str, Any],
-    ) -> None:
-        """Handle workflow completion."""
-        run = await self.db.get(Run, run_id)
-        if run:
-            run.status = RunStatus.COMPLETED
-            run.current_stage = WorkflowStage.COMPLETED
-            await self.db.flush()
-
-            # Update project status
-            project = await self.db.get(Project, run.project_id)
-            if project:
-                project.status = ProjectStatus.COMPLETED
-                await self.db.flush()
-
-        # Publish SSE event
-        await sse_manager.publish_completion(
-            run_id,
-            success=True,
-            message="Workflow completed successfully",
-            artifacts={
-                "epics_count": len(result.get("epics", [])),
-                "stories_count": len(result.get("stories", [])),
-                "specs_count": len(result.get("specs", [])),
-                "code_artifacts_count": len(result.get("code_artifacts", [])),
-            },
-        )
-
-    async def _handle_failure(
-        self,
-        run_id: int,
-        result: dict[str, Any],
-    ) -> None:
-        """Handle workflow failure."""
-        error_message = result.get("error_message", "Unknown error")
-
-        run = await self.db.get(Run, run_id)
-        if run:
-            run.status = RunStatus.FAILED
-            run.error_message = error_message
-            await self.db.flush()
-
-            # Update project status
-            project = await self.db.get(Project, run.project_id)
-            if project:
-                project.status = ProjectStatus.FAILED
-                await self.db.flush()
-
-        await sse_manager.publish_error(run_id, error_message, recoverable=False)
+        _spawn_background(sse_manager.publish_error(run_id, error_message, recoverable=False))
 
     async def approve_artifacts(
         self,
@@ -363,21 +389,25 @@ class WorkflowService:
         if run.status != RunStatus.PAUSED:
             raise ValueError("Run is not paused for approval")
 
-        # Update run status
+        # Update run status; the flush only touches the DB session, so let it
+        # overlap with the (much slower) workflow resume instead of blocking it
         run.status = RunStatus.RUNNING
-        await self.db.flush()
+        flush_task = asyncio.create_task(self.db.flush())
 
         # Resume workflow with approval
-        result = await self.runner.approve_items(
-            run_id=run_id,
-            item_type=artifact_type,
-            item_ids=artifact_ids,
-            approved=approved,
-            feedback=feedback,
-        )
+        try:
+            result = await self.runner.approve_items(
+                run_id=run_id,
+                item_type=artifact_type,
+                item_ids=artifact_ids,
+                approved=approved,
+                feedback=feedback,
+            )
+        finally:
+            await flush_task
 
         # Process result
-        await self._process_workflow_result(run_id, result)
+        await self._process_workflow_result(self.db, run_id, result)
 
         return run
 
@@ -394,17 +424,7 @@ class WorkflowService:
         """Save generated epics to database."""
         epics = []
         for data in epics_data:
-            epic = Epic(
-                project_id=project_id,
-                run_id=run_id,
-                title=data.get("title", ""),
-                goal=data.get("goal", ""),
-                scope=data.get("scope", ""),
-                priority=data.get("priority", "medium"),
-                dependencies=data.get("dependencies"),
-                mermaid_diagram=data.get("mermaid_diagram"),
-                status=EpicStatus.PENDING_REVIEW,
-            )
+            epic = Epic(**_epic_values(run_id, project_id, data))
             self.db.add(epic)
             epics.append(epic)
 
@@ -426,16 +446,7 @@ class WorkflowService:
             if not epic_id:
                 continue
 
-            story = Story(
-                epic_id=epic_id,
-                title=data.get("title", ""),
-                description=data.get("description", ""),
-                acceptance_criteria=data.get("acceptance_criteria", []),
-                priority=data.get("priority", "medium"),
-                story_points=data.get("story_points"),
-                edge_cases=data.get("edge_cases", []),
-                status=StoryStatus.PENDING_REVIEW,
-            )
+            story = Story(**_story_values(epic_id, data))
             self.db.add(story)
             stories.append(story)
 
@@ -457,17 +468,7 @@ class WorkflowService:
             if not story_id:
                 continue
 
-            spec = Spec(
-                story_id=story_id,
-                content=data.get("content", ""),
-                requirements=data.get("requirements"),
-                api_design=data.get("api_design"),
-                data_model=data.get("data_model"),
-                security_requirements=data.get("security_requirements"),
-                test_plan=data.get("test_plan"),
-                mermaid_diagrams=data.get("mermaid_diagrams"),
-                status=SpecStatus.PENDING_REVIEW,
-            )
+            spec = Spec(**_spec_values(story_id, data))
             self.db.add(spec)
             specs.append(spec)
 
@@ -477,6 +478,65 @@ class WorkflowService:
 
         return specs
 
+    async def save_all(
+        self,
+        run_id: int,
+        project_id: int,
+        epics_data: list[dict],
+        stories_data: list[dict],
+        specs_data: list[dict],
+    ) -> tuple[list[Epic], list[Story], list[Spec]]:
+        """Save epics, stories and specs with one bulk INSERT ... RETURNING per table.
+
+        Stories reference epics by ``epic_index`` and specs reference stories by
+        ``story_index`` (positions in the respective input lists). Items whose
+        parent was not saved are skipped, matching the per-table save methods.
+        """
+        epics: list[Epic] = []
+        if epics_data:
+            epics = list(
+                await self.db.scalars(
+                    insert(Epic).returning(Epic, sort_by_parameter_order=True),
+                    [_epic_values(run_id, project_id, data) for data in epics_data],
+                )
+            )
+        epic_mapping = {i: epic.id for i, epic in enumerate(epics)}
+
+        story_indexes = []
+        story_rows = []
+        for i, data in enumerate(stories_data):
+            epic_id = epic_mapping.get(data.get("epic_index", 0))
+            if epic_id:
+                story_indexes.append(i)
+                story_rows.append(_story_values(epic_id, data))
+
+        stories: list[Story] = []
+        if story_rows:
+            stories = list(
+                await self.db.scalars(
+                    insert(Story).returning(Story, sort_by_parameter_order=True),
+                    story_rows,
+                )
+            )
+        story_mapping = {i: story.id for i, story in zip(story_indexes, stories)}
+
+        spec_rows = []
+        for data in specs_data:
+            story_id = story_mapping.get(data.get("story_index", 0))
+            if story_id:
+                spec_rows.append(_spec_values(story_id, data))
+
+        specs: list[Spec] = []
+        if spec_rows:
+            specs = list(
+                await self.db.scalars(
+                    insert(Spec).returning(Spec, sort_by_parameter_order=True),
+                    spec_rows,
+                )
+            )
+
+        return epics, stories, specs
+
     async def save_code_artifacts_to_db(
         self,
         spec_id: int,
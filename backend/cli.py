@@ -16,21 +16,39 @@ Usage:
 import argparse
 import asyncio
 import getpass
+import io
+import itertools
 import json
 import os
 import sys
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
+
+try:
+    import readline  # Line editing, history and tab completion for input()
+except ImportError:  # Not available on Windows
+    readline = None
+try:
+    import orjson  # Faster pretty-printing of large artifacts in the approval viewer
+except ImportError:
+    orjson = None
 # from app.core.langfuse_client import start_run_trace, flush_langfuse
 
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Load environment variables
+# Load environment variables once, even across module reloads: reload re-runs
+# this code in the same namespace, so the flag from the first run is still set.
+# Kept out of os.environ so child processes load their own .env
 from dotenv import load_dotenv
-load_dotenv()
+if not globals().get("_DOTENV_LOADED"):
+    load_dotenv()
+_DOTENV_LOADED = True
 
 
 # ============================================================================
@@ -50,50 +68,63 @@ class Colors:
     END = '\033[0m'
 
 
+# Drop ANSI codes when the user opts out (https://no-color.org)
+if os.environ.get("NO_COLOR"):
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, "")
+
+# Precomputed format templates for the print helpers below
+_HEADER_BAR = f"{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.END}"
+_HEADER_TEMPLATE = f"\n{_HEADER_BAR}\n{Colors.BOLD}{Colors.HEADER}  {{}}{Colors.END}\n{_HEADER_BAR}\n"
+_SECTION_BAR = f"{Colors.BOLD}{Colors.CYAN}{'-'*50}{Colors.END}"
+_SECTION_TEMPLATE = f"\n{_SECTION_BAR}\n{Colors.BOLD}{Colors.CYAN}{{}}{Colors.END}\n{_SECTION_BAR}"
+_SUCCESS_TEMPLATE = f"{Colors.GREEN}✓ {{}}{Colors.END}"
+_ERROR_TEMPLATE = f"{Colors.RED}✗ {{}}{Colors.END}"
+_WARNING_TEMPLATE = f"{Colors.YELLOW}⚠ {{}}{Colors.END}"
+_INFO_TEMPLATE = f"{Colors.BLUE}ℹ {{}}{Colors.END}"
+_STAGE_TEMPLATES = {
+    "running": f"\n{Colors.YELLOW}▶ {{}}...{Colors.END}",
+    "complete": f"{Colors.GREEN}✓ {{}} complete{Colors.END}",
+    "failed": f"{Colors.RED}✗ {{}} failed{Colors.END}",
+    "waiting": f"{Colors.CYAN}⏸ {{}} - waiting for approval{Colors.END}",
+}
+
+
 def print_header(text: str):
     """Print a header."""
-    print(f"\n{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.HEADER}  {text}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.END}\n")
+    print(_HEADER_TEMPLATE.format(text))
 
 
 def print_section(text: str):
     """Print a section header."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'-'*50}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{text}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'-'*50}{Colors.END}")
+    print(_SECTION_TEMPLATE.format(text))
 
 
 def print_success(text: str):
     """Print success message."""
-    print(f"{Colors.GREEN}✓ {text}{Colors.END}")
+    print(_SUCCESS_TEMPLATE.format(text))
 
 
 def print_error(text: str):
     """Print error message."""
-    print(f"{Colors.RED}✗ {text}{Colors.END}")
+    print(_ERROR_TEMPLATE.format(text))
 
 
 def print_warning(text: str):
     """Print warning message."""
-    print(f"{Colors.YELLOW}⚠ {text}{Colors.END}")
+    print(_WARNING_TEMPLATE.format(text))
 
 
 def print_info(text: str):
     """Print info message."""
-    print(f"{Colors.BLUE}ℹ {text}{Colors.END}")
+    print(_INFO_TEMPLATE.format(text))
 
 
 def print_stage(stage: str, status: str = "running"):
     """Print stage indicator."""
-    if status == "running":
-        print(f"\n{Colors.YELLOW}▶ {stage}...{Colors.END}")
-    elif status == "complete":
-        print(f"{Colors.GREEN}✓ {stage} complete{Colors.END}")
-    elif status == "failed":
-        print(f"{Colors.RED}✗ {stage} failed{Colors.END}")
-    elif status == "waiting":
-        print(f"{Colors.CYAN}⏸ {stage} - waiting for approval{Colors.END}")
+    template = _STAGE_TEMPLATES.get(status)
+    if template:
+        print(template.format(stage))
 
 
 # ============================================================================
@@ -104,7 +135,9 @@ def check_environment() -> bool:
     """Check required environment variables."""
     print_section("Environment Check")
 
-    openai_key = os.getenv("OPENAI_API_KEY", "")
+    # A local name for the live mapping, not a snapshot; it only saves lookups
+    env = os.environ
+    openai_key = env.get("OPENAI_API_KEY", "")
 
     if not openai_key or openai_key.startswith("sk-your"):
         print_error("OPENAI_API_KEY not set in .env file")
@@ -114,13 +147,13 @@ def check_environment() -> bool:
     print_success(f"OPENAI_API_KEY: ***...{openai_key[-4:]}")
 
     # Optional checks
-    langfuse_key = os.getenv("LANGFUSE_SECRET_KEY", "")
+    langfuse_key = env.get("LANGFUSE_SECRET_KEY", "")
     if langfuse_key:
         print_success("LANGFUSE: Configured")
     else:
         print_warning("LANGFUSE: Not configured (optional)")
 
-    tavily_key = os.getenv("TAVILY_API_KEY", "")
+    tavily_key = env.get("TAVILY_API_KEY", "")
     if tavily_key:
         print_success("TAVILY: Configured (better web search)")
     else:
@@ -216,51 +249,93 @@ def create_project() -> CLIProject:
 # WORKFLOW EXECUTION
 # ============================================================================
 
+_ITEMS_HEADER_TEMPLATE = f"\n{Colors.BOLD}Generated {{}} {{}}(s):{Colors.END}\n"
+_ITEM_TITLE_TEMPLATE = f"{Colors.CYAN}[{{}}]{Colors.END} {Colors.BOLD}{{}}{Colors.END}"
+_CODE_FILES_HEADER_TEMPLATE = f"\n{Colors.BOLD}Generated {{}} files:{Colors.END}\n"
+_CODE_FILE_TEMPLATE = f"  {Colors.CYAN}📄 {{}}{Colors.END} ({{}} lines, {{}} bytes)"
+
+
 def display_items(items: list, item_type: str):
     """Display items for approval."""
-    print(f"\n{Colors.BOLD}Generated {len(items)} {item_type}(s):{Colors.END}\n")
+    lines = [_ITEMS_HEADER_TEMPLATE.format(len(items), item_type)]
 
     for i, item in enumerate(items):
-        print(f"{Colors.CYAN}[{i}]{Colors.END} {Colors.BOLD}{item.get('title', f'{item_type} {i}')}{Colors.END}")
+        lines.append(_ITEM_TITLE_TEMPLATE.format(i, item.get('title', f'{item_type} {i}')))
 
         if item_type == "epic":
-            print(f"    Goal: {item.get('goal', 'N/A')[:80]}...")
-            print(f"    Priority: {item.get('priority', 'medium')}")
+            lines.append(f"    Goal: {item.get('goal', 'N/A')[:80]}...")
+            lines.append(f"    Priority: {item.get('priority', 'medium')}")
             deps = item.get('dependencies', [])
             if deps:
-                print(f"    Dependencies: {deps}")
+                lines.append(f"    Dependencies: {deps}")
 
         elif item_type == "story":
-            print(f"    Epic: {item.get('epic_title', 'N/A')}")
-            print(f"    Description: {item.get('description', 'N/A')[:80]}...")
-            print(f"    Points: {item.get('story_points', 'N/A')}")
+            lines.append(f"    Epic: {item.get('epic_title', 'N/A')}")
+            lines.append(f"    Description: {item.get('description', 'N/A')[:80]}...")
+            lines.append(f"    Points: {item.get('story_points', 'N/A')}")
 
         elif item_type == "spec":
-            print(f"    Story: {item.get('story_title', 'N/A')}")
+            lines.append(f"    Story: {item.get('story_title', 'N/A')}")
             content = item.get('content', 'N/A')[:100]
-            print(f"    Preview: {content}...")
+            lines.append(f"    Preview: {content}...")
+
+        lines.append("")
+
+    # One write for the whole listing instead of several print() calls per item
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+_APPROVAL_MENU = (
+    f"{Colors.BOLD}Options:{Colors.END}\n"
+    f"  {Colors.GREEN}a/all{Colors.END}     - Approve all\n"
+    f"  {Colors.GREEN}0,1,2{Colors.END}     - Approve specific items by index\n"
+    f"  {Colors.RED}r/reject{Colors.END}  - Reject all (with feedback)\n"
+    f"  {Colors.CYAN}v N{Colors.END}       - View item N in detail\n"
+    f"  {Colors.YELLOW}q/quit{Colors.END}    - Quit workflow\n"
+)
+
+# readline needs non-printing escapes wrapped in \001/\002 to keep cursor math right
+_APPROVAL_PROMPT = (
+    f"\001{Colors.BOLD}\002Your choice: \001{Colors.END}\002"
+    if readline and Colors.BOLD
+    else f"{Colors.BOLD}Your choice: {Colors.END}"
+)
 
-        print()
+_APPROVAL_COMMANDS = ("a", "all", "r", "reject", "q", "quit", "v ")
+# Deletes spaces and tabs from index lists like "0, 1,\t2" in a single pass
+_STRIP_WS = str.maketrans("", "", " \t")
+
+
+def _complete_approval_command(text: str, state: int) -> Optional[str]:
+    """readline completer for the approval prompt commands."""
+    matches = [command for command in _APPROVAL_COMMANDS if command.startswith(text)]
+    return matches[state] if state < len(matches) else None
+
+
+def _format_details(item) -> str:
+    """Pretty-print an artifact for the `v N` view, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            item, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+        ).decode()
+    return json.dumps(item, indent=2, default=str)
 
 
 def prompt_for_approval(items: list, item_type: str, auto_approve: bool = False) -> tuple[list[int], bool, str]:
     """Prompt user for approval decision."""
-    display_items(items, item_type)
-
     if auto_approve:
         print_info("Auto-approving all items...")
         return list(range(len(items))), True, ""
 
-    print(f"{Colors.BOLD}Options:{Colors.END}")
-    print(f"  {Colors.GREEN}a/all{Colors.END}     - Approve all")
-    print(f"  {Colors.GREEN}0,1,2{Colors.END}     - Approve specific items by index")
-    print(f"  {Colors.RED}r/reject{Colors.END}  - Reject all (with feedback)")
-    print(f"  {Colors.CYAN}v N{Colors.END}       - View item N in detail")
-    print(f"  {Colors.YELLOW}q/quit{Colors.END}    - Quit workflow")
-    print()
+    display_items(items, item_type)
+    print(_APPROVAL_MENU)
+
+    if readline:
+        readline.set_completer(_complete_approval_command)
+        readline.parse_and_bind("tab: complete")
 
     while True:
-        choice = input(f"{Colors.BOLD}Your choice: {Colors.END}").strip().lower()
+        choice = input(_APPROVAL_PROMPT).strip().lower()
 
         if choice in ["a", "all"]:
             return list(range(len(items))), True, ""
@@ -278,7 +353,7 @@ def prompt_for_approval(items: list, item_type: str, auto_approve: bool = False)
                 idx = int(choice.split()[1])
                 if 0 <= idx < len(items):
                     print(f"\n{Colors.BOLD}--- {item_type.upper()} {idx} DETAILS ---{Colors.END}")
-                    print(json.dumps(items[idx], indent=2, default=str))
+                    print(_format_details(items[idx]))
                     print(f"{Colors.BOLD}--- END DETAILS ---{Colors.END}\n")
                 else:
                     print_error("Invalid index")
@@ -287,50 +362,103 @@ def prompt_for_approval(items: list, item_type: str, auto_approve: bool = False)
             continue
 
         try:
-            indices = [int(x.strip()) for x in choice.split(",")]
-            if all(0 <= i < len(items) for i in indices):
-                return indices, True, ""
-            print_error("Some indices are out of range")
+            indices = list(map(int, choice.translate(_STRIP_WS).split(",")))
         except ValueError:
             print_error("Invalid input")
+            continue
+        n = len(items)
+        bad = next((i for i in indices if not 0 <= i < n), None)
+        if bad is None:
+            return indices, True, ""
+        print_error(f"Index {bad} out of range [0, {n})")
 
 
 def display_code_files(files: dict):
     """Display generated code files."""
-    print(f"\n{Colors.BOLD}Generated {len(files)} files:{Colors.END}\n")
+    output = [_CODE_FILES_HEADER_TEMPLATE.format(len(files))]
 
     for filename in sorted(files.keys()):
         content = files[filename]
         lines = len(content.split('\n'))
         size = len(content)
-        print(f"  {Colors.CYAN}📄 {filename}{Colors.END} ({lines} lines, {size} bytes)")
+        output.append(_CODE_FILE_TEMPLATE.format(filename, lines, size))
+
+    sys.stdout.write("\n".join(output) + "\n")
+
+
+def _make_dirs(directories: set):
+    """Create each directory once, shallowest first so parents exist before children."""
+    for directory in sorted(directories, key=lambda p: len(p.parts)):
+        directory.mkdir(parents=True, exist_ok=True)
+
 
+def _write_tar(archive_path: Path, files: dict):
+    """Stream all files into a single uncompressed tarball."""
+    mtime = time.time()
+    with tarfile.open(archive_path, "w") as tf:
+        for filename, content in files.items():
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(filename)
+            info.size = len(data)
+            info.mtime = mtime
+            tf.addfile(info, io.BytesIO(data))
 
-def save_generated_code(files: dict, output_dir: str = "generated_code"):
-    """Save generated code to disk."""
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
 
-    for filename, content in files.items():
-        file_path = output_path / filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content)
+async def save_generated_code(files: dict, output_dir: str = "generated_code", archive: bool = False):
+    """Save generated code to disk, writing all files concurrently.
+
+    With archive=True the files go into a single <output_dir>.tar instead,
+    which avoids per-file filesystem overhead for large outputs.
+    """
+    output_path = Path(output_dir).resolve()
+    if archive:
+        archive_path = output_path.parent / f"{output_path.name}.tar"
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(_write_tar, archive_path, files)
+        print_success(f"Code archived to: {archive_path}")
+        return archive_path
+
+    file_paths = {filename: output_path / filename for filename in files}
+
+    # One mkdir per distinct directory instead of one per file
+    await asyncio.to_thread(
+        _make_dirs, {output_path} | {path.parent for path in file_paths.values()}
+    )
+
+    # Dedicated pool sized for disk queue depth rather than the loop's default executor
+    workers = max(1, min(32, (os.cpu_count() or 4) * 2, len(files)))
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        await asyncio.gather(*(
+            loop.run_in_executor(pool, file_paths[filename].write_bytes, content.encode("utf-8"))
+            for filename, content in files.items()
+        ))
 
-    print_success(f"Code saved to: {output_path.absolute()}")
+    print_success(f"Code saved to: {output_path}")
     return output_path
 
 
+# State key holding the items for each approval type
+# (closed set; an unknown type is a bug, so lookups raise KeyError)
+_PLURAL_MAP = {"epic": "epics", "story": "stories", "spec": "specs"}
+
+
+# Each run gets its own checkpointer thread on the shared runner
+_run_ids = itertools.count(1)
+
+
 async def run_workflow(project: CLIProject, user: CLIUser, auto_approve: bool = False):
     """Execute the complete workflow."""
-    from app.agents.graph import WorkflowRunner
+    from app.agents.graph import get_workflow_runner
     from app.agents.state import WorkflowStage
     from app.core.logging import setup_logging
 
     # Setup logging
     setup_logging("INFO")
 
-    runner = WorkflowRunner()
-    run_id = 1
+    # Process-wide runner so repeated runs reuse the compiled graph
+    runner = get_workflow_runner()
+    run_id = next(_run_ids)
 
     print_header("WORKFLOW EXECUTION")
     print(f"Project: {project.name}")
@@ -375,12 +503,11 @@ async def run_workflow(project: CLIProject, user: CLIUser, auto_approve: bool =
     while state.get("awaiting_approval") and iteration < max_iterations:
         iteration += 1
         # Code Generated by Sidekick is for learning and experimentation purposes only.
-        approval_type = state.get("approval_type")
-
-        plural_map = {"epic": "epics", "story": "stories", "spec": "specs"}
-        items_key = plural_map.get(approval_type, f"{approval_type}s")
+        state_get = state.get
+        approval_type = state_get("approval_type")
+        items_key = _PLURAL_MAP[approval_type]
 
-        items = state.get(items_key, [])
+        items = state_get(items_key, [])
 
 
         if not items:
@@ -450,7 +577,7 @@ async def run_workflow(project: CLIProject, user: CLIUser, auto_approve: bool =
                 output_dir = input(f"{Colors.CYAN}Output directory (default: generated_code): {Colors.END}").strip()
                 if not output_dir:
                     output_dir = "generated_code"
-                save_generated_code(files, output_dir)
+                await save_generated_code(files, output_dir)
 
         return state
 
@@ -468,7 +595,7 @@ async def run_workflow(project: CLIProject, user: CLIUser, auto_approve: bool =
 # QUICK RUN MODE
 # ============================================================================
 
-async def quick_run(product_request: str, constraints: str = None, auto_approve: bool = False, output_dir: str = "generated_code"):
+async def quick_run(product_request: str, constraints: str = None, auto_approve: bool = False, output_dir: str = "generated_code", archive: bool = False):
     """Quick run mode with minimal interaction."""
     print_header("PRODUCT-TO-CODE CLI (Quick Mode)")
 
@@ -494,7 +621,7 @@ async def quick_run(product_request: str, constraints: str = None, auto_approve:
     if state and state.get("code_artifacts"):
         files = state["code_artifacts"][0].get("files", {})
         if files and auto_approve:
-            save_generated_code(files, output_dir)
+            await save_generated_code(files, output_dir, archive=archive)
 
     return state
 
@@ -551,6 +678,7 @@ Examples:
   python cli.py -a "Build a blog API"              # Auto-approve all stages
   python cli.py -c "Use Redis" "Build a cache"    # With constraints
   python cli.py -o ./output "Build an API"         # Custom output directory
+  NO_COLOR=1 python cli.py                         # Plain output without ANSI colors
         """
     )
 
@@ -577,6 +705,12 @@ Examples:
         help="Output directory for generated code (default: generated_code)",
     )
 
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="Save generated code as a single <output>.tar instead of a directory",
+    )
+
     parser.add_argument(
         "-i", "--interactive",
         action="store_true",
@@ -593,6 +727,7 @@ Examples:
                 constraints=args.constraints,
                 auto_approve=args.auto_approve,
                 output_dir=args.output,
+                archive=args.archive,
             ))
         else:
             # Interactive mode
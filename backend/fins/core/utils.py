@@ -1,19 +1,19 @@
-from threading import Lock
+from itertools import count
 
 class IDGenerator:
     """
     Thread-safe monotonic integer ID generator.
+
+    Backed by itertools.count, whose __next__ runs atomically under the GIL,
+    so no explicit lock is needed. IDs are unique per process only.
     """
     def __init__(self, start: int = 1):
-        self._lock = Lock()
-        self._current = start - 1
+        self._next = count(start).__next__
 
     def next_id(self) -> int:
         """
         Returns the next unique integer ID.
         """
-        with self._lock:
-            self._current += 1
-            return self._current
+        return self._next()
 
 id_generator = IDGenerator()
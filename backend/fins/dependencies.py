@@ -1,7 +1,8 @@
+import os
 from fastapi import Depends
 from storage import (
     ListBookRepository, DictBookRepository,
-    ListMemberRepository, DictMemberRepository,
+    ListMemberRepository, DictMemberRepository, SoAMemberRepository,
     ListLoanRepository, DictLoanRepository
 )
 from services.books import BookService
@@ -11,7 +12,10 @@ from core.utils import id_generator
 
 # Choose repository implementation here
 book_repo = DictBookRepository(id_generator)
-member_repo = DictMemberRepository(id_generator)
+# FINS_MEMBER_STORAGE=soa opts into column-oriented member storage for large tables
+member_repo = (
+    SoAMemberRepository if os.environ.get('FINS_MEMBER_STORAGE') == 'soa' else DictMemberRepository
+)(id_generator)
 loan_repo = DictLoanRepository(id_generator)
 
 book_service = BookService(book_repo)
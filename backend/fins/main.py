@@ -1,7 +1,8 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from routers import books, members, loans
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.include_router(books.router)
 app.include_router(members.router)
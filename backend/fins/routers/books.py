@@ -11,13 +11,13 @@ router = APIRouter(prefix='/api/books', tags=['books'])
 async def create_book(
     book: BookCreate,
     service: BookService = Depends(get_book_service)
-) -> BookOut:
+) -> dict:
     """
     Create a new Book resource with validation and ISBN uniqueness enforcement.
     """
     try:
         created = await service.create_book(book)
-        return BookOut(**created)
+        return created
     except ConflictError as e:
         raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
@@ -30,20 +30,19 @@ async def list_books(
     """
     List all Book resources.
     """
-    books = await service.list_books()
-    return [BookOut(**b) for b in books]
+    return await service.list_books()
 
 @router.get('/{book_id}', response_model=BookOut)
 async def get_book(
     book_id: int,
     service: BookService = Depends(get_book_service)
-) -> BookOut:
+) -> dict:
     """
     Retrieve a Book by its ID.
     """
     try:
         book = await service.get_book(book_id)
-        return BookOut(**book)
+        return book
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -52,13 +51,13 @@ async def update_book(
     book_id: int,
     book: BookUpdate,
     service: BookService = Depends(get_book_service)
-) -> BookOut:
+) -> dict:
     """
     Update an existing Book by ID, enforcing validation and uniqueness constraints.
     """
     try:
         updated = await service.update_book(book_id, book)
-        return BookOut(**updated)
+        return updated
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ConflictError as e:
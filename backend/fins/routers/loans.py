@@ -11,13 +11,28 @@ router = APIRouter(prefix='/api/loans', tags=['loans'])
 async def create_loan(
     loan: LoanCreate,
     service: LoanService = Depends(get_loan_service)
-) -> LoanOut:
+) -> dict:
     """
     Create a new loan, ensuring referential integrity and correct status/timestamps.
     """
     try:
         created = await service.create_loan(loan)
-        return LoanOut(**created)
+        return created
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+@router.post('/bulk', response_model=List[LoanOut], status_code=status.HTTP_201_CREATED)
+async def create_loans_bulk(
+    loans: List[LoanCreate],
+    service: LoanService = Depends(get_loan_service)
+) -> List[dict]:
+    """
+    Create several loans in one request; none are created if any is invalid.
+    """
+    try:
+        return await service.create_loans_bulk(loans)
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ValueError as e:
@@ -30,20 +45,19 @@ async def list_loans(
     """
     List all loans.
     """
-    loans = await service.list_loans()
-    return [LoanOut(**l) for l in loans]
+    return await service.list_loans()
 
 @router.get('/{loan_id}', response_model=LoanOut)
 async def get_loan(
     loan_id: int,
     service: LoanService = Depends(get_loan_service)
-) -> LoanOut:
+) -> dict:
     """
     Retrieve a loan by ID.
     """
     try:
         loan = await service.get_loan(loan_id)
-        return LoanOut(**loan)
+        return loan
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -52,13 +66,13 @@ async def update_loan(
     loan_id: int,
     loan: LoanUpdate,
     service: LoanService = Depends(get_loan_service)
-) -> LoanOut:
+) -> dict:
     """
     Update a loan by ID.
     """
     try:
         updated = await service.update_loan(loan_id, loan)
-        return LoanOut(**updated)
+        return updated
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ValueError as e:
@@ -11,13 +11,13 @@ router = APIRouter(prefix='/api/members', tags=['members'])
 async def create_member(
     member: MemberCreate,
     service: MemberService = Depends(get_member_service)
-) -> MemberOut:
+) -> dict:
     """
     Create a new library member.
     """
     try:
         created = await service.create_member(member)
-        return MemberOut(**created)
+        return created
     except ConflictError as e:
         raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
@@ -30,20 +30,19 @@ async def list_members(
     """
     List all members.
     """
-    members = await service.list_members()
-    return [MemberOut(**m) for m in members]
+    return await service.list_members()
 
 @router.get('/{member_id}', response_model=MemberOut)
 async def get_member(
     member_id: int,
     service: MemberService = Depends(get_member_service)
-) -> MemberOut:
+) -> dict:
     """
     Retrieve a member by id.
     """
     try:
         member = await service.get_member(member_id)
-        return MemberOut(**member)
+        return member
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ValueError as e:
@@ -54,13 +53,13 @@ async def update_member(
     member_id: int,
     member: MemberUpdate,
     service: MemberService = Depends(get_member_service)
-) -> MemberOut:
+) -> dict:
     """
     Update all details of an existing member by ID.
     """
     try:
         updated = await service.update_member(member_id, member)
-        return MemberOut(**updated)
+        return updated
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ConflictError as e:
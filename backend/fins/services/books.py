@@ -1,5 +1,5 @@
-from typing import List
-from schemas import BookCreate, BookUpdate
+from typing import List, Optional, Tuple
+from schemas import BookCreate, BookUpdate, BookOut
 from storage import BaseRepository
 from core.errors import NotFoundError, ConflictError
 
@@ -9,17 +9,16 @@ class BookService:
     """
     def __init__(self, repo: BaseRepository):
         self._repo = repo
+        self._list_cache: Optional[Tuple[int, List[BookOut]]] = None
 
     async def create_book(self, book: BookCreate) -> dict:
         """
         Create a new book with validation and ISBN uniqueness enforcement.
         """
         # ISBN uniqueness
-        books = await self._repo.list()
         isbn = book.isbn.strip()
-        for b in books:
-            if b['isbn'].strip() == isbn:
-                raise ConflictError('ISBN already exists')
+        if await self._repo.isbn_exists(isbn):
+            raise ConflictError('ISBN already exists')
         if book.copies_available > book.copies_total:
             raise ValueError('copies_available cannot be greater than copies_total')
         if book.copies_total == 0 and book.copies_available > 0:
@@ -29,11 +28,16 @@ class BookService:
         created = await self._repo.create(obj)
         return created
 
-    async def list_books(self) -> List[dict]:
+    async def list_books(self) -> List[BookOut]:
         """
-        List all books.
+        List all books, reusing the validated list until the repository changes.
         """
-        return await self._repo.list()
+        version = self._repo.version
+        if self._list_cache is not None and self._list_cache[0] == version:
+            return self._list_cache[1]
+        items = [BookOut(**item) for item in await self._repo.list()]
+        self._list_cache = (version, items)
+        return items
 
     async def get_book(self, book_id: int) -> dict:
         """
@@ -45,14 +49,9 @@ class BookService:
         """
         Update an existing book by ID.
         """
-        # Check existence
-        old = await self._repo.get(book_id)
-        # ISBN uniqueness (excluding self)
-        books = await self._repo.list()
+        # Existence and ISBN uniqueness (excluding self) in one repository call
         isbn = book.isbn.strip()
-        for b in books:
-            if b['id'] != book_id and b['isbn'].strip() == isbn:
-                raise ConflictError('ISBN already exists')
+        await self._repo.validate_update(book_id, isbn)
         if book.copies_available > book.copies_total:
             raise ValueError('copies_available cannot be greater than copies_total')
         if book.copies_total == 0 and book.copies_available > 0:
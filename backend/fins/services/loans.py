@@ -1,15 +1,20 @@
-from typing import List, Optional
+import asyncio
+from typing import List, Optional, Tuple
 from datetime import datetime, timezone
-from schemas import LoanCreate, LoanUpdate
+from schemas import LoanCreate, LoanUpdate, LoanOut
 from storage import BaseRepository
 from core.errors import NotFoundError, ConflictError
 
+_UTC = timezone.utc
+_now = datetime.now
+
 class LoanService:
     """
     Service for loan business logic.
     """
     def __init__(self, repo: BaseRepository, book_repo: BaseRepository, member_repo: BaseRepository):
         self._repo = repo
+        self._list_cache: Optional[Tuple[int, List[LoanOut]]] = None
         self._book_repo = book_repo
         self._member_repo = member_repo
 
@@ -17,28 +22,54 @@ class LoanService:
         """
         Create a new loan, ensuring referential integrity and correct status/timestamps.
         """
-        # Check book exists
-        try:
-            await self._book_repo.get(loan.book_id)
-        except NotFoundError:
-            raise NotFoundError(f'Book with id {loan.book_id} not found')
-        # Check member exists
-        try:
-            await self._member_repo.get(loan.member_id)
-        except NotFoundError:
-            raise NotFoundError(f'Member with id {loan.member_id} not found')
-        obj = loan.model_dump()
-        obj['status'] = 'active'
-        obj['loaned_at'] = datetime.now(timezone.utc)
-        obj['returned_at'] = None
+        await self._check_references(loan)
+        obj = {**loan.model_dump(), 'status': 'active', 'loaned_at': _now(_UTC), 'returned_at': None}
         created = await self._repo.create(obj)
         return created
 
-    async def list_loans(self) -> List[dict]:
+    async def create_loans_bulk(self, loans: List[LoanCreate]) -> List[dict]:
+        """
+        Create several loans at once. All are validated before any is stored,
+        and they share a single loaned_at timestamp.
+        """
+        for loan in loans:
+            await self._check_references(loan)
+        now = _now(_UTC)
+        objs = [
+            {**loan.model_dump(), 'status': 'active', 'loaned_at': now, 'returned_at': None}
+            for loan in loans
+        ]
+        return await self._repo.create_many(objs)
+
+    async def _check_references(self, loan: LoanCreate) -> None:
+        """
+        Ensure the loan's book and member exist.
+        """
+        # Check book and member exist concurrently; a missing book is reported first
+        book, member = await asyncio.gather(
+            self._book_repo.get(loan.book_id),
+            self._member_repo.get(loan.member_id),
+            return_exceptions=True,
+        )
+        if isinstance(book, NotFoundError):
+            raise NotFoundError(f'Book with id {loan.book_id} not found')
+        if isinstance(book, BaseException):
+            raise book
+        if isinstance(member, NotFoundError):
+            raise NotFoundError(f'Member with id {loan.member_id} not found')
+        if isinstance(member, BaseException):
+            raise member
+
+    async def list_loans(self) -> List[LoanOut]:
         """
-        List all loans.
+        List all loans, reusing the validated list until the repository changes.
         """
-        return await self._repo.list()
+        version = self._repo.version
+        if self._list_cache is not None and self._list_cache[0] == version:
+            return self._list_cache[1]
+        items = [LoanOut(**item) for item in await self._repo.list()]
+        self._list_cache = (version, items)
+        return items
 
     async def get_loan(self, loan_id: int) -> dict:
         """
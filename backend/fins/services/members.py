@@ -1,5 +1,5 @@
-from typing import List
-from schemas import MemberCreate, MemberUpdate
+from typing import List, Optional, Tuple
+from schemas import MemberCreate, MemberUpdate, MemberOut
 from storage import BaseRepository
 from core.errors import NotFoundError, ConflictError
 
@@ -9,27 +9,31 @@ class MemberService:
     """
     def __init__(self, repo: BaseRepository):
         self._repo = repo
+        self._list_cache: Optional[Tuple[int, List[MemberOut]]] = None
 
     async def create_member(self, member: MemberCreate) -> dict:
         """
         Create a new member with unique, valid email and non-empty full_name.
         """
-        members = await self._repo.list()
         email = member.email.lower()
-        for m in members:
-            if m['email'].lower() == email:
-                raise ConflictError('Email already exists')
+        if await self._repo.email_exists(email):
+            raise ConflictError('Email already exists')
         obj = member.model_dump()
         obj['email'] = email
         obj['active'] = True
         created = await self._repo.create(obj)
         return created
 
-    async def list_members(self) -> List[dict]:
+    async def list_members(self) -> List[MemberOut]:
         """
-        List all members.
+        List all members, reusing the validated list until the repository changes.
         """
-        return await self._repo.list()
+        version = self._repo.version
+        if self._list_cache is not None and self._list_cache[0] == version:
+            return self._list_cache[1]
+        items = [MemberOut(**item) for item in await self._repo.list()]
+        self._list_cache = (version, items)
+        return items
 
     async def get_member(self, member_id: int) -> dict:
         """
@@ -41,12 +45,9 @@ class MemberService:
         """
         Update all details of an existing member by ID.
         """
-        old = await self._repo.get(member_id)
-        members = await self._repo.list()
+        # Existence and email uniqueness (excluding self) in one repository call
         email = member.email.lower()
-        for m in members:
-            if m['id'] != member_id and m['email'].lower() == email:
-                raise ConflictError('Email already exists')
+        await self._repo.validate_update(member_id, email)
         if not member.full_name.strip():
             raise ValueError('full_name must not be empty')
         obj = member.model_dump()
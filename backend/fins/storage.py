@@ -1,7 +1,6 @@
-from typing import TypeVar, Generic, List, Dict, Optional, Protocol, Any
+from typing import TypeVar, Generic, Collection, Dict, List, Optional, Protocol, Any, ValuesView
 from core.errors import NotFoundError, ConflictError
 from core.utils import IDGenerator
-from threading import Lock
 
 T = TypeVar('T')
 ID = TypeVar('ID')
@@ -9,6 +8,11 @@ ID = TypeVar('ID')
 class BaseRepository(Protocol, Generic[T]):
     """
     Repository interface for CRUD operations.
+
+    Implementations are driven from a single event loop and their mutations
+    never await, so each call runs atomically without a lock. create() and
+    update() take ownership of the dict they are given (and set its 'id'),
+    so callers must pass a fresh dict and not reuse it afterwards.
     """
     async def create(self, obj: T) -> T:
         ...
@@ -18,64 +22,38 @@ class BaseRepository(Protocol, Generic[T]):
         ...
     async def delete(self, id: int) -> None:
         ...
-    async def list(self) -> List[T]:
+    async def list(self) -> Collection[T]:
+        """
+        Live read-only view of all records; copy it before awaiting mid-iteration.
+        """
+        ...
+    @property
+    def version(self) -> int:
         ...
-
-class ListBookRepository:
-    """
-    List-based in-memory repository for books.
-    """
-    def __init__(self, id_gen: IDGenerator):
-        self._storage: List[dict] = []
-        self._id_gen = id_gen
-        self._lock = Lock()
-
-    async def create(self, obj: dict) -> dict:
-        with self._lock:
-            obj = obj.copy()
-            obj['id'] = self._id_gen.next_id()
-            self._storage.append(obj)
-        return obj
-
-    async def get(self, id: int) -> dict:
-        for item in self._storage:
-            if item['id'] == id:
-                return item
-        raise NotFoundError(f'Book with id {id} not found')
-
-    async def update(self, id: int, obj: dict) -> dict:
-        for idx, item in enumerate(self._storage):
-            if item['id'] == id:
-                obj = obj.copy()
-                obj['id'] = id
-                self._storage[idx] = obj
-                return obj
-        raise NotFoundError(f'Book with id {id} not found')
-
-    async def delete(self, id: int) -> None:
-        for idx, item in enumerate(self._storage):
-            if item['id'] == id:
-                del self._storage[idx]
-                return
-        raise NotFoundError(f'Book with id {id} not found')
-
-    async def list(self) -> List[dict]:
-        return list(self._storage)
 
 class DictBookRepository:
     """
-    Dict-based in-memory repository for books keyed by id.
+    Dict-based in-memory repository for books keyed by id, with an ISBN index.
     """
     def __init__(self, id_gen: IDGenerator):
         self._storage: Dict[int, dict] = {}
-        self._id_gen = id_gen
-        self._lock = Lock()
+        self._isbn_index: Dict[str, int] = {}
+        self._next_id = id_gen.next_id
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Counter bumped on every mutation; lets callers cache derived views.
+        """
+        return self._version
 
     async def create(self, obj: dict) -> dict:
-        with self._lock:
-            obj = obj.copy()
-            obj['id'] = self._id_gen.next_id()
-            self._storage[obj['id']] = obj
+        nid = self._next_id()
+        obj['id'] = nid
+        self._storage[nid] = obj
+        self._isbn_index[obj['isbn']] = nid
+        self._version += 1
         return obj
 
     async def get(self, id: int) -> dict:
@@ -85,77 +63,70 @@ class DictBookRepository:
             raise NotFoundError(f'Book with id {id} not found')
 
     async def update(self, id: int, obj: dict) -> dict:
-        if id not in self._storage:
+        old = self._storage.get(id)
+        if old is None:
             raise NotFoundError(f'Book with id {id} not found')
-        obj = obj.copy()
         obj['id'] = id
+        self._unindex(old)
         self._storage[id] = obj
+        self._isbn_index[obj['isbn']] = id
+        self._version += 1
         return obj
 
     async def delete(self, id: int) -> None:
-        if id in self._storage:
-            del self._storage[id]
-            return
-        raise NotFoundError(f'Book with id {id} not found')
-
-    async def list(self) -> List[dict]:
-        return list(self._storage.values())
-
-class ListMemberRepository:
-    """
-    List-based in-memory repository for members.
-    """
-    def __init__(self, id_gen: IDGenerator):
-        self._storage: List[dict] = []
-        self._id_gen = id_gen
-        self._lock = Lock()
+        old = self._storage.pop(id, None)
+        if old is None:
+            raise NotFoundError(f'Book with id {id} not found')
+        self._unindex(old)
+        self._version += 1
 
-    async def create(self, obj: dict) -> dict:
-        with self._lock:
-            obj = obj.copy()
-            obj['id'] = self._id_gen.next_id()
-            self._storage.append(obj)
-        return obj
+    async def list(self) -> ValuesView[dict]:
+        return self._storage.values()
 
-    async def get(self, id: int) -> dict:
-        for item in self._storage:
-            if item['id'] == id:
-                return item
-        raise NotFoundError(f'Member with id {id} not found')
+    async def isbn_exists(self, isbn: str, exclude_id: Optional[int] = None) -> bool:
+        existing = self._isbn_index.get(isbn)
+        return existing is not None and existing != exclude_id
 
-    async def update(self, id: int, obj: dict) -> dict:
-        for idx, item in enumerate(self._storage):
-            if item['id'] == id:
-                obj = obj.copy()
-                obj['id'] = id
-                self._storage[idx] = obj
-                return obj
-        raise NotFoundError(f'Member with id {id} not found')
+    async def validate_update(self, id: int, isbn: str) -> None:
+        if id not in self._storage:
+            raise NotFoundError(f'Book with id {id} not found')
+        existing = self._isbn_index.get(isbn)
+        if existing is not None and existing != id:
+            raise ConflictError('ISBN already exists')
 
-    async def delete(self, id: int) -> None:
-        for idx, item in enumerate(self._storage):
-            if item['id'] == id:
-                del self._storage[idx]
-                return
-        raise NotFoundError(f'Member with id {id} not found')
+    def _unindex(self, obj: dict) -> None:
+        if self._isbn_index.get(obj['isbn']) == obj['id']:
+            del self._isbn_index[obj['isbn']]
 
-    async def list(self) -> List[dict]:
-        return list(self._storage)
+class ListBookRepository(DictBookRepository):
+    """
+    In-memory repository for books; same as DictBookRepository.
+    Dicts keep insertion order, so list() order matches the old list backing.
+    """
 
 class DictMemberRepository:
     """
-    Dict-based in-memory repository for members keyed by id.
+    Dict-based in-memory repository for members keyed by id, with an email index.
     """
     def __init__(self, id_gen: IDGenerator):
         self._storage: Dict[int, dict] = {}
-        self._id_gen = id_gen
-        self._lock = Lock()
+        self._email_index: Dict[str, int] = {}
+        self._next_id = id_gen.next_id
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Counter bumped on every mutation; lets callers cache derived views.
+        """
+        return self._version
 
     async def create(self, obj: dict) -> dict:
-        with self._lock:
-            obj = obj.copy()
-            obj['id'] = self._id_gen.next_id()
-            self._storage[obj['id']] = obj
+        nid = self._next_id()
+        obj['id'] = nid
+        self._storage[nid] = obj
+        self._email_index[obj['email'].lower()] = nid
+        self._version += 1
         return obj
 
     async def get(self, id: int) -> dict:
@@ -165,62 +136,141 @@ class DictMemberRepository:
             raise NotFoundError(f'Member with id {id} not found')
 
     async def update(self, id: int, obj: dict) -> dict:
-        if id not in self._storage:
+        old = self._storage.get(id)
+        if old is None:
             raise NotFoundError(f'Member with id {id} not found')
-        obj = obj.copy()
         obj['id'] = id
+        self._unindex(old)
         self._storage[id] = obj
+        self._email_index[obj['email'].lower()] = id
+        self._version += 1
         return obj
 
     async def delete(self, id: int) -> None:
-        if id in self._storage:
-            del self._storage[id]
-            return
-        raise NotFoundError(f'Member with id {id} not found')
+        old = self._storage.pop(id, None)
+        if old is None:
+            raise NotFoundError(f'Member with id {id} not found')
+        self._unindex(old)
+        self._version += 1
 
-    async def list(self) -> List[dict]:
-        return list(self._storage.values())
+    async def list(self) -> ValuesView[dict]:
+        return self._storage.values()
+
+    async def email_exists(self, email: str, exclude_id: Optional[int] = None) -> bool:
+        existing = self._email_index.get(email.lower())
+        return existing is not None and existing != exclude_id
 
-class ListLoanRepository:
+    async def validate_update(self, id: int, email: str) -> None:
+        if id not in self._storage:
+            raise NotFoundError(f'Member with id {id} not found')
+        existing = self._email_index.get(email.lower())
+        if existing is not None and existing != id:
+            raise ConflictError('Email already exists')
+
+    def _unindex(self, obj: dict) -> None:
+        key = obj['email'].lower()
+        if self._email_index.get(key) == obj['id']:
+            del self._email_index[key]
+
+class ListMemberRepository(DictMemberRepository):
     """
-    List-based in-memory repository for loans.
+    In-memory repository for members; same as DictMemberRepository.
+    Dicts keep insertion order, so list() order matches the old list backing.
+    """
+
+class SoAMemberRepository:
+    """
+    Column-oriented in-memory repository for members, for large tables.
+
+    Each field lives in its own list (active flags in a bytearray) with an
+    id->row map, so rows cost a few slots instead of a dict each; records are
+    only materialized as dicts when read. Deletes shift later rows to keep
+    insertion order, so they are O(N).
     """
     def __init__(self, id_gen: IDGenerator):
-        self._storage: List[dict] = []
-        self._id_gen = id_gen
-        self._lock = Lock()
+        self._ids: List[int] = []
+        self._full_names: List[str] = []
+        self._emails: List[str] = []
+        self._active = bytearray()
+        self._id_to_row: Dict[int, int] = {}
+        self._email_index: Dict[str, int] = {}
+        self._next_id = id_gen.next_id
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Counter bumped on every mutation; lets callers cache derived views.
+        """
+        return self._version
 
     async def create(self, obj: dict) -> dict:
-        with self._lock:
-            obj = obj.copy()
-            obj['id'] = self._id_gen.next_id()
-            self._storage.append(obj)
-        return obj
+        nid = self._next_id()
+        self._id_to_row[nid] = len(self._ids)
+        self._ids.append(nid)
+        self._full_names.append(obj['full_name'])
+        self._emails.append(obj['email'])
+        self._active.append(bool(obj['active']))
+        self._email_index[obj['email'].lower()] = nid
+        self._version += 1
+        return self._row(self._id_to_row[nid])
 
     async def get(self, id: int) -> dict:
-        for item in self._storage:
-            if item['id'] == id:
-                return item
-        raise NotFoundError(f'Loan with id {id} not found')
+        try:
+            return self._row(self._id_to_row[id])
+        except KeyError:
+            raise NotFoundError(f'Member with id {id} not found')
 
     async def update(self, id: int, obj: dict) -> dict:
-        for idx, item in enumerate(self._storage):
-            if item['id'] == id:
-                obj = obj.copy()
-                obj['id'] = id
-                self._storage[idx] = obj
-                return obj
-        raise NotFoundError(f'Loan with id {id} not found')
+        row = self._id_to_row.get(id)
+        if row is None:
+            raise NotFoundError(f'Member with id {id} not found')
+        key = self._emails[row].lower()
+        if self._email_index.get(key) == id:
+            del self._email_index[key]
+        self._full_names[row] = obj['full_name']
+        self._emails[row] = obj['email']
+        self._active[row] = bool(obj['active'])
+        self._email_index[obj['email'].lower()] = id
+        self._version += 1
+        return self._row(row)
 
     async def delete(self, id: int) -> None:
-        for idx, item in enumerate(self._storage):
-            if item['id'] == id:
-                del self._storage[idx]
-                return
-        raise NotFoundError(f'Loan with id {id} not found')
+        row = self._id_to_row.pop(id, None)
+        if row is None:
+            raise NotFoundError(f'Member with id {id} not found')
+        key = self._emails[row].lower()
+        if self._email_index.get(key) == id:
+            del self._email_index[key]
+        del self._ids[row], self._full_names[row], self._emails[row], self._active[row]
+        for shifted in range(row, len(self._ids)):
+            self._id_to_row[self._ids[shifted]] = shifted
+        self._version += 1
 
     async def list(self) -> List[dict]:
-        return list(self._storage)
+        return [
+            {'id': id, 'full_name': full_name, 'email': email, 'active': bool(active)}
+            for id, full_name, email, active in zip(self._ids, self._full_names, self._emails, self._active)
+        ]
+
+    async def email_exists(self, email: str, exclude_id: Optional[int] = None) -> bool:
+        existing = self._email_index.get(email.lower())
+        return existing is not None and existing != exclude_id
+
+    async def validate_update(self, id: int, email: str) -> None:
+        if id not in self._id_to_row:
+            raise NotFoundError(f'Member with id {id} not found')
+        existing = self._email_index.get(email.lower())
+        if existing is not None and existing != id:
+            raise ConflictError('Email already exists')
+
+    def _row(self, row: int) -> dict:
+        return {
+            'id': self._ids[row],
+            'full_name': self._full_names[row],
+            'email': self._emails[row],
+            'active': bool(self._active[row]),
+        }
 
 class DictLoanRepository:
     """
@@ -228,16 +278,34 @@ class DictLoanRepository:
     """
     def __init__(self, id_gen: IDGenerator):
         self._storage: Dict[int, dict] = {}
-        self._id_gen = id_gen
-        self._lock = Lock()
+        self._next_id = id_gen.next_id
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Counter bumped on every mutation; lets callers cache derived views.
+        """
+        return self._version
 
     async def create(self, obj: dict) -> dict:
-        with self._lock:
-            obj = obj.copy()
-            obj['id'] = self._id_gen.next_id()
-            self._storage[obj['id']] = obj
+        nid = self._next_id()
+        obj['id'] = nid
+        self._storage[nid] = obj
+        self._version += 1
         return obj
 
+    async def create_many(self, objs: List[dict]) -> List[dict]:
+        next_id = self._next_id
+        storage = self._storage
+        for obj in objs:
+            nid = next_id()
+            obj['id'] = nid
+            storage[nid] = obj
+        if objs:
+            self._version += 1
+        return objs
+
     async def get(self, id: int) -> dict:
         try:
             return self._storage[id]
@@ -247,16 +315,21 @@ class DictLoanRepository:
     async def update(self, id: int, obj: dict) -> dict:
         if id not in self._storage:
             raise NotFoundError(f'Loan with id {id} not found')
-        obj = obj.copy()
         obj['id'] = id
         self._storage[id] = obj
+        self._version += 1
         return obj
 
     async def delete(self, id: int) -> None:
-        if id in self._storage:
-            del self._storage[id]
-            return
-        raise NotFoundError(f'Loan with id {id} not found')
+        if self._storage.pop(id, None) is None:
+            raise NotFoundError(f'Loan with id {id} not found')
+        self._version += 1
 
-    async def list(self) -> List[dict]:
-        return list(self._storage.values())
+    async def list(self) -> ValuesView[dict]:
+        return self._storage.values()
+
+class ListLoanRepository(DictLoanRepository):
+    """
+    In-memory repository for loans; same as DictLoanRepository.
+    Dicts keep insertion order, so list() order matches the old list backing.
+    """
@@ -0,0 +1,51 @@
+import pytest
+from core.errors import ConflictError, NotFoundError
+from core.utils import IDGenerator
+from storage import DictMemberRepository, SoAMemberRepository
+
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture(params=[DictMemberRepository, SoAMemberRepository])
+def member_repo(request):
+    return request.param(IDGenerator())
+
+async def test_member_repository_crud(member_repo):
+    john = await member_repo.create({'full_name': 'John Doe', 'email': 'john@example.com', 'active': True})
+    jane = await member_repo.create({'full_name': 'Jane', 'email': 'jane@example.com', 'active': True})
+    assert await member_repo.get(john['id']) == john
+    assert [m['id'] for m in await member_repo.list()] == [john['id'], jane['id']]
+    # Update
+    version = member_repo.version
+    updated = await member_repo.update(
+        john['id'], {'full_name': 'John D', 'email': 'john2@example.com', 'active': False}
+    )
+    assert updated == {'id': john['id'], 'full_name': 'John D', 'email': 'john2@example.com', 'active': False}
+    assert member_repo.version > version
+    # Update to duplicate email
+    with pytest.raises(ConflictError):
+        await member_repo.validate_update(jane['id'], 'john2@example.com')
+    await member_repo.validate_update(john['id'], 'john2@example.com')
+    # Delete keeps the remaining rows readable and in order
+    await member_repo.delete(john['id'])
+    assert await member_repo.get(jane['id']) == jane
+    assert [m['id'] for m in await member_repo.list()] == [jane['id']]
+    with pytest.raises(NotFoundError):
+        await member_repo.get(john['id'])
+    with pytest.raises(NotFoundError):
+        await member_repo.delete(john['id'])
+    with pytest.raises(NotFoundError):
+        await member_repo.update(john['id'], {'full_name': 'X', 'email': 'x@example.com', 'active': True})
+    with pytest.raises(NotFoundError):
+        await member_repo.validate_update(john['id'], 'x@example.com')
+
+async def test_member_repository_email_index(member_repo):
+    member = await member_repo.create({'full_name': 'Index', 'email': 'index1@example.com', 'active': True})
+    assert await member_repo.email_exists('INDEX1@example.com')
+    assert not await member_repo.email_exists('index1@example.com', exclude_id=member['id'])
+    # Changing the email frees the old one
+    await member_repo.update(member['id'], {'full_name': 'Index', 'email': 'index2@example.com', 'active': True})
+    assert not await member_repo.email_exists('index1@example.com')
+    assert await member_repo.email_exists('index2@example.com')
+    # Deleting frees the current one
+    await member_repo.delete(member['id'])
+    assert not await member_repo.email_exists('index2@example.com')
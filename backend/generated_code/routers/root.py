@@ -7,6 +7,10 @@ from starlette.responses import PlainTextResponse
 
 router = APIRouter()
 
+# Encoded once; each request still gets its own response, since middleware
+# such as CORSMiddleware edits a response's raw_headers list in place
+_ROOT_BODY = b"helo world"
+
 @router.get(
     "/",
     response_class=PlainTextResponse,
@@ -18,4 +22,4 @@ async def read_root() -> PlainTextResponse:
     """
     Returns the plain text string 'helo world'.
     """
-    return PlainTextResponse(content="helo world", status_code=status.HTTP_200_OK)
+    return PlainTextResponse(content=_ROOT_BODY, status_code=status.HTTP_200_OK)
@@ -6,23 +6,37 @@ Usage:
     python run_workflow.py "Build a TODO API with user authentication"
     python run_workflow.py --auto-approve "Build a simple REST API"
     python run_workflow.py --interactive "Build a blog API"
+    python run_workflow.py --resume "Build a blog API"
 """
 import argparse
 import asyncio
+import hashlib
 import json
+import logging
 import sys
+import threading
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Sequence
+
+try:
+    import orjson  # Faster pretty-printing of large items in the view command
+except ImportError:
+    orjson = None
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app.agents.graph import WorkflowRunner
-from app.agents.state import WorkflowStage
-from app.core.logging import setup_logging, get_logger
+# App modules pull in LangGraph, the LLM SDKs and (via app.core) FastAPI; they
+# are imported where needed so --help and argument errors return immediately
+if TYPE_CHECKING:
+    from app.agents.graph import WorkflowRunner
+
+# Same logger app.core.logging.get_logger("cli") returns, without importing app.core
+logger = logging.getLogger("product_to_code.cli")
 
-# Setup logging
-setup_logging("DEBUG")
-logger = get_logger("cli")
+# State key holding the items for each approval type
+_PLURAL_MAP = {"epic": "epics", "story": "stories", "spec": "specs"}
 
 
 def print_banner():
@@ -32,8 +46,33 @@ def print_banner():
     print("=" * 70 + "\n")
 
 
+# Lines last printed for each summary section, so later summaries show only changes
+_last_printed: dict[str, list[str]] = {}
+
+
+def _print_section(name: str, title: str, lines: list[str]):
+    """Print a summary section, marking lines added [+] or changed [~] since last time."""
+    previous = _last_printed.get(name)
+    _last_printed[name] = lines
+    if previous == lines:
+        print(f"\n{title}: unchanged")
+        return
+    print(f"\n{title}:")
+    if previous is None:
+        for line in lines:
+            print(f"  {line}")
+        return
+    for i, line in enumerate(lines):
+        if i >= len(previous):
+            print(f"  [+] {line}")
+        elif previous[i] != line:
+            print(f"  [~] {line}")
+    if len(previous) > len(lines):
+        print(f"  [-] {len(previous) - len(lines)} removed")
+
+
 def print_state_summary(state: dict):
-    """Print a summary of the current state."""
+    """Print a summary of the current state, showing only what changed since the last one."""
     print("\n" + "-" * 50)
     print("CURRENT STATE SUMMARY")
     print("-" * 50)
@@ -46,68 +85,117 @@ def print_state_summary(state: dict):
         print(f"\nResearch: {len(artifact.get('urls', []))} URLs found")
 
     if state.get("epics"):
-        print(f"\nEpics ({len(state['epics'])}):")
-        for i, epic in enumerate(state["epics"]):
-            status = epic.get("status", "unknown")
-            print(f"  [{i}] {status}: {epic.get('title', 'Untitled')}")
+        _print_section("epics", f"Epics ({len(state['epics'])})", [
+            f"[{i}] {epic.get('status', 'unknown')}: {epic.get('title', 'Untitled')}"
+            for i, epic in enumerate(state["epics"])
+        ])
 
     if state.get("stories"):
-        print(f"\nStories ({len(state['stories'])}):")
-        for i, story in enumerate(state["stories"]):
-            status = story.get("status", "unknown")
-            print(f"  [{i}] {status}: {story.get('title', 'Untitled')}")
+        _print_section("stories", f"Stories ({len(state['stories'])})", [
+            f"[{i}] {story.get('status', 'unknown')}: {story.get('title', 'Untitled')}"
+            for i, story in enumerate(state["stories"])
+        ])
 
     if state.get("specs"):
-        print(f"\nSpecs ({len(state['specs'])}):")
-        for i, spec in enumerate(state["specs"]):
-            status = spec.get("status", "unknown")
-            print(f"  [{i}] {status}: Spec for story {spec.get('story_index', '?')}")
+        _print_section("specs", f"Specs ({len(state['specs'])})", [
+            f"[{i}] {spec.get('status', 'unknown')}: Spec for story {spec.get('story_index', '?')}"
+            for i, spec in enumerate(state["specs"])
+        ])
 
     if state.get("code_artifacts"):
-        print(f"\nCode Artifacts ({len(state['code_artifacts'])}):")
+        lines = []
         for artifact in state["code_artifacts"]:
             files = artifact.get("files", {})
             status = artifact.get("status", "unknown")
-            print(f"  Status: {status}, Files: {len(files)}")
+            lines.append(f"Status: {status}, Files: {len(files)}")
             for filename in list(files.keys())[:5]:
-                print(f"    - {filename}")
+                lines.append(f"  - {filename}")
             if len(files) > 5:
-                print(f"    ... and {len(files) - 5} more files")
+                lines.append(f"  ... and {len(files) - 5} more files")
+        _print_section("code_artifacts", f"Code Artifacts ({len(state['code_artifacts'])})", lines)
 
     if state.get("validation_errors"):
-        print(f"\nValidation Errors ({len(state['validation_errors'])}):")
-        for error in state["validation_errors"][:5]:
-            print(f"  - {error}")
+        _print_section(
+            "validation_errors",
+            f"Validation Errors ({len(state['validation_errors'])})",
+            [f"- {error}" for error in state["validation_errors"][:5]],
+        )
 
     print("-" * 50 + "\n")
 
 
-def prompt_for_approval(approval_type: str, items: list) -> tuple[list[int], bool, str]:
-    """Prompt user for approval decision."""
-    print(f"\n{'='*50}")
-    print(f"APPROVAL REQUIRED: {approval_type.upper()}S")
-    print("=" * 50)
+# Deletes spaces and tabs from index lists like "0, 1,\t2" in a single pass
+_STRIP_WS = str.maketrans("", "", " \t")
+
+_APPROVAL_OPTIONS = "\n".join([
+    "\n" + "-" * 50,
+    "Options:",
+    "  a/all    - Approve all",
+    "  0,1,2    - Approve specific items by index",
+    "  r/reject - Reject all (with feedback)",
+    "  v/view N - View item N in detail",
+    "  q/quit   - Quit workflow",
+    "-" * 50,
+])
+
+_PAGE_OPTIONS = "  n/p      - Next/previous page"
+
 
-    for i, item in enumerate(items):
-        print(f"\n[{i}] {item.get('title', f'{approval_type.title()} {i}')}")
+def _format_details(item) -> str:
+    """Pretty-print an item for the view command, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            item, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+        ).decode()
+    return json.dumps(item, indent=2, default=str)
+
+
+def _render_items(approval_type: str, items: Sequence, offset: int, page_size: Optional[int]) -> list[str]:
+    """Render the items on one page; page_size None renders them all."""
+    stop = None if page_size is None else offset + page_size
+    lines = []
+    for i, item in islice(enumerate(items), offset, stop):
+        lines.append(f"\n[{i}] {item.get('title', f'{approval_type.title()} {i}')}")
         if approval_type == "epic":
-            print(f"    Goal: {item.get('goal', 'N/A')[:100]}")
-            print(f"    Scope: {item.get('scope', 'N/A')[:100]}")
+            lines.append(f"    Goal: {item.get('goal', 'N/A')[:100]}")
+            lines.append(f"    Scope: {item.get('scope', 'N/A')[:100]}")
         elif approval_type == "story":
-            print(f"    Description: {item.get('description', 'N/A')[:100]}")
-            print(f"    Points: {item.get('story_points', 'N/A')}")
+            lines.append(f"    Description: {item.get('description', 'N/A')[:100]}")
+            lines.append(f"    Points: {item.get('story_points', 'N/A')}")
         elif approval_type == "spec":
             content = item.get("content", "N/A")[:200]
-            print(f"    Content: {content}...")
-
-    print("\n" + "-" * 50)
-    print("Options:")
-    print("  a/all    - Approve all")
-    print("  0,1,2    - Approve specific items by index")
-    print("  r/reject - Reject all (with feedback)")
-    print("  v/view N - View item N in detail")
-    print("  q/quit   - Quit workflow")
-    print("-" * 50)
+            lines.append(f"    Content: {content}...")
+    return lines
+
+
+def prompt_for_approval(
+    approval_type: str,
+    items: Sequence,
+    page_size: Optional[int] = None,
+) -> Optional[tuple[list[int], bool, str]]:
+    """Prompt user for approval decision; returns None if the user quits.
+
+    With a page_size only that many items are rendered at a time, and
+    n/p move between pages. Blocks on stdin, so async callers run it
+    through _prompt.
+    """
+    n = len(items)
+    paged = page_size is not None and n > page_size
+    offset = 0
+
+    def show_page():
+        # Build the visible listing and write it once instead of one print per line
+        header = f"APPROVAL REQUIRED: {approval_type.upper()}S"
+        if paged:
+            header += f" ({offset}-{min(offset + page_size, n) - 1} of {n})"
+        lines = [f"\n{'='*50}", header, "=" * 50]
+        lines.extend(_render_items(approval_type, items, offset, page_size if paged else None))
+        lines.append(_APPROVAL_OPTIONS)
+        if paged:
+            lines.append(_PAGE_OPTIONS)
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    show_page()
 
     while True:
         choice = input("\nYour choice: ").strip().lower()
@@ -119,38 +207,102 @@ def prompt_for_approval(approval_type: str, items: list) -> tuple[list[int], boo
             feedback = input("Feedback for rejection: ").strip()
             return list(range(len(items))), False, feedback
 
+        if paged and choice in ["n", "next", "p", "prev"]:
+            step = page_size if choice[0] == "n" else -page_size
+            if 0 <= offset + step < n:
+                offset += step
+                show_page()
+            else:
+                print("No more pages")
+            continue
+
         if choice in ["q", "quit"]:
-            print("Exiting workflow...")
-            sys.exit(0)
+            # Exit from the awaiting coroutine, not from the prompt thread
+            return None
 
         if choice.startswith("v ") or choice.startswith("view "):
             try:
                 idx = int(choice.split()[1])
                 if 0 <= idx < len(items):
-                    print(f"\n--- {approval_type.upper()} {idx} DETAILS ---")
-                    print(json.dumps(items[idx], indent=2, default=str))
-                    print("--- END DETAILS ---\n")
+                    sys.stdout.write(
+                        f"\n--- {approval_type.upper()} {idx} DETAILS ---\n"
+                        f"{_format_details(items[idx])}\n"
+                        "--- END DETAILS ---\n\n"
+                    )
             except (ValueError, IndexError):
                 print("Invalid index")
             continue
 
         try:
-            indices = [int(x.strip()) for x in choice.split(",")]
-            if all(0 <= i < len(items) for i in indices):
+            indices = list(map(int, choice.translate(_STRIP_WS).split(",")))
+            if all(0 <= i < n for i in indices):
                 return indices, True, ""
             print("Some indices are out of range")
         except ValueError:
             print("Invalid input. Use 'a' for all, numbers like '0,1,2', or 'r' to reject")
 
 
-async def run_workflow_interactive(product_request: str, constraints: str = None):
-    """Run workflow with interactive approvals."""
-    runner = WorkflowRunner()
-    run_id = 1  # Simple run ID for CLI
+# Per-request snapshot logs: one JSON line per turn holding only the changed keys
+_CACHE_DIR = Path(".workflow_cache")
+
+
+def _snapshot_path(product_request: str, constraints: Optional[str]) -> Path:
+    """Snapshot log for a request, keyed on a fingerprint of request and constraints."""
+    key = hashlib.sha256(f"{product_request}\0{constraints or ''}".encode()).hexdigest()[:16]
+    return _CACHE_DIR / f"run_{key}.jsonl"
+
+
+def _append_delta(path: Path, prev_state: dict, state: dict) -> dict:
+    """Append the keys that changed since prev_state; returns state as the new baseline."""
+    delta = {k: v for k, v in state.items() if prev_state.get(k) != v}
+    if delta:
+        if orjson is not None:
+            line = orjson.dumps(delta, option=orjson.OPT_NON_STR_KEYS, default=str)
+        else:
+            line = json.dumps(delta, default=str).encode()
+        with path.open("ab") as f:
+            f.write(line + b"\n")
+    return dict(state)
+
+
+def _load_snapshot(path: Path) -> dict:
+    """Replay a snapshot log into the last saved state (empty if there is none).
+
+    A line cut short by an interrupted write ends the replay; the turns
+    before it are kept.
+    """
+    state: dict = {}
+    if path.exists():
+        loads = orjson.loads if orjson is not None else json.loads
+        with path.open("rb") as f:
+            for line in f:
+                try:
+                    state.update(loads(line))
+                except ValueError:
+                    logger.warning(f"Ignoring unreadable snapshot line in {path}")
+                    break
+    return state
 
-    logger.info(f"Starting workflow for: {product_request[:50]}...")
 
-    # Start workflow
+async def _start_or_resume(
+    runner: "WorkflowRunner",
+    run_id: int,
+    product_request: str,
+    constraints: Optional[str],
+    resume: bool,
+) -> tuple[dict, Path]:
+    """Restore the saved state when resuming at an approval gate, else start afresh."""
+    path = _snapshot_path(product_request, constraints)
+    if resume:
+        state = _load_snapshot(path)
+        if state.get("awaiting_approval"):
+            logger.info(f"Resuming from {path} at {state.get('approval_type')} review")
+            await runner.restore_state(run_id, state)
+            return state, path
+        logger.info(f"No paused snapshot at {path}, starting a new run")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
     state = await runner.start_workflow(
         run_id=run_id,
         project_id=1,
@@ -158,21 +310,99 @@ async def run_workflow_interactive(product_request: str, constraints: str = None
         product_request=product_request,
         constraints=constraints,
     )
+    _append_delta(path, {}, state)
+    return state, path
+
+
+async def _prompt(func, *args):
+    """Run a blocking stdin prompt on a daemon thread and await its result.
+
+    The default executor is joined when asyncio.Runner closes and again at
+    interpreter exit, so a worker stuck in input() would keep Ctrl+C from
+    exiting. A daemon thread is never joined.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(outcome, is_error):
+        if future.done():
+            return
+        if is_error:
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+
+    def target():
+        try:
+            outcome, is_error = func(*args), False
+        except BaseException as e:  # noqa: BLE001 - re-raised by the awaiting coroutine
+            outcome, is_error = e, True
+        try:
+            loop.call_soon_threadsafe(settle, outcome, is_error)
+        except RuntimeError:
+            pass  # The loop closed while the prompt was open
+
+    threading.Thread(target=target, name="cli-prompt", daemon=True).start()
+    return await future
+
+
+async def save_files(output_dir: Path, files: dict, max_concurrency: int = 16):
+    """Write generated files on worker threads, at most max_concurrency at once."""
+    paths = {filename: output_dir / filename for filename in files}
+    for directory in {output_dir} | {path.parent for path in paths.values()}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def write(path: Path, content: str):
+        async with semaphore:
+            await asyncio.to_thread(path.write_text, content)
+
+    await asyncio.gather(*(write(paths[name], content) for name, content in files.items()))
+
+
+async def run_workflow_interactive(
+    product_request: str,
+    constraints: str = None,
+    runner: Optional["WorkflowRunner"] = None,
+    quiet: bool = False,
+    resume: bool = False,
+    page_size: Optional[int] = None,
+):
+    """Run workflow with interactive approvals."""
+    from app.agents.graph import get_workflow_runner
+    from app.agents.state import WorkflowStage
+
+    runner = runner or get_workflow_runner()
+    run_id = 1  # Simple run ID for CLI
+
+    logger.info(f"Starting workflow for: {product_request[:50]}...")
+
+    # Start workflow, or pick up at the approval gate a previous run stopped at
+    state, snapshot = await _start_or_resume(
+        runner, run_id, product_request, constraints, resume
+    )
+    prev_state = dict(state)
 
-    print_state_summary(state)
+    if not quiet:
+        print_state_summary(state)
 
     # Loop until workflow completes or fails
     while state.get("awaiting_approval"):
         approval_type = state.get("approval_type")
-        items_key = f"{approval_type}s"
+        items_key = _PLURAL_MAP[approval_type]
         items = state.get(items_key, [])
 
         if not items:
             logger.error(f"No {approval_type}s found for approval")
             break
 
-        # Get user decision
-        item_ids, approved, feedback = prompt_for_approval(approval_type, items)
+        # Get user decision on a prompt thread so the event loop keeps running
+        decision = await _prompt(prompt_for_approval, approval_type, items, page_size)
+        if decision is None:
+            print("Exiting workflow...")
+            sys.exit(0)
+        item_ids, approved, feedback = decision
 
         # Apply approval
         state = await runner.approve_items(
@@ -182,8 +412,10 @@ async def run_workflow_interactive(product_request: str, constraints: str = None
             approved=approved,
             feedback=feedback,
         )
+        prev_state = _append_delta(snapshot, prev_state, state)
 
-        print_state_summary(state)
+        if not quiet:
+            print_state_summary(state)
 
     # Final summary
     current_stage = state.get("current_stage")
@@ -201,14 +433,11 @@ async def run_workflow_interactive(product_request: str, constraints: str = None
                 print(f"  - {filename}")
 
             # Option to save files
-            save = input("\nSave generated code to disk? (y/n): ").strip().lower()
+            save = await _prompt(input, "\nSave generated code to disk? (y/n): ")
+            save = save.strip().lower()
             if save == "y":
                 output_dir = Path("generated_code")
-                output_dir.mkdir(exist_ok=True)
-                for filename, content in files.items():
-                    file_path = output_dir / filename
-                    file_path.parent.mkdir(parents=True, exist_ok=True)
-                    file_path.write_text(content)
+                await save_files(output_dir, files)
                 print(f"Code saved to: {output_dir.absolute()}")
 
     elif current_stage == WorkflowStage.FAILED:
@@ -220,28 +449,34 @@ async def run_workflow_interactive(product_request: str, constraints: str = None
     return state
 
 
-async def run_workflow_auto_approve(product_request: str, constraints: str = None):
+async def run_workflow_auto_approve(
+    product_request: str,
+    constraints: str = None,
+    runner: Optional["WorkflowRunner"] = None,
+    quiet: bool = False,
+    resume: bool = False,
+):
     """Run workflow with automatic approvals (for testing)."""
-    runner = WorkflowRunner()
+    from app.agents.graph import get_workflow_runner
+
+    runner = runner or get_workflow_runner()
     run_id = 1
 
     logger.info(f"Starting workflow (auto-approve mode): {product_request[:50]}...")
 
-    # Start workflow
-    state = await runner.start_workflow(
-        run_id=run_id,
-        project_id=1,
-        user_id=1,
-        product_request=product_request,
-        constraints=constraints,
+    # Start workflow, or pick up at the approval gate a previous run stopped at
+    state, snapshot = await _start_or_resume(
+        runner, run_id, product_request, constraints, resume
     )
+    prev_state = dict(state)
 
-    print_state_summary(state)
+    if not quiet:
+        print_state_summary(state)
 
     # Auto-approve everything
     while state.get("awaiting_approval"):
         approval_type = state.get("approval_type")
-        items_key = f"{approval_type}s"
+        items_key = _PLURAL_MAP[approval_type]
         items = state.get(items_key, [])
 
         if not items:
@@ -256,12 +491,25 @@ async def run_workflow_auto_approve(product_request: str, constraints: str = Non
             approved=True,
             feedback=None,
         )
+        prev_state = _append_delta(snapshot, prev_state, state)
 
-        print_state_summary(state)
+        if not quiet:
+            print_state_summary(state)
 
     return state
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -284,6 +532,22 @@ def main():
         action="store_true",
         help="Automatically approve all items (for testing)",
     )
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Skip state summaries (default when output is not a terminal)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the last approval gate saved for this request",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=_positive_int,
+        help="Show at most this many items per approval page (interactive mode)",
+    )
     parser.add_argument(
         "--output",
         "-o",
@@ -300,14 +564,31 @@ def main():
     print(f"Mode: {'Auto-approve' if args.auto_approve else 'Interactive'}")
     print()
 
+    from app.agents.graph import get_workflow_runner
+    from app.core.logging import setup_logging
+
+    setup_logging("DEBUG")
+
+    # Built outside the coroutine so its compiled graph and clients can be
+    # handed to any further runs on the same loop
+    runner = get_workflow_runner()
+    workflow = run_workflow_auto_approve if args.auto_approve else run_workflow_interactive
+    options = {} if args.auto_approve else {"page_size": args.page_size}
+
     try:
-        if args.auto_approve:
-            state = asyncio.run(
-                run_workflow_auto_approve(args.product_request, args.constraints)
-            )
-        else:
-            state = asyncio.run(
-                run_workflow_interactive(args.product_request, args.constraints)
+        # Closing the runner joins the default executor, even on Ctrl+C, so
+        # only short jobs (file writes) may use it; stdin prompts go through
+        # _prompt's daemon thread or an interrupt would wait for Enter
+        with asyncio.Runner() as loop_runner:
+            state = loop_runner.run(
+                workflow(
+                    args.product_request,
+                    args.constraints,
+                    runner=runner,
+                    quiet=args.quiet or not sys.stdout.isatty(),
+                    resume=args.resume,
+                    **options,
+                )
             )
     except KeyboardInterrupt:
         print("\n\nWorkflow interrupted by user")
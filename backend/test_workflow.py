@@ -142,9 +142,9 @@ async def test_full_workflow_start():
     print("TEST: Full Workflow Start (with HITL pause)")
     print("=" * 60)
 
-    from app.agents.graph import WorkflowRunner
+    from app.agents.graph import get_workflow_runner
 
-    runner = WorkflowRunner()
+    runner = get_workflow_runner()
 
     print("Starting workflow...")
     print("(Workflow will pause at epic review for approval)\n")
@@ -245,8 +245,19 @@ async def main():
     print(f"Test mode: {test_mode}")
     print("(Options: all, research, epic, workflow)")
 
-    if test_mode in ["all", "research"]:
-        research_result = await test_research_node()
+    # The research probe and the full workflow start are independent and both
+    # network-bound, so run them concurrently; their output may interleave
+    research_task = (
+        asyncio.create_task(test_research_node())
+        if test_mode in ["all", "research"] else None
+    )
+    workflow_task = (
+        asyncio.create_task(test_full_workflow_start())
+        if test_mode in ["all", "workflow"] else None
+    )
+
+    if research_task:
+        research_result = await research_task
         if not research_result and test_mode != "all":
             sys.exit(1)
     else:
@@ -258,8 +269,8 @@ async def main():
         else:
             print("\nSkipping epic test - need research results first")
 
-    if test_mode in ["all", "workflow"]:
-        runner, state = await test_full_workflow_start()
+    if workflow_task:
+        runner, state = await workflow_task
         if runner and state and state.get("awaiting_approval"):
             await test_workflow_resume(runner, state)
 
@@ -0,0 +1,5 @@
+"""Shared test configuration."""
+from app.core.security import pwd_context
+
+# bcrypt's production cost is deliberately slow; the tests only need valid hashes
+pwd_context.update(bcrypt__rounds=4)
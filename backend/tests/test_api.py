@@ -1,44 +1,113 @@
 """API tests."""
+import asyncio
+
 import pytest
-from httpx import AsyncClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from app.core.sse import sse_manager
 from app.database import Base, get_db
 from app.main import app
-
-# Test database URL (SQLite for testing)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
-
-engine = create_async_engine(TEST_DATABASE_URL, echo=True)
-TestingSessionLocal = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
+from app.models.code_artifact import CodeArtifact, CodeArtifactStatus
+from app.models.epic import Epic, EpicStatus
+from app.models.project import Project
+from app.models.run import Run, RunStatus
+from app.models.spec import Spec, SpecStatus
+from app.models.story import Story, StoryStatus
+from app.models.user import User
+from app.services.workflow_service import WorkflowService
+
+# Every test shares the session-scoped event loop the schema and engine live on
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Test database URL (in-memory SQLite, one shared connection for the whole run)
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+engine = create_async_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
 )
 
 
-async def override_get_db():
-    """Override database dependency for testing."""
-    async with TestingSessionLocal() as session:
-        yield session
+# pysqlite defers BEGIN on its own, which breaks SAVEPOINTs; emit it ourselves
+@event.listens_for(engine.sync_engine, "connect")
+def _disable_pysqlite_begin(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
 
 
-app.dependency_overrides[get_db] = override_get_db
+@event.listens_for(engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 
-@pytest.fixture(autouse=True)
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
 async def setup_database():
-    """Set up test database."""
+    """Create the schema once for the whole test session."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def authed_client(setup_database):
+    """Client carrying a bearer token for a user registered once per session.
+
+    The user is committed outside the per-test transactions, so it survives
+    the rollbacks while each test's own rows are still discarded.
+    """
+    async def committing_get_db():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+            await session.commit()
+
+    credentials = {"email": "perf@example.com", "password": "testpassword123"}
+    app.dependency_overrides[get_db] = committing_get_db
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        try:
+            await ac.post("/api/v1/auth/register", json=credentials)
+            login_response = await ac.post("/api/v1/auth/login", json=credentials)
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+        ac.headers["Authorization"] = f"Bearer {login_response.json()['access_token']}"
+        yield ac
+
+
+@pytest_asyncio.fixture(loop_scope="session", autouse=True)
+async def db_session():
+    """Run each test in a transaction that is rolled back afterwards.
 
+    The session joins the outer transaction through a SAVEPOINT, so commits
+    made by the app only release the savepoint and never reach the database.
+    """
+    async with engine.connect() as conn:
+        await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
 
-@pytest.fixture
+        async def override_get_db():
+            yield session
+
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            yield session
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+            await session.close()
+            await conn.rollback()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
 async def client():
     """Create test client."""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
 
 
@@ -147,34 +216,14 @@ async def test_protected_endpoint_without_token(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_create_project(client: AsyncClient):
+async def test_create_project(authed_client: AsyncClient):
     """Test project creation."""
-    # Register and login
-    await client.post(
-        "/api/v1/auth/register",
-        json={
-            "email": "test@example.com",
-            "password": "testpassword123",
-        },
-    )
-
-    login_response = await client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "test@example.com",
-            "password": "testpassword123",
-        },
-    )
-    token = login_response.json()["access_token"]
-
-    # Create project
-    response = await client.post(
+    response = await authed_client.post(
         "/api/v1/projects",
         json={
             "name": "Test Project",
             "product_request": "Build a simple TODO API with CRUD operations",
         },
-        headers={"Authorization": f"Bearer {token}"},
     )
     assert response.status_code == 201
     data = response.json()
@@ -183,42 +232,335 @@ async def test_create_project(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_list_projects(client: AsyncClient):
+async def test_list_projects(authed_client: AsyncClient):
     """Test listing projects."""
-    # Register and login
-    await client.post(
-        "/api/v1/auth/register",
+    # Create a project
+    await authed_client.post(
+        "/api/v1/projects",
         json={
-            "email": "test@example.com",
-            "password": "testpassword123",
+            "name": "Test Project",
+            "product_request": "Build a simple TODO API",
         },
     )
 
-    login_response = await client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "test@example.com",
-            "password": "testpassword123",
-        },
-    )
-    token = login_response.json()["access_token"]
+    # List projects
+    response = await authed_client.get("/api/v1/projects")
+    assert response.status_code == 200
+    data = response.json()
+    assert "items" in data
+    assert len(data["items"]) == 1
 
-    # Create a project
-    await client.post(
+
+@pytest.mark.asyncio
+async def test_bulk_approve_epics(authed_client: AsyncClient, db_session: AsyncSession):
+    """Test approving several epics in one request."""
+    response = await authed_client.post(
         "/api/v1/projects",
         json={
             "name": "Test Project",
             "product_request": "Build a simple TODO API",
         },
-        headers={"Authorization": f"Bearer {token}"},
     )
+    project_id = response.json()["id"]
+    run = Run(project_id=project_id)
+    db_session.add(run)
+    await db_session.flush()
+    epics = [
+        Epic(
+            project_id=project_id,
+            run_id=run.id,
+            title=f"Epic {i}",
+            goal="A goal long enough",
+            scope="A scope long enough",
+            status=EpicStatus.PENDING_REVIEW,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(epics)
+    await db_session.flush()
+    ids = [epic.id for epic in epics]
+
+    response = await authed_client.post(
+        "/api/v1/epics/bulk-approve",
+        json={"ids": ids[:2], "approved": True},
+    )
+    assert response.status_code == 200
+    assert [e["id"] for e in response.json()] == ids[:2]
+    assert {e["status"] for e in response.json()} == {"approved"}
 
-    # List projects
-    response = await client.get(
+    # Already approved epics fail the whole batch and leave the rest untouched
+    response = await authed_client.post(
+        "/api/v1/epics/bulk-approve",
+        json={"ids": ids, "approved": False, "feedback": "No"},
+    )
+    assert response.status_code == 400
+    await db_session.refresh(epics[2])
+    assert epics[2].status == EpicStatus.PENDING_REVIEW
+
+
+@pytest.mark.asyncio
+async def test_bulk_approve_stories_rejects_unknown_ids(
+    authed_client: AsyncClient, db_session: AsyncSession
+):
+    """Test that a batch naming a missing story changes nothing."""
+    response = await authed_client.post(
         "/api/v1/projects",
-        headers={"Authorization": f"Bearer {token}"},
+        json={"name": "Test Project", "product_request": "Build a simple TODO API"},
+    )
+    project_id = response.json()["id"]
+    run = Run(project_id=project_id)
+    db_session.add(run)
+    await db_session.flush()
+    epic = Epic(
+        project_id=project_id,
+        run_id=run.id,
+        title="Epic",
+        goal="A goal long enough",
+        scope="A scope long enough",
+    )
+    db_session.add(epic)
+    await db_session.flush()
+    story = Story(
+        epic_id=epic.id,
+        title="Story",
+        description="A description",
+        status=StoryStatus.PENDING_REVIEW,
+    )
+    db_session.add(story)
+    await db_session.flush()
+
+    response = await authed_client.post(
+        "/api/v1/stories/bulk-approve",
+        json={"ids": [story.id, story.id + 1000], "approved": False, "feedback": "No"},
+    )
+    assert response.status_code == 404
+    response = await authed_client.post(
+        "/api/v1/stories/bulk-approve",
+        json={"ids": [story.id], "approved": False, "feedback": "No"},
     )
     assert response.status_code == 200
-    data = response.json()
-    assert "items" in data
-    assert len(data["items"]) == 1
\ No newline at end of file
+    assert response.json()[0]["status"] == "rejected"
+    assert response.json()[0]["feedback"] == "No"
+
+
+@pytest.mark.asyncio
+async def test_approval_pause_writes_full_checkpoint(
+    authed_client: AsyncClient, db_session: AsyncSession
+):
+    """Test that each pause stores the whole state, including dropped keys."""
+    response = await authed_client.post(
+        "/api/v1/projects",
+        json={"name": "Test Project", "product_request": "Build a simple TODO API"},
+    )
+    run = Run(project_id=response.json()["id"])
+    db_session.add(run)
+    await db_session.flush()
+    service = WorkflowService(db_session)
+
+    first = {
+        "awaiting_approval": True,
+        "approval_type": "epic",
+        "epics": [{"title": "A"}],
+        "notes": "x",
+    }
+    await service._process_workflow_result(db_session, run.id, first)
+    # A later pause that drops a key must not keep it from the earlier one
+    second = {"awaiting_approval": True, "approval_type": "story", "epics": [{"title": "A"}]}
+    await service._process_workflow_result(db_session, run.id, second)
+
+    await db_session.refresh(run)
+    assert run.status == RunStatus.PAUSED
+    assert run.checkpoint_data == second
+
+
+@pytest.mark.asyncio
+async def test_failed_workflow_marked_failed_when_sse_publish_fails(
+    db_session: AsyncSession, monkeypatch
+):
+    """Test that an SSE error does not stop a crashed run from being marked failed."""
+    service = WorkflowService(db_session)
+    marked = []
+
+    async def crash(**kwargs):
+        raise RuntimeError("LLM unavailable")
+
+    async def mark_failed(run_id, error_message):
+        await asyncio.sleep(0.01)
+        marked.append((run_id, error_message))
+
+    async def publish_error(*args, **kwargs):
+        raise ConnectionError("subscriber gone")
+
+    monkeypatch.setattr(service.runner, "start_workflow", crash)
+    monkeypatch.setattr(service, "_mark_failed_new_session", mark_failed)
+    monkeypatch.setattr(sse_manager, "publish_error", publish_error)
+
+    await service._execute_workflow(1, 1, 1, "Build a TODO API", None)
+    assert marked == [(1, "LLM unavailable")]
+
+
+@pytest.mark.asyncio
+async def test_save_all_returns_rows_in_parameter_order(
+    authed_client: AsyncClient, db_session: AsyncSession
+):
+    """Test that bulk saving links children to the parents at their indexes."""
+    response = await authed_client.post(
+        "/api/v1/projects",
+        json={"name": "Test Project", "product_request": "Build a simple TODO API"},
+    )
+    project_id = response.json()["id"]
+    run = Run(project_id=project_id)
+    db_session.add(run)
+    await db_session.flush()
+
+    epics, stories, specs = await WorkflowService(db_session).save_all(
+        run.id,
+        project_id,
+        [{"title": f"Epic {i}", "goal": "Goal", "scope": "Scope"} for i in range(3)],
+        [
+            {"title": "Story 0", "epic_index": 2},
+            {"title": "Orphan", "epic_index": 9},
+            {"title": "Story 1", "epic_index": 0},
+        ],
+        [{"content": "Spec 0", "story_index": 2}, {"content": "Spec 1", "story_index": 1}],
+    )
+
+    assert [e.title for e in epics] == ["Epic 0", "Epic 1", "Epic 2"]
+    assert all(e.id for e in epics)
+    # The orphan story is skipped, and so is the spec pointing at it
+    assert [(s.title, s.epic_id) for s in stories] == [
+        ("Story 0", epics[2].id),
+        ("Story 1", epics[0].id),
+    ]
+    assert [(s.content, s.story_id) for s in specs] == [("Spec 0", stories[1].id)]
+
+
+async def _story_in_project(db_session: AsyncSession, project_id: int) -> Story:
+    """Add a run, an epic and a story under a project."""
+    run = Run(project_id=project_id)
+    db_session.add(run)
+    await db_session.flush()
+    epic = Epic(
+        project_id=project_id,
+        run_id=run.id,
+        title="Epic",
+        goal="A goal long enough",
+        scope="A scope long enough",
+    )
+    db_session.add(epic)
+    await db_session.flush()
+    story = Story(epic_id=epic.id, title="Story", description="A description")
+    db_session.add(story)
+    await db_session.flush()
+    return story
+
+
+async def _foreign_story(db_session: AsyncSession) -> Story:
+    """Add a story owned by a user other than the authenticated one."""
+    other = User(email="other@example.com", password_hash="not-a-real-hash")
+    db_session.add(other)
+    await db_session.flush()
+    project = Project(user_id=other.id, name="Other", product_request="Someone else's API")
+    db_session.add(project)
+    await db_session.flush()
+    return await _story_in_project(db_session, project.id)
+
+
+@pytest.mark.asyncio
+async def test_bulk_approve_specs(authed_client: AsyncClient, db_session: AsyncSession):
+    """Test approving specs in one request, and batches that must change nothing."""
+    response = await authed_client.post(
+        "/api/v1/projects",
+        json={"name": "Test Project", "product_request": "Build a simple TODO API"},
+    )
+    story = await _story_in_project(db_session, response.json()["id"])
+    specs = [
+        Spec(
+            story_id=story.id,
+            content=f"Spec {i}: " + "A specification long enough to pass validation. ",
+            status=SpecStatus.PENDING_REVIEW,
+        )
+        for i in range(3)
+    ]
+    foreign = Spec(
+        story_id=(await _foreign_story(db_session)).id,
+        content="Foreign",
+        status=SpecStatus.PENDING_REVIEW,
+    )
+    db_session.add_all([*specs, foreign])
+    await db_session.flush()
+    ids = [spec.id for spec in specs]
+
+    response = await authed_client.post(
+        "/api/v1/specs/bulk-approve",
+        json={"ids": ids[:2], "approved": True},
+    )
+    assert response.status_code == 200
+    assert [s["id"] for s in response.json()] == ids[:2]
+    assert {s["status"] for s in response.json()} == {"approved"}
+
+    # Unknown and foreign ids fail the whole batch
+    for bad_id in (ids[2] + 1000, foreign.id):
+        response = await authed_client.post(
+            "/api/v1/specs/bulk-approve",
+            json={"ids": [ids[2], bad_id], "approved": True},
+        )
+        assert response.status_code == 404
+    await db_session.refresh(specs[2])
+    await db_session.refresh(foreign)
+    assert specs[2].status == SpecStatus.PENDING_REVIEW
+    assert foreign.status == SpecStatus.PENDING_REVIEW
+
+    # An already approved spec fails the batch too
+    response = await authed_client.post(
+        "/api/v1/specs/bulk-approve",
+        json={"ids": [ids[0], ids[2]], "approved": False, "feedback": "No"},
+    )
+    assert response.status_code == 400
+    await db_session.refresh(specs[2])
+    assert specs[2].status == SpecStatus.PENDING_REVIEW
+
+
+@pytest.mark.asyncio
+async def test_validation_reports_only_for_own_artifacts(
+    authed_client: AsyncClient, db_session: AsyncSession
+):
+    """Test fetching several validation reports, leaving out other users' artifacts."""
+    response = await authed_client.post(
+        "/api/v1/projects",
+        json={"name": "Test Project", "product_request": "Build a simple TODO API"},
+    )
+    story = await _story_in_project(db_session, response.json()["id"])
+    spec = Spec(story_id=story.id, content="Spec")
+    foreign_spec = Spec(story_id=(await _foreign_story(db_session)).id, content="Foreign")
+    db_session.add_all([spec, foreign_spec])
+    await db_session.flush()
+    own = CodeArtifact(
+        spec_id=spec.id,
+        files={"main.py": "print('hi')"},
+        status=CodeArtifactStatus.VALID,
+        validation_report={"passed": True},
+        fix_attempts=1,
+    )
+    foreign = CodeArtifact(spec_id=foreign_spec.id, files={})
+    db_session.add_all([own, foreign])
+    await db_session.flush()
+
+    response = await authed_client.post(
+        "/api/v1/code/validation-reports",
+        json={"ids": [own.id, foreign.id, own.id + 1000]},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "reports": [
+            {
+                "artifact_id": own.id,
+                "status": "valid",
+                "validation_report": {"passed": True},
+                "lint_results": None,
+                "test_results": None,
+                "error_log": None,
+                "fix_attempts": 1,
+            }
+        ]
+    }
@@ -0,0 +1,32 @@
+"""Tests for the command-line interface."""
+import tarfile
+
+import pytest
+
+import cli
+
+FILES = {"main.py": "print('hi')\n", "app/models.py": "MODELS = []\n"}
+
+
+@pytest.mark.asyncio
+async def test_save_generated_code_archive(tmp_path, monkeypatch):
+    """The archive is named after the output directory and holds every file."""
+    archive_path = await cli.save_generated_code(FILES, str(tmp_path / "out"), archive=True)
+    assert archive_path == tmp_path / "out.tar"
+    assert not (tmp_path / "out").exists()
+    with tarfile.open(archive_path) as tf:
+        assert {name: tf.extractfile(name).read().decode() for name in tf.getnames()} == FILES
+
+    # "." has no name of its own until resolved
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    monkeypatch.chdir(project_dir)
+    assert await cli.save_generated_code(FILES, ".", archive=True) == tmp_path / "project.tar"
+
+
+@pytest.mark.asyncio
+async def test_save_generated_code_writes_files(tmp_path):
+    """Without archive each file lands under the output directory."""
+    output_path = await cli.save_generated_code(FILES, str(tmp_path / "out"))
+    assert (output_path / "app" / "models.py").read_text() == FILES["app/models.py"]
+    assert (output_path / "main.py").read_text() == FILES["main.py"]
@@ -0,0 +1,141 @@
+"""Tests for the interactive CLI runner."""
+import os
+import pty
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import run_workflow
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Runs run_workflow.main() against a runner that stops at the first approval gate
+CHILD = f"""
+import sys
+sys.path.insert(0, {str(BACKEND_DIR)!r})
+import app.agents.graph
+
+
+class StubRunner:
+    async def start_workflow(self, **kwargs):
+        return {{
+            "awaiting_approval": True,
+            "approval_type": "epic",
+            "epics": [{{"title": "Epic", "goal": "Goal", "scope": "Scope"}}],
+        }}
+
+
+app.agents.graph.get_workflow_runner = StubRunner
+import run_workflow
+sys.argv = ["run_workflow.py", "--quiet", "Build a TODO API"]
+run_workflow.main()
+"""
+
+
+def _read_until(fd: int, marker: bytes, timeout: float) -> bytes:
+    """Read the pty until marker shows up or the timeout passes."""
+    output = b""
+    deadline = time.monotonic() + timeout
+    while marker not in output and time.monotonic() < deadline:
+        try:
+            output += os.read(fd, 4096)
+        except OSError:
+            break
+    return output
+
+
+def test_sigint_at_approval_prompt_exits(tmp_path):
+    """Ctrl+C at the approval prompt ends the process with status 1."""
+    parent_fd, child_fd = pty.openpty()
+    process = subprocess.Popen(
+        [sys.executable, "-c", CHILD],
+        cwd=tmp_path,
+        stdin=child_fd,
+        stdout=child_fd,
+        stderr=child_fd,
+        close_fds=True,
+    )
+    os.close(child_fd)
+    try:
+        output = _read_until(parent_fd, b"Your choice:", timeout=30)
+        assert b"Your choice:" in output, output.decode(errors="replace")
+
+        process.send_signal(signal.SIGINT)
+        assert process.wait(timeout=10) == 1
+        assert b"Workflow interrupted by user" in _read_until(
+            parent_fd, b"interrupted", timeout=5
+        )
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        os.close(parent_fd)
+
+
+class RecordingRunner:
+    """Stands in for WorkflowRunner, recording restores and fresh starts."""
+
+    def __init__(self, start_state=None):
+        self.start_state = start_state or {}
+        self.started = 0
+        self.restored = []
+
+    async def start_workflow(self, **kwargs):
+        self.started += 1
+        return dict(self.start_state)
+
+    async def restore_state(self, run_id, state):
+        self.restored.append((run_id, state))
+
+
+def test_snapshot_path_fingerprints_request_and_constraints():
+    """The same request and constraints map to one file; any change to a new one."""
+    path = run_workflow._snapshot_path("Build a TODO API", None)
+    assert path == run_workflow._snapshot_path("Build a TODO API", "")
+    assert path.parent == run_workflow._CACHE_DIR
+    assert path.name.startswith("run_") and path.suffix == ".jsonl"
+    assert path != run_workflow._snapshot_path("Build a TODO API", "Use Redis")
+    assert path != run_workflow._snapshot_path("Build a blog API", None)
+
+
+@pytest.mark.asyncio
+async def test_resume_replays_saved_turns(tmp_path, monkeypatch):
+    """Two saved turns rebuild the latest state, which is handed to restore_state."""
+    monkeypatch.chdir(tmp_path)
+    first = {"awaiting_approval": True, "approval_type": "epic", "epics": [{"title": "A"}]}
+    state, path = await run_workflow._start_or_resume(
+        RecordingRunner(first), 1, "Build a TODO API", None, resume=False
+    )
+    second = {**state, "approval_type": "story", "stories": [{"title": "S"}]}
+    run_workflow._append_delta(path, state, second)
+    assert len(path.read_bytes().splitlines()) == 2
+
+    runner = RecordingRunner()
+    resumed, resumed_path = await run_workflow._start_or_resume(
+        runner, 1, "Build a TODO API", None, resume=True
+    )
+    assert resumed == second
+    assert resumed_path == path
+    assert runner.restored == [(1, second)]
+    assert runner.started == 0
+
+
+@pytest.mark.asyncio
+async def test_resume_without_snapshot_starts_fresh(tmp_path, monkeypatch):
+    """A missing snapshot falls back to a new run."""
+    monkeypatch.chdir(tmp_path)
+    runner = RecordingRunner({"awaiting_approval": True, "approval_type": "epic"})
+    await run_workflow._start_or_resume(runner, 1, "Build a TODO API", None, resume=True)
+    assert runner.started == 1
+    assert runner.restored == []
+
+
+def test_load_snapshot_stops_at_partial_line(tmp_path):
+    """A turn cut short mid-write is dropped; earlier turns still replay."""
+    path = tmp_path / "run.jsonl"
+    path.write_bytes(b'{"approval_type": "epic", "epics": []}\n{"approval_type": "sto')
+    assert run_workflow._load_snapshot(path) == {"approval_type": "epic", "epics": []}
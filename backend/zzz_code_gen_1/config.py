@@ -2,7 +2,6 @@
 """
 App configuration using pydantic-settings.
 """
-import os
 from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,8 +9,16 @@ class Settings(BaseSettings):
     env: str = "production"
     ssl_cert_path: str = ""
     ssl_key_path: str = ""
+    # Comma-separated list of origins allowed by CORS
+    allowed_origins: str = "*"
 
-    model_config = SettingsConfigDict(env_prefix="", extra="ignore")
+    model_config = SettingsConfigDict(
+        env_prefix="",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+    )
 
     @property
     def is_production(self) -> bool:
@@ -26,8 +33,4 @@ def get_settings() -> Settings:
     """
     Get application settings from environment variables.
     """
-    return Settings(
-        env=os.getenv("ENV", "production"),
-        ssl_cert_path=os.getenv("SSL_CERT_PATH", ""),
-        ssl_key_path=os.getenv("SSL_KEY_PATH", ""),
-    )
+    return Settings()
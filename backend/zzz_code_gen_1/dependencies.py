@@ -1,22 +1,67 @@
 # dependencies.py
 """
 FastAPI dependencies for BookStore and settings.
+
+Both are async so FastAPI calls them on the event loop instead of sending
+each one through the threadpool.
 """
+from typing import Callable, Optional
 from fastapi import Depends, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 from models import BookStore
 from config import get_settings, Settings
+from schemas import BOOK_CREATE_ADAPTER, BOOK_UPDATE_ADAPTER, BookCreate, BookUpdate
 
-# Singleton BookStore instance
-book_store = BookStore()
+# Singleton BookStore instance, created on first request
+_book_store: Optional[BookStore] = None
 
-def get_book_store() -> BookStore:
+async def get_book_store() -> BookStore:
     """
     Dependency to get the global BookStore instance.
     """
-    return book_store
+    global _book_store
+    if _book_store is None:
+        # No await between the check and the assignment, so only one store is built
+        _book_store = BookStore()
+    return _book_store
 
-def get_app_settings() -> Settings:
+async def get_app_settings() -> Settings:
     """
     Dependency to get app settings.
     """
     return get_settings()
+
+def json_body(adapter: TypeAdapter) -> Callable:
+    """
+    Build a dependency that validates the raw request body with `adapter`.
+
+    Parsing and validation happen in one validate_json pass over the bytes;
+    failures are reported as the usual 422 with locations under "body".
+    """
+    async def parse(request: Request):
+        try:
+            return adapter.validate_json(await request.body())
+        except ValidationError as exc:
+            errors = exc.errors(include_url=False)
+            for error in errors:
+                error["loc"] = ("body", *error["loc"])
+            raise RequestValidationError(errors)
+    return parse
+
+get_book_create = json_body(BOOK_CREATE_ADAPTER)
+get_book_update = json_body(BOOK_UPDATE_ADAPTER)
+
+def json_body_openapi(model: type) -> dict:
+    """
+    OpenAPI request body for a route whose body is parsed by json_body.
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+BOOK_CREATE_OPENAPI = json_body_openapi(BookCreate)
+BOOK_UPDATE_OPENAPI = json_body_openapi(BookUpdate)
@@ -3,38 +3,65 @@
 FastAPI app entry point with routes and SSL config.
 """
 import sys
+import asyncio
 import logging
+from contextlib import asynccontextmanager, suppress
+from functools import partial
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from config import get_settings, Settings
-from routers import books, v1_books, sensitive
+from dependencies import get_book_store
+from routers import sensitive
+from routers.books_factory import make_books_router
 
 logger = logging.getLogger("uvicorn.error")
 
 settings = get_settings()
 
-app = FastAPI(title="Thread-Safe In-Memory Book Store API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Rebuild the book list snapshot in the background after writes
+    store = await get_book_store()
+    rebuilder = asyncio.create_task(store.run_snapshot_rebuilder())
+    yield
+    rebuilder.cancel()
+    with suppress(asyncio.CancelledError):
+        await rebuilder
+
+app = FastAPI(
+    title="Thread-Safe In-Memory Book Store API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# CORS (optional, can be adjusted as needed). Explicit lists let Starlette
+# answer preflights from precomputed sets instead of echoing request values.
+ALLOWED_ORIGINS = [origin.strip() for origin in settings.allowed_origins.split(",") if origin.strip()]
+ALLOWED_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+ALLOWED_HEADERS = ["Authorization", "Content-Type"]
 
-# CORS (optional, can be adjusted as needed)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=ALLOWED_METHODS,
+    allow_headers=ALLOWED_HEADERS,
 )
 
 # Include routers
-app.include_router(books.router, prefix="/books", tags=["Books"])
-app.include_router(v1_books.router, prefix="/api/v1/books", tags=["Books v1"])
+app.include_router(make_books_router("/"), prefix="/books", tags=["Books"])
+app.include_router(make_books_router("", v1=True), prefix="/api/v1/books", tags=["Books v1"])
 app.include_router(sensitive.router)
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(status_code=500, content={"detail": "Internal Server Error"})
+    # Log on the next loop iteration so a slow log sink doesn't hold up the 500
+    asyncio.get_running_loop().call_soon(
+        partial(logger.error, "Unhandled exception: %s", exc, exc_info=exc)
+    )
+    return ORJSONResponse(status_code=500, content={"detail": "Internal Server Error"})
 
 if __name__ == "__main__":
     import uvicorn
@@ -51,12 +78,14 @@ if __name__ == "__main__":
         "reload": env == "development",
     }
     if ssl_cert and ssl_key:
-        if not os.path.isfile(ssl_cert):
-            logger.error(f"SSL certificate file not found: {ssl_cert}")
-            sys.exit(1)
-        if not os.path.isfile(ssl_key):
-            logger.error(f"SSL key file not found: {ssl_key}")
-            sys.exit(1)
+        # One stat per file; under --reload uvicorn only opens them in the
+        # worker, so a missing file is still reported here, before startup
+        for label, path in (("certificate", ssl_cert), ("key", ssl_key)):
+            try:
+                os.stat(path)
+            except FileNotFoundError:
+                logger.error(f"SSL {label} file not found: {path}")
+                sys.exit(1)
         uvicorn_kwargs["ssl_certfile"] = ssl_cert
         uvicorn_kwargs["ssl_keyfile"] = ssl_key
     try:
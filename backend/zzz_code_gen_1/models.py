@@ -2,63 +2,234 @@
 """
 In-memory BookStore and Book data models.
 """
-from typing import Dict, Optional
+import asyncio
+from contextlib import contextmanager, suppress
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 import threading
 
+if TYPE_CHECKING:
+    from schemas import BookUpdate
+
+try:
+    # C-level lock, much cheaper than threading.Lock when uncontended
+    from fastrlock.rlock import FastRLock as _FastLock
+except ImportError:
+    _FastLock = threading.Lock
+
+class RWLock:
+    """
+    Read-biased reader-writer lock.
+
+    Any number of readers may hold the lock together; a writer waits until
+    the last reader leaves and then holds it exclusively. The first reader
+    in takes the write lock on behalf of all readers and the last one out
+    releases it, so a steady stream of readers can starve writers.
+
+    The reader-count lock is taken on every read and always released by the
+    thread that took it, so it uses fastrlock when installed. The write lock
+    may be released by a different reader thread than the one that acquired
+    it, which an owned lock like FastRLock forbids, so it stays a plain Lock.
+    """
+    def __init__(self):
+        self._readers = 0
+        self._readers_lock = _FastLock()
+        self._write_lock = threading.Lock()
+
+    @contextmanager
+    def read_lock(self) -> Iterator[None]:
+        with self._readers_lock:
+            self._readers += 1
+            if self._readers == 1:
+                self._write_lock.acquire()
+        try:
+            yield
+        finally:
+            with self._readers_lock:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._write_lock.release()
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        with self._write_lock:
+            yield
+
 class Book:
     """
     Book data model for in-memory store.
     """
+    __slots__ = ("id", "title", "author", "year", "availability", "_cached_dict")
+
     def __init__(self, id: int, title: str, author: str, year: int, availability: bool = True):
         self.id = id
         self.title = title
         self.author = author
         self.year = year
         self.availability = availability
+        # Built on first to_dict(); BookStore.update_book clears it
+        self._cached_dict: Optional[dict] = None
 
     def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "author": self.author,
-            "year": self.year,
-            "availability": self.availability,
-        }
+        """
+        Return the book as a dict, shared between calls until the next update.
+        Callers must not mutate it.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "id": self.id,
+                "title": self.title,
+                "author": self.author,
+                "year": self.year,
+                "availability": self.availability,
+            }
+        return self._cached_dict
 
 class BookStore:
     """
     Thread-safe in-memory book store.
+
+    Books are spread over SHARD_COUNT shards by id, each behind its own
+    reader-writer lock, so requests for different books rarely contend.
+    Within a shard, reads share the lock; adds, updates and deletes take it
+    exclusively.
     """
+    SHARD_COUNT = 16  # power of two, so the shard is id & (SHARD_COUNT - 1)
+
     def __init__(self):
-        self.books: Dict[int, Book] = {}
-        self.lock = threading.Lock()
+        self._shards: List[Dict[int, Book]] = [{} for _ in range(self.SHARD_COUNT)]
+        self._locks: List[RWLock] = [RWLock() for _ in range(self.SHARD_COUNT)]
+        # List of book dicts served by get_all_books_snapshot. Writers bump
+        # _version and clear it; a rebuild is only published if no write
+        # happened while it ran
+        self._snapshot: Optional[List[dict]] = None
+        self._version = 0
+        self._snapshot_lock = threading.Lock()
+        # Set while run_snapshot_rebuilder is running: the snapshot it last
+        # published, and the loop and event writers use to wake it
+        self._published: Optional[List[dict]] = None
+        self._rebuild_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dirty: Optional[asyncio.Event] = None
+
+    def _shard(self, book_id: int) -> int:
+        return book_id & (self.SHARD_COUNT - 1)
+
+    def _invalidate(self) -> None:
+        with self._snapshot_lock:
+            self._version += 1
+            self._snapshot = None
+        # Read both at once: the rebuilder may clear them while a writer is here
+        loop, dirty = self._rebuild_loop, self._dirty
+        if loop is None or dirty is None:
+            return
+        # Writers may run off the loop thread, and asyncio.Event is not thread-safe
+        with suppress(RuntimeError):  # loop closed after the rebuilder stopped
+            loop.call_soon_threadsafe(dirty.set)
 
     def add_book(self, book: Book) -> None:
-        with self.lock:
-            if book.id in self.books:
+        i = self._shard(book.id)
+        with self._locks[i].write_lock():
+            shard = self._shards[i]
+            if book.id in shard:
                 raise ValueError("Book with this ID already exists.")
-            self.books[book.id] = book
+            shard[book.id] = book
+        self._invalidate()
 
     def get_book(self, book_id: int) -> Optional[Book]:
-        with self.lock:
-            return self.books.get(book_id)
+        i = self._shard(book_id)
+        with self._locks[i].read_lock():
+            return self._shards[i].get(book_id)
 
     def get_all_books(self) -> Dict[int, Book]:
-        with self.lock:
-            return dict(self.books)
+        books: Dict[int, Book] = {}
+        # One shard at a time, so writers elsewhere are never blocked for long
+        for lock, shard in zip(self._locks, self._shards):
+            with lock.read_lock():
+                books.update(shard)
+        return books
+
+    def get_all_books_snapshot(self) -> List[dict]:
+        """
+        Return every book as a dict, ordered by id. The list is built once per
+        change to the store and shared between callers, who must not mutate it.
+
+        While run_snapshot_rebuilder is running this returns the last published
+        list without locking, which can trail the latest writes by a few ms.
+        """
+        published = self._published
+        if published is not None:
+            return published
+        with self._snapshot_lock:
+            snapshot, version = self._snapshot, self._version
+        if snapshot is None:
+            books = self.get_all_books()
+            snapshot = [books[book_id].to_dict() for book_id in sorted(books)]
+            with self._snapshot_lock:
+                if self._version == version:
+                    self._snapshot = snapshot
+        return snapshot
+
+    async def run_snapshot_rebuilder(self, delay: float = 0.005) -> None:
+        """
+        Keep a published snapshot current off the request path, until cancelled.
+
+        Each write wakes the loop, which waits `delay` seconds so a burst of
+        writes costs one rebuild, then swaps in the new list. Readers keep
+        getting the previous list meanwhile.
+        """
+        self._dirty = asyncio.Event()
+        self._rebuild_loop = asyncio.get_running_loop()
+        self._published = self.get_all_books_snapshot()
+        try:
+            while True:
+                await self._dirty.wait()
+                await asyncio.sleep(delay)
+                self._dirty.clear()
+                books = self.get_all_books()
+                self._published = [books[book_id].to_dict() for book_id in sorted(books)]
+        finally:
+            self._rebuild_loop = None
+            self._dirty = None
+            self._published = None
 
     def update_book(self, book_id: int, **kwargs) -> Book:
-        with self.lock:
-            book = self.books.get(book_id)
+        i = self._shard(book_id)
+        with self._locks[i].write_lock():
+            book = self._shards[i].get(book_id)
             if not book:
                 raise KeyError("Book not found.")
             for key, value in kwargs.items():
                 if hasattr(book, key) and value is not None:
                     setattr(book, key, value)
-            return book
+            book._cached_dict = None
+        self._invalidate()
+        return book
+
+    def apply_update(self, book_id: int, update: "BookUpdate") -> Book:
+        """
+        Apply the fields a client actually sent in a partial update.
+        """
+        i = self._shard(book_id)
+        with self._locks[i].write_lock():
+            book = self._shards[i].get(book_id)
+            if not book:
+                raise KeyError("Book not found.")
+            changed = False
+            for name in update.model_fields_set:
+                value = getattr(update, name)
+                if value is not None:
+                    setattr(book, name, value)
+                    changed = True
+            if changed:
+                book._cached_dict = None
+        if changed:
+            self._invalidate()
+        return book
 
     def delete_book(self, book_id: int) -> None:
-        with self.lock:
-            if book_id not in self.books:
+        i = self._shard(book_id)
+        with self._locks[i].write_lock():
+            shard = self._shards[i]
+            if book_id not in shard:
                 raise KeyError("Book not found.")
-            del self.books[book_id]
+            del shard[book_id]
+        self._invalidate()
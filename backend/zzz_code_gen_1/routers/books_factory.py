@@ -0,0 +1,207 @@
+# routers/books_factory.py
+"""
+Builds the book CRUD routers mounted at /books and /api/v1/books.
+
+Both versions share one set of handlers. The v1 API has no PUT, and its
+DELETE answers 200 with a message instead of 204.
+"""
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Path
+from schemas import BookCreate, BookUpdate, BookOutput, ErrorResponse
+from dependencies import (
+    BOOK_CREATE_OPENAPI,
+    BOOK_UPDATE_OPENAPI,
+    get_book_create,
+    get_book_store,
+    get_book_update,
+)
+from models import BookStore, Book
+
+def _to_output(book: Book) -> BookOutput:
+    """
+    Build the response model without validation; stored books are already valid.
+    """
+    return BookOutput.model_construct(
+        id=book.id,
+        title=book.title,
+        author=book.author,
+        year=book.year,
+        availability=book.availability,
+    )
+
+async def create_book(
+    book: BookCreate = Depends(get_book_create),
+    store: BookStore = Depends(get_book_store),
+):
+    """
+    Add a new book to the in-memory store.
+    """
+    try:
+        new_book = Book(
+            id=book.id,
+            title=book.title,
+            author=book.author,
+            year=book.year,
+            availability=book.availability,
+        )
+        store.add_book(new_book)
+        return _to_output(new_book)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Book with this ID already exists.")
+
+async def list_books(
+    store: BookStore = Depends(get_book_store),
+):
+    """
+    Retrieve a list of all books in the in-memory store.
+    """
+    # Stored books are already valid; the default ORJSONResponse encodes the snapshot as is
+    return store.get_all_books_snapshot()
+
+async def get_book(
+    book_id: int = Path(..., ge=1),
+    store: BookStore = Depends(get_book_store),
+):
+    """
+    Retrieve a single book by its integer ID.
+    """
+    book = store.get_book(book_id)
+    if not book:
+        raise HTTPException(status_code=404, detail="Book not found")
+    return _to_output(book)
+
+async def update_book(
+    book_id: int = Path(..., ge=1),
+    book_update: BookCreate = Depends(get_book_create),
+    store: BookStore = Depends(get_book_store),
+):
+    """
+    Update an existing book's details by ID. All fields required.
+    """
+    try:
+        updated = store.update_book(
+            book_id,
+            title=book_update.title,
+            author=book_update.author,
+            year=book_update.year,
+            availability=book_update.availability,
+        )
+        return _to_output(updated)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Book not found")
+
+async def patch_book(
+    book_id: int = Path(..., ge=1),
+    book_update: BookUpdate = Depends(get_book_update),
+    store: BookStore = Depends(get_book_store),
+):
+    """
+    Partially update a book by ID. Only provided fields are updated.
+    """
+    try:
+        # An empty body is accepted as a no-op
+        updated = store.apply_update(book_id, book_update)
+        return _to_output(updated)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Book not found")
+
+async def delete_book(
+    book_id: int = Path(..., ge=1),
+    store: BookStore = Depends(get_book_store),
+):
+    """
+    Delete a book by its integer ID from the in-memory store.
+    """
+    try:
+        store.delete_book(book_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Book not found")
+
+async def delete_book_with_message(
+    book_id: int = Path(..., ge=1),
+    store: BookStore = Depends(get_book_store),
+):
+    """
+    Delete a book by its integer ID and confirm with a message.
+    """
+    await delete_book(book_id, store)
+    return {"message": "Book deleted successfully."}
+
+_NOT_FOUND = {404: {"model": ErrorResponse, "description": "Book not found."}}
+_INVALID = {422: {"model": ErrorResponse, "description": "Validation error."}}
+
+def make_books_router(root: str = "/", *, v1: bool = False) -> APIRouter:
+    """
+    Build a books router whose collection routes live at `root`.
+
+    The /books API uses "/" and v1=False; /api/v1/books uses "" and v1=True.
+    """
+    router = APIRouter()
+    router.add_api_route(
+        root,
+        create_book,
+        methods=["POST"],
+        openapi_extra=BOOK_CREATE_OPENAPI,
+        response_model=BookOutput,
+        status_code=status.HTTP_201_CREATED,
+        responses={
+            400: {"model": ErrorResponse, "description": "Duplicate book ID."},
+            **_INVALID,
+        },
+    )
+    router.add_api_route(
+        root,
+        list_books,
+        methods=["GET"],
+        response_model=None,
+        status_code=status.HTTP_200_OK,
+        responses={200: {"model": List[BookOutput]}},
+    )
+    router.add_api_route(
+        "/{book_id}",
+        get_book,
+        methods=["GET"],
+        response_model=BookOutput,
+        responses={**_NOT_FOUND, **_INVALID},
+    )
+    if not v1:
+        router.add_api_route(
+            "/{book_id}",
+            update_book,
+            methods=["PUT"],
+            openapi_extra=BOOK_CREATE_OPENAPI,
+            response_model=BookOutput,
+            responses={**_NOT_FOUND, **_INVALID},
+        )
+    router.add_api_route(
+        "/{book_id}",
+        patch_book,
+        methods=["PATCH"],
+        openapi_extra=BOOK_UPDATE_OPENAPI,
+        response_model=BookOutput,
+        responses={**_NOT_FOUND, **_INVALID},
+    )
+    if v1:
+        router.add_api_route(
+            "/{book_id}",
+            delete_book_with_message,
+            methods=["DELETE"],
+            status_code=200,
+            responses={
+                200: {"description": "Book deleted successfully."},
+                **_NOT_FOUND,
+            },
+        )
+    else:
+        router.add_api_route(
+            "/{book_id}",
+            delete_book,
+            methods=["DELETE"],
+            status_code=204,
+            responses={
+                204: {"description": "No Content"},
+                **_NOT_FOUND,
+                **_INVALID,
+            },
+        )
+    return router
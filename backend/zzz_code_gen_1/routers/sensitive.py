@@ -3,34 +3,36 @@
 Sensitive endpoints: /cleanup and /reset.
 Disabled in production.
 """
-from fastapi import APIRouter, Depends, Request, status, HTTPException
-from dependencies import get_app_settings
-from config import Settings
+from fastapi import APIRouter, Request, Response, status, HTTPException
+from config import get_settings
 
 router = APIRouter()
 
 SENSITIVE_ENDPOINTS = ["/cleanup", "/reset"]
 
-@router.api_route("/cleanup", methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"])
-async def cleanup_endpoint(
-    request: Request,
-    settings: Settings = Depends(get_app_settings),
-):
+# Settings are cached for the life of the process, so resolve this once
+# instead of running a settings dependency on every request
+IS_DEVELOPMENT = get_settings().is_development
+
+# Constant bodies, encoded once. A fresh Response wraps them per request because
+# CORSMiddleware edits response headers in place, so one instance can't be shared
+_CLEANUP_BODY = b'{"message":"Cleanup completed."}'
+_RESET_BODY = b'{"message":"Reset completed."}'
+
+@router.post("/cleanup")
+async def cleanup_endpoint(request: Request):
     """
     Sensitive endpoint for cleanup operations. Disabled in production.
     """
-    if not settings.is_development:
+    if not IS_DEVELOPMENT:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="/cleanup is disabled in production.")
-    return {"message": "Cleanup completed."}
+    return Response(content=_CLEANUP_BODY, media_type="application/json")
 
-@router.api_route("/reset", methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"])
-async def reset_endpoint(
-    request: Request,
-    settings: Settings = Depends(get_app_settings),
-):
+@router.post("/reset")
+async def reset_endpoint(request: Request):
     """
     Sensitive endpoint for reset operations. Disabled in production.
     """
-    if not settings.is_development:
+    if not IS_DEVELOPMENT:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="/reset is disabled in production.")
-    return {"message": "Reset completed."}
+    return Response(content=_RESET_BODY, media_type="application/json")
@@ -3,7 +3,7 @@
 Pydantic schemas for Book API.
 """
 from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 MAX_TITLE_LENGTH = 255
 MAX_AUTHOR_LENGTH = 255
@@ -53,3 +53,7 @@ class ErrorResponse(BaseModel):
     Standard error response schema.
     """
     detail: str
+
+# Built once at import so request bodies are validated straight from raw JSON bytes
+BOOK_CREATE_ADAPTER = TypeAdapter(BookCreate)
+BOOK_UPDATE_ADAPTER = TypeAdapter(BookUpdate)
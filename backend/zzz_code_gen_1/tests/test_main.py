@@ -1,12 +1,34 @@
 # tests/test_main.py
+import asyncio
+import threading
+import time
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from main import app
+from dependencies import get_book_store
+from models import Book, BookStore
+from routers import sensitive
 
-client = TestClient(app)
+pytestmark = pytest.mark.asyncio(loop_scope='module')
+
+@pytest_asyncio.fixture(scope='module', loop_scope='module')
+async def ac():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+@pytest.fixture(autouse=True)
+def fresh_store():
+    # Each test gets its own store, so tests stay independent under pytest-xdist
+    store = BookStore()
+    async def override():
+        return store
+    app.dependency_overrides[get_book_store] = override
+    yield store
+    app.dependency_overrides.pop(get_book_store, None)
 
 # --- Book CRUD tests ---
-def test_create_and_get_book():
+async def test_create_and_get_book(ac):
     # Create a book
     payload = {
         "id": 1,
@@ -15,7 +37,7 @@ def test_create_and_get_book():
         "year": 2023,
         "availability": True
     }
-    r = client.post("/books/", json=payload)
+    r = await ac.post("/books/", json=payload)
     assert r.status_code == 201
     data = r.json()
     assert data["id"] == 1
@@ -25,14 +47,14 @@ def test_create_and_get_book():
     assert data["availability"] is True
 
     # Get the book
-    r2 = client.get("/books/1")
+    r2 = await ac.get("/books/1")
     assert r2.status_code == 200
     data2 = r2.json()
     assert data2["id"] == 1
     assert data2["title"] == "Test Book"
 
 
-def test_duplicate_book_id():
+async def test_duplicate_book_id(ac):
     payload = {
         "id": 2,
         "title": "Book2",
@@ -40,24 +62,24 @@ def test_duplicate_book_id():
         "year": 2022,
         "availability": False
     }
-    r1 = client.post("/books/", json=payload)
+    r1 = await ac.post("/books/", json=payload)
     assert r1.status_code == 201
-    r2 = client.post("/books/", json=payload)
+    r2 = await ac.post("/books/", json=payload)
     assert r2.status_code == 400
     assert r2.json()["detail"] == "Book with this ID already exists."
 
 
-def test_missing_required_fields():
+async def test_missing_required_fields(ac):
     payload = {
         "id": 3,
         "title": "Book3",
         # Missing author, year, availability
     }
-    r = client.post("/books/", json=payload)
+    r = await ac.post("/books/", json=payload)
     assert r.status_code == 422
 
 
-def test_invalid_field_types():
+async def test_invalid_field_types(ac):
     payload = {
         "id": "not-an-int",
         "title": 123,
@@ -65,17 +87,25 @@ def test_invalid_field_types():
         "year": "not-a-year",
         "availability": "not-a-bool"
     }
-    r = client.post("/books/", json=payload)
+    r = await ac.post("/books/", json=payload)
     assert r.status_code == 422
 
 
-def test_get_nonexistent_book():
-    r = client.get("/books/9999")
+async def test_get_nonexistent_book(ac):
+    r = await ac.get("/books/9999")
     assert r.status_code == 404
     assert r.json()["detail"] == "Book not found"
 
 
-def test_update_book():
+async def test_book_id_below_one_rejected(ac):
+    r = await ac.get("/books/0")
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"] == ["path", "book_id"]
+    schema = app.openapi()["paths"]["/books/{book_id}"]["get"]["parameters"][0]["schema"]
+    assert schema["minimum"] == 1
+
+
+async def test_update_book(ac):
     payload = {
         "id": 10,
         "title": "Old Title",
@@ -83,7 +113,7 @@ def test_update_book():
         "year": 2000,
         "availability": True
     }
-    client.post("/books/", json=payload)
+    await ac.post("/books/", json=payload)
     update_payload = {
         "id": 10,
         "title": "New Title",
@@ -91,7 +121,7 @@ def test_update_book():
         "year": 2021,
         "availability": False
     }
-    r = client.put("/books/10", json=update_payload)
+    r = await ac.put("/books/10", json=update_payload)
     assert r.status_code == 200
     data = r.json()
     assert data["title"] == "New Title"
@@ -100,7 +130,7 @@ def test_update_book():
     assert data["availability"] is False
 
 
-def test_patch_book_partial_update():
+async def test_patch_book_partial_update(ac):
     payload = {
         "id": 20,
         "title": "Patch Title",
@@ -108,16 +138,102 @@ def test_patch_book_partial_update():
         "year": 2010,
         "availability": True
     }
-    client.post("/books/", json=payload)
+    await ac.post("/books/", json=payload)
     patch_payload = {"title": "Patched Title"}
-    r = client.patch("/books/20", json=patch_payload)
+    r = await ac.patch("/books/20", json=patch_payload)
     assert r.status_code == 200
     data = r.json()
     assert data["title"] == "Patched Title"
     assert data["author"] == "Patch Author"
 
 
-def test_delete_book():
+async def test_list_books_reflects_writes(ac):
+    payload = {
+        "id": 40,
+        "title": "Listed",
+        "author": "Author",
+        "year": 2001,
+        "availability": True
+    }
+    await ac.post("/books/", json=payload)
+    assert payload in (await ac.get("/books/")).json()
+
+    await ac.patch("/books/40", json={"title": "Relisted"})
+    listed = {b["id"]: b for b in (await ac.get("/api/v1/books")).json()}
+    assert listed[40]["title"] == "Relisted"
+
+    await ac.delete("/books/40")
+    assert 40 not in {b["id"] for b in (await ac.get("/books/")).json()}
+
+
+async def test_snapshot_rebuilder_publishes_after_writes():
+    store = BookStore()
+    rebuilder = asyncio.create_task(store.run_snapshot_rebuilder(delay=0))
+    await asyncio.sleep(0)
+    assert store.get_all_books_snapshot() == []
+
+    store.add_book(Book(id=2, title="B", author="A", year=2000))
+    store.add_book(Book(id=1, title="A", author="A", year=2000))
+    for _ in range(100):
+        await asyncio.sleep(0)
+        if len(store.get_all_books_snapshot()) == 2:
+            break
+    assert [b["id"] for b in store.get_all_books_snapshot()] == [1, 2]
+
+    rebuilder.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await rebuilder
+
+
+async def test_writes_during_app_lifespan(ac, fresh_store, monkeypatch):
+    # The lifespan starts the rebuilder on the global store; point it at this test's
+    monkeypatch.setattr("dependencies._book_store", fresh_store)
+    async with app.router.lifespan_context(app):
+        await asyncio.sleep(0)
+        assert fresh_store._rebuild_loop is not None
+        for book_id in (2, 1):
+            payload = {"id": book_id, "title": "T", "author": "A", "year": 2000, "availability": True}
+            assert (await ac.post("/books/", json=payload)).status_code == 201
+        for _ in range(100):
+            await asyncio.sleep(0.005)
+            if len((await ac.get("/books/")).json()) == 2:
+                break
+        assert [b["id"] for b in (await ac.get("/books/")).json()] == [1, 2]
+
+        # Writers on other threads keep going while the lifespan shuts down
+        stop = threading.Event()
+        errors = []
+
+        def write(start):
+            book_id = start
+            while not stop.is_set():
+                try:
+                    fresh_store.add_book(Book(id=book_id, title="T", author="A", year=2000))
+                except Exception as exc:
+                    errors.append(exc)
+                    return
+                book_id += 4
+
+        writers = [threading.Thread(target=write, args=(100 + i,)) for i in range(4)]
+        for writer in writers:
+            writer.start()
+        await asyncio.sleep(0.01)
+    try:
+        await asyncio.to_thread(time.sleep, 0.01)
+    finally:
+        stop.set()
+        for writer in writers:
+            writer.join()
+    assert errors == []
+    assert fresh_store._rebuild_loop is None
+
+    # A writer that read the loop just before the rebuilder cleared it must not
+    # trip over the already cleared event
+    fresh_store._rebuild_loop = asyncio.get_running_loop()
+    fresh_store.add_book(Book(id=3, title="T", author="A", year=2000))
+
+
+async def test_delete_book(ac):
     payload = {
         "id": 30,
         "title": "Delete Me",
@@ -125,32 +241,33 @@ def test_delete_book():
         "year": 2015,
         "availability": True
     }
-    client.post("/books/", json=payload)
-    r = client.delete("/books/30")
+    await ac.post("/books/", json=payload)
+    r = await ac.delete("/books/30")
     assert r.status_code == 204
-    r2 = client.get("/books/30")
+    r2 = await ac.get("/books/30")
     assert r2.status_code == 404
 
 
-def test_delete_nonexistent_book():
-    r = client.delete("/books/99999")
+async def test_delete_nonexistent_book(ac):
+    r = await ac.delete("/books/99999")
     assert r.status_code == 404
     assert r.json()["detail"] == "Book not found"
 
 
-def test_sensitive_endpoints_forbidden_in_production(monkeypatch):
-    monkeypatch.setenv("ENV", "production")
-    r = client.get("/cleanup")
+async def test_sensitive_endpoints_forbidden_in_production(ac, monkeypatch):
+    # The environment is read once at import, so patch the resolved flag
+    monkeypatch.setattr(sensitive, "IS_DEVELOPMENT", False)
+    r = await ac.post("/cleanup")
     assert r.status_code == 403
-    r = client.get("/reset")
+    r = await ac.post("/reset")
     assert r.status_code == 403
 
 
-def test_sensitive_endpoints_allowed_in_development(monkeypatch):
-    monkeypatch.setenv("ENV", "development")
-    r = client.get("/cleanup")
+async def test_sensitive_endpoints_allowed_in_development(ac, monkeypatch):
+    monkeypatch.setattr(sensitive, "IS_DEVELOPMENT", True)
+    r = await ac.post("/cleanup")
     assert r.status_code == 200
     assert r.json()["message"] == "Cleanup completed."
-    r = client.get("/reset")
+    r = await ac.post("/reset")
     assert r.status_code == 200
     assert r.json()["message"] == "Reset completed."
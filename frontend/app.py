@@ -1,4 +1,6 @@
 """Streamlit main application entry point."""
+from pathlib import Path
+
 import streamlit as st
 
 from components.auth import check_authentication, show_login_page
@@ -11,36 +13,15 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        margin-bottom: 1rem;
-    }
-    .sub-header {
-        font-size: 1.2rem;
-        color: #666;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin-bottom: 1rem;
-    }
-    .status-badge {
-        padding: 0.25rem 0.5rem;
-        border-radius: 0.25rem;
-        font-size: 0.875rem;
-    }
-    .status-pending { background-color: #ffeeba; color: #856404; }
-    .status-approved { background-color: #c3e6cb; color: #155724; }
-    .status-rejected { background-color: #f5c6cb; color: #721c24; }
-    .status-completed { background-color: #bee5eb; color: #0c5460; }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS. Streamlit drops any element a rerun does not emit again, so the
+# style tag is written on every run; only reading and wrapping the file is cached
+@st.cache_resource
+def _load_css() -> str:
+    css = (Path(__file__).parent / ".streamlit" / "style.css").read_text()
+    return f"<style>\n{css}</style>"
+
+
+st.markdown(_load_css(), unsafe_allow_html=True)
 
 
 def main():
@@ -17,10 +17,12 @@ from components.mermaid import (
     render_mermaid,
     render_mermaid_with_fallback,
 )
+from components.pagination import check_page, page_input, render_pager, reset_page
 from components.stream_handler import (
     SSEEvent,
     StreamHandler,
     cleanup_stream,
+    get_stream_handler,
     render_stream_status,
     render_workflow_monitor,
 )
@@ -41,9 +43,15 @@ __all__ = [
     "create_flowchart",
     "create_sequence_diagram",
     "create_er_diagram",
+    # Pagination
+    "render_pager",
+    "page_input",
+    "check_page",
+    "reset_page",
     # Stream
     "SSEEvent",
     "StreamHandler",
+    "get_stream_handler",
     "render_stream_status",
     "render_workflow_monitor",
     "cleanup_stream",
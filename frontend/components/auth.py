@@ -1,10 +1,30 @@
 """Authentication components for Streamlit."""
+import asyncio
+import threading
+from concurrent.futures import Future
+
+import httpx
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
 
 # API base URL - should be configured via environment
 API_URL = "http://localhost:8000/api/v1"
 
+# Shared across reruns and pages so calls reuse pooled keep-alive connections
+# instead of opening a new connection to the backend every time. Every browser
+# session's script thread uses it, so keep more than requests' default 10
+# connections to a host or busy periods would close and reopen them
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_maxsize=32))
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=32))
+
+# GETs currently on the wire, keyed by method, endpoint, params and token.
+# Streamlit runs each browser session's script on its own thread, so tabs
+# loading the same page would otherwise send identical requests side by side
+_INFLIGHT: dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
 
 def check_authentication() -> bool:
     """Check if the user is authenticated."""
@@ -85,7 +105,7 @@ def show_register_form():
 def login(email: str, password: str) -> tuple[bool, dict | str]:
     """Login and get access token."""
     try:
-        response = requests.post(
+        response = _SESSION.post(
             f"{API_URL}/auth/login",
             json={"email": email, "password": password},
             timeout=10,
@@ -105,7 +125,7 @@ def login(email: str, password: str) -> tuple[bool, dict | str]:
 def register(email: str, password: str) -> tuple[bool, dict | str]:
     """Register a new user."""
     try:
-        response = requests.post(
+        response = _SESSION.post(
             f"{API_URL}/auth/register",
             json={"email": email, "password": password},
             timeout=10,
@@ -125,7 +145,7 @@ def register(email: str, password: str) -> tuple[bool, dict | str]:
 def get_current_user(token: str) -> dict | None:
     """Get current user information."""
     try:
-        response = requests.get(
+        response = _SESSION.get(
             f"{API_URL}/auth/me",
             headers={"Authorization": f"Bearer {token}"},
             timeout=10,
@@ -146,6 +166,30 @@ def get_auth_header() -> dict:
     return {}
 
 
+def _coalesced_get(url: str, headers: dict, params: dict | None):
+    """GET url, sharing the response with any identical GET already in flight."""
+    key = (url, tuple(sorted(params.items())) if params else (), headers.get("Authorization"))
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT[key] = Future()
+
+    if not leader:
+        return future.result()
+
+    try:
+        response = _SESSION.get(url, headers=headers, params=params, timeout=30)
+        future.set_result(response)
+        return response
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+
+
 def api_request(
     method: str,
     endpoint: str,
@@ -158,29 +202,111 @@ def api_request(
         headers = get_auth_header()
 
         if method.upper() == "GET":
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = _coalesced_get(url, headers, params)
         elif method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            response = _SESSION.post(url, headers=headers, json=data, timeout=30)
         elif method.upper() == "PUT":
-            response = requests.put(url, headers=headers, json=data, timeout=30)
+            response = _SESSION.put(url, headers=headers, json=data, timeout=30)
         elif method.upper() == "DELETE":
-            response = requests.delete(url, headers=headers, timeout=30)
+            response = _SESSION.delete(url, headers=headers, timeout=30)
         else:
             return False, f"Unsupported method: {method}"
 
-        if response.status_code in [200, 201]:
-            return True, response.json()
-        elif response.status_code == 401:
-            # Token expired, logout
-            st.session_state.authenticated = False
-            st.session_state.token = None
-            st.session_state.user = None
-            return False, "Session expired. Please login again."
-        else:
-            error = response.json().get("detail", "Request failed")
-            return False, error
+        return _handle_response(response)
 
     except requests.exceptions.ConnectionError:
         return False, "Cannot connect to server"
     except Exception as e:
         return False, str(e)
+
+
+def _handle_response(response) -> tuple[bool, dict | str]:
+    """Turn a requests or httpx response into api_request's (success, result)."""
+    if response.status_code in [200, 201]:
+        return True, response.json()
+    elif response.status_code == 401:
+        # Token expired, logout
+        st.session_state.authenticated = False
+        st.session_state.token = None
+        st.session_state.user = None
+        return False, "Session expired. Please login again."
+    else:
+        error = response.json().get("detail", "Request failed")
+        return False, error
+
+
+class _UncachedResponse(Exception):
+    """Carries a non-success response out of _cached_get so it is not cached."""
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_get(endpoint: str, params: tuple, token: str | None):
+    """GET an endpoint once per TTL per token; every rerun in between gets a copy."""
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    response = _coalesced_get(f"{API_URL}{endpoint}", headers, dict(params) or None)
+    if response.status_code in [200, 201]:
+        return response.json()
+    # Streamlit only caches return values, so errors are fetched again next time
+    raise _UncachedResponse(response)
+
+
+def cached_api_request(endpoint: str, params: dict | None = None) -> tuple[bool, dict | str]:
+    """Make an authenticated GET through a 30s cache shared by reruns.
+
+    The cache is keyed by endpoint, params and token, so users never see each
+    other's data. Call clear_api_cache() after a write the page must reflect.
+    """
+    try:
+        params_key = tuple(sorted(params.items())) if params else ()
+        return True, _cached_get(endpoint, params_key, st.session_state.get("token"))
+    except _UncachedResponse as e:
+        return _handle_response(e.args[0])
+    except requests.exceptions.ConnectionError:
+        return False, "Cannot connect to server"
+    except Exception as e:
+        return False, str(e)
+
+
+def clear_api_cache():
+    """Drop every cached GET, e.g. after creating or approving something."""
+    _cached_get.clear()
+
+
+async def _send_all(calls: list[tuple], headers: dict) -> list:
+    """Send every call on one AsyncClient at once; failures come back as exceptions."""
+    async with httpx.AsyncClient(base_url=API_URL, headers=headers, timeout=30) as client:
+
+        async def send(method: str, endpoint: str, data: dict | None = None, params: dict | None = None):
+            return await client.request(
+                method.upper(),
+                endpoint,
+                json=data if method.upper() in ("POST", "PUT") else None,
+                params=params,
+            )
+
+        return await asyncio.gather(*(send(*call) for call in calls), return_exceptions=True)
+
+
+def api_request_many(calls: list[tuple]) -> list[tuple[bool, dict | str]]:
+    """Make several independent authenticated API requests concurrently.
+
+    Each call is a tuple of api_request's arguments, (method, endpoint[, data[, params]]).
+    Results come back in the same order, so the page waits for the slowest
+    request rather than the sum of all of them.
+    """
+    # Session state is only readable from the script thread, so resolve the
+    # headers here and handle 401s after the batch returns
+    responses = asyncio.run(_send_all(calls, get_auth_header()))
+
+    results = []
+    for response in responses:
+        if isinstance(response, httpx.ConnectError):
+            results.append((False, "Cannot connect to server"))
+        elif isinstance(response, Exception):
+            results.append((False, str(response)))
+        else:
+            try:
+                results.append(_handle_response(response))
+            except Exception as e:
+                results.append((False, str(e)))
+    return results
@@ -1,23 +1,44 @@
 """Chat component for workflow interactions."""
+import pandas as pd
 import streamlit as st
 from typing import Callable, Optional
 
+# Messages drawn per rerun; older ones are shown on request
+CHAT_WINDOW = 50
+
 
 def render_chat_interface(
     messages: list[dict],
     on_send: Callable[[str], None],
     placeholder: str = "Type your message...",
     disabled: bool = False,
+    key: str = "chat",
 ):
     """
     Render a chat interface.
 
+    Only the latest CHAT_WINDOW messages are drawn; a "Load earlier" button
+    extends the window, so a rerun costs the window, not the whole history.
+
     Args:
         messages: List of message dicts with 'role' and 'content' keys
         on_send: Callback function when user sends a message
         placeholder: Input placeholder text
         disabled: Whether the input is disabled
+        key: Session state prefix, unique per chat on a page
     """
+    shown_key = f"{key}_shown"
+    shown = st.session_state.get(shown_key, CHAT_WINDOW)
+    hidden = len(messages) - shown
+    if hidden > 0:
+        st.button(
+            f"Load earlier messages ({hidden} hidden)",
+            key=f"{key}_load_earlier",
+            on_click=_show_more,
+            args=(shown_key, shown + CHAT_WINDOW),
+        )
+        messages = messages[hidden:]
+
     # Display messages
     for message in messages:
         role = message.get("role", "user")
@@ -39,6 +60,11 @@ def render_chat_interface(
             on_send(prompt)
 
 
+def _show_more(shown_key: str, shown: int):
+    """Button callback that widens the chat window before the rerun."""
+    st.session_state[shown_key] = shown
+
+
 def render_approval_interface(
     item_type: str,
     items: list[dict],
@@ -47,6 +73,9 @@ def render_approval_interface(
     """
     Render an approval interface for epics, stories, or specs.
 
+    Items are listed in one data editor with a checkbox column rather than a
+    checkbox and expander per item; details are shown for the checked ones.
+
     Args:
         item_type: Type of items ('epic', 'story', 'spec')
         items: List of items to review
@@ -55,92 +84,111 @@ def render_approval_interface(
     st.markdown(f"### Review {item_type.title()}s")
     st.markdown(f"Please review the following {item_type}s and approve or reject them.")
 
-    # Track selections
-    if f"selected_{item_type}s" not in st.session_state:
-        st.session_state[f"selected_{item_type}s"] = set()
+    # Select all / none reset the editor to a new default by bumping its key;
+    # callbacks run before the rerun, so one click is one rerun
+    state_key = f"approval_{item_type}"
+    select_all = st.session_state.get(f"{state_key}_all", False)
+    version = st.session_state.get(f"{state_key}_version", 0)
 
-    # Select all / none buttons
     col1, col2, col3 = st.columns([1, 1, 4])
     with col1:
-        if st.button("Select All"):
-            st.session_state[f"selected_{item_type}s"] = set(range(len(items)))
-            st.rerun()
+        st.button("Select All", on_click=_set_selection, args=(state_key, True))
     with col2:
-        if st.button("Clear Selection"):
-            st.session_state[f"selected_{item_type}s"] = set()
-            st.rerun()
-
-    st.divider()
-
-    # Display items
-    for i, item in enumerate(items):
-        col1, col2 = st.columns([1, 10])
-
-        with col1:
-            selected = st.checkbox(
-                "Select",
-                key=f"{item_type}_{i}_checkbox",
-                value=i in st.session_state[f"selected_{item_type}s"],
-                label_visibility="collapsed",
-            )
-            if selected:
-                st.session_state[f"selected_{item_type}s"].add(i)
-            elif i in st.session_state[f"selected_{item_type}s"]:
-                st.session_state[f"selected_{item_type}s"].remove(i)
-
-        with col2:
-            with st.expander(f"**{item.get('title', f'{item_type.title()} {i+1}')}**", expanded=i == 0):
-                # Display item details based on type
-                if item_type == "epic":
-                    st.markdown(f"**Goal:** {item.get('goal', 'N/A')}")
-                    st.markdown(f"**Scope:** {item.get('scope', 'N/A')}")
-                    st.markdown(f"**Priority:** {item.get('priority', 'medium')}")
-                    if item.get("dependencies"):
-                        st.markdown(f"**Dependencies:** {item.get('dependencies')}")
-
-                elif item_type == "story":
-                    st.markdown(f"**Description:** {item.get('description', 'N/A')}")
-                    st.markdown(f"**Priority:** {item.get('priority', 'medium')}")
-                    if item.get("story_points"):
-                        st.markdown(f"**Story Points:** {item.get('story_points')}")
-                    if item.get("acceptance_criteria"):
-                        st.markdown("**Acceptance Criteria:**")
-                        for ac in item.get("acceptance_criteria", []):
-                            st.markdown(f"- Given: {ac.get('given', 'N/A')}")
-                            st.markdown(f"  When: {ac.get('when', 'N/A')}")
-                            st.markdown(f"  Then: {ac.get('then', 'N/A')}")
-                    if item.get("edge_cases"):
-                        st.markdown(f"**Edge Cases:** {', '.join(item.get('edge_cases', []))}")
-
-                elif item_type == "spec":
-                    st.markdown(item.get("content", "No content"))
-                    if item.get("api_design"):
-                        st.markdown("**API Design:**")
-                        st.json(item.get("api_design"))
-                    if item.get("data_model"):
-                        st.markdown("**Data Model:**")
-                        st.json(item.get("data_model"))
+        st.button("Clear Selection", on_click=_set_selection, args=(state_key, False))
+
+    table = pd.DataFrame({
+        "select": [select_all] * len(items),
+        "title": [item.get("title", f"{item_type.title()} {i+1}") for i, item in enumerate(items)],
+        "priority": [item.get("priority", "medium") for item in items],
+        "summary": [_summary(item_type, item) for item in items],
+    })
+    edited = st.data_editor(
+        table,
+        key=f"{state_key}_{version}",
+        column_config={
+            "select": st.column_config.CheckboxColumn("Select", width="small"),
+            "title": st.column_config.TextColumn("Title"),
+            "priority": st.column_config.TextColumn("Priority", width="small"),
+            "summary": st.column_config.TextColumn("Summary", width="large"),
+        },
+        disabled=["title", "priority", "summary"],
+        hide_index=True,
+        use_container_width=True,
+    )
+    selected_ids = edited.index[edited["select"]].tolist()
+
+    # Full details only for what is being reviewed right now
+    for i in selected_ids:
+        item = items[i]
+        with st.expander(f"**{item.get('title', f'{item_type.title()} {i+1}')}**"):
+            _render_item_details(item_type, item)
 
     st.divider()
 
     # Approval actions
-    selected_count = len(st.session_state[f"selected_{item_type}s"])
+    selected_count = len(selected_ids)
     st.markdown(f"**{selected_count} item(s) selected**")
 
     col1, col2 = st.columns(2)
 
     with col1:
         if st.button("Approve Selected", type="primary", disabled=selected_count == 0):
-            selected_ids = list(st.session_state[f"selected_{item_type}s"])
             on_approve(selected_ids, True, None)
-            st.session_state[f"selected_{item_type}s"] = set()
 
     with col2:
         feedback = st.text_area("Feedback (for rejection)", key=f"{item_type}_feedback")
         if st.button("Reject Selected", disabled=selected_count == 0):
-            selected_ids = list(st.session_state[f"selected_{item_type}s"])
             on_approve(selected_ids, False, feedback)
-            st.session_state[f"selected_{item_type}s"] = set()
+
+
+def _set_selection(state_key: str, selected: bool):
+    """Button callback that checks or unchecks every row of the approval table."""
+    st.session_state[f"{state_key}_all"] = selected
+    st.session_state[f"{state_key}_version"] = st.session_state.get(f"{state_key}_version", 0) + 1
+
+
+def _summary(item_type: str, item: dict) -> str:
+    """One-line summary for an item's row in the approval table."""
+    if item_type == "epic":
+        text = item.get("goal")
+    elif item_type == "story":
+        text = item.get("description")
+    else:
+        text = item.get("content")
+    return (text or "")[:200]
+
+
+def _render_item_details(item_type: str, item: dict):
+    """Display item details based on type."""
+    if item_type == "epic":
+        st.markdown(f"**Goal:** {item.get('goal', 'N/A')}")
+        st.markdown(f"**Scope:** {item.get('scope', 'N/A')}")
+        st.markdown(f"**Priority:** {item.get('priority', 'medium')}")
+        if item.get("dependencies"):
+            st.markdown(f"**Dependencies:** {item.get('dependencies')}")
+
+    elif item_type == "story":
+        st.markdown(f"**Description:** {item.get('description', 'N/A')}")
+        st.markdown(f"**Priority:** {item.get('priority', 'medium')}")
+        if item.get("story_points"):
+            st.markdown(f"**Story Points:** {item.get('story_points')}")
+        if item.get("acceptance_criteria"):
+            st.markdown("**Acceptance Criteria:**")
+            for ac in item.get("acceptance_criteria", []):
+                st.markdown(f"- Given: {ac.get('given', 'N/A')}")
+                st.markdown(f"  When: {ac.get('when', 'N/A')}")
+                st.markdown(f"  Then: {ac.get('then', 'N/A')}")
+        if item.get("edge_cases"):
+            st.markdown(f"**Edge Cases:** {', '.join(item.get('edge_cases', []))}")
+
+    elif item_type == "spec":
+        st.markdown(item.get("content", "No content"))
+        if item.get("api_design"):
+            st.markdown("**API Design:**")
+            st.json(item.get("api_design"))
+        if item.get("data_model"):
+            st.markdown("**Data Model:**")
+            st.json(item.get("data_model"))
 
 
 def render_progress_indicator(
@@ -161,6 +209,8 @@ def render_progress_indicator(
         current_idx = stages.index(current_stage)
         overall_progress = (current_idx + progress_percent / 100) / len(stages)
     except ValueError:
+        # Unknown stage: nothing counts as done
+        current_idx = -1
         overall_progress = 0
 
     st.progress(overall_progress, text=f"Stage: {current_stage}")
@@ -169,9 +219,9 @@ def render_progress_indicator(
     cols = st.columns(len(stages))
     for i, (col, stage) in enumerate(zip(cols, stages)):
         with col:
-            if stages.index(current_stage) > i:
+            if i < current_idx:
                 st.markdown(f"✅ {stage}")
-            elif stage == current_stage:
+            elif i == current_idx:
                 st.markdown(f"🔄 **{stage}**")
             else:
                 st.markdown(f"⏳ {stage}")
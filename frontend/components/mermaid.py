@@ -1,22 +1,24 @@
 """Mermaid diagram rendering component."""
+import functools
+
 import streamlit as st
 import streamlit.components.v1 as components
 
 
-def render_mermaid(mermaid_code: str, height: int = 400):
-    """
-    Render a Mermaid diagram using JavaScript.
+# Pinned rather than "latest" so browsers can cache the bundle long-term and
+# every diagram iframe reuses that one cached copy
+MERMAID_JS_URL = "https://cdnjs.cloudflare.com/ajax/libs/mermaid/10.9.1/mermaid.min.js"
 
-    Args:
-        mermaid_code: Mermaid diagram code
-        height: Height of the rendered diagram in pixels
-    """
-    # HTML template with Mermaid.js
-    html_template = f"""
+
+@functools.lru_cache(maxsize=256)
+def _mermaid_html(mermaid_code: str) -> str:
+    """Build the iframe document for a diagram; identical diagrams reuse the string."""
+    return f"""
     <!DOCTYPE html>
     <html>
     <head>
-        <script src="https://cdn.jsdelivr.net/npm/mermaid/dist/mermaid.min.js"></script>
+        <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
+        <script src="{MERMAID_JS_URL}" crossorigin="anonymous"></script>
         <style>
             body {{
                 background-color: transparent;
@@ -44,7 +46,16 @@ def render_mermaid(mermaid_code: str, height: int = 400):
     </html>
     """
 
-    components.html(html_template, height=height)
+
+def render_mermaid(mermaid_code: str, height: int = 400):
+    """
+    Render a Mermaid diagram using JavaScript.
+
+    Args:
+        mermaid_code: Mermaid diagram code
+        height: Height of the rendered diagram in pixels
+    """
+    components.html(_mermaid_html(mermaid_code), height=height)
 
 
 def render_mermaid_with_fallback(mermaid_code: str, height: int = 400):
@@ -55,19 +66,37 @@ def render_mermaid_with_fallback(mermaid_code: str, height: int = 400):
         mermaid_code: Mermaid diagram code
         height: Height of the rendered diagram in pixels
     """
+    # Nothing to draw; don't spin up an iframe and the Mermaid bundle for it
+    if not mermaid_code or not mermaid_code.strip():
+        return
+
     tab1, tab2 = st.tabs(["Diagram", "Code"])
 
     with tab1:
         try:
             render_mermaid(mermaid_code, height)
         except Exception as e:
-            st.error(f"Failed to render diagram: {e}")
-            st.code(mermaid_code, language="mermaid")
+            # The source is already in the Code tab; don't highlight it twice
+            st.error(f"Failed to render diagram: {e}. See the Code tab for the source.")
 
     with tab2:
         st.code(mermaid_code, language="mermaid")
 
 
+# Flowchart line templates by node style; unknown styles use the box shape
+_DEFAULT_NODE_TEMPLATE = '    {id}["{label}"]'
+_NODE_TEMPLATES = {
+    "rounded": '    {id}("{label}")',
+    "diamond": '    {id}{{"{label}"}}',
+    "hexagon": _DEFAULT_NODE_TEMPLATE,
+}
+_EDGE_TEMPLATE = "    {src} --> {dst}"
+_LABELLED_EDGE_TEMPLATE = '    {src} -->|"{label}"| {dst}'
+
+
+# The create_* builders are pure functions of their arguments. st.cache_data
+# hashes the argument lists, so reruns with unchanged data reuse the source
+@st.cache_data(show_spinner=False, max_entries=128)
 def create_flowchart(nodes: list[dict], edges: list[dict]) -> str:
     """
     Create a Mermaid flowchart from nodes and edges.
@@ -82,34 +111,28 @@ def create_flowchart(nodes: list[dict], edges: list[dict]) -> str:
     lines = ["graph TD"]
 
     # Add nodes
-    for node in nodes:
-        node_id = node.get("id", "")
-        label = node.get("label", node_id)
-        style = node.get("style", "")
-
-        if style == "rounded":
-            lines.append(f'    {node_id}("{label}")')
-        elif style == "diamond":
-            lines.append(f'    {node_id}{{"{label}"}}')
-        elif style == "hexagon":
-            lines.append(f'    {node_id}["{label}"]')
-        else:
-            lines.append(f'    {node_id}["{label}"]')
+    lines.extend(
+        _NODE_TEMPLATES.get(node.get("style"), _DEFAULT_NODE_TEMPLATE).format(
+            id=node.get("id", ""),
+            label=node.get("label", node.get("id", "")),
+        )
+        for node in nodes
+    )
 
     # Add edges
-    for edge in edges:
-        from_id = edge.get("from", "")
-        to_id = edge.get("to", "")
-        label = edge.get("label", "")
-
-        if label:
-            lines.append(f'    {from_id} -->|"{label}"| {to_id}')
-        else:
-            lines.append(f"    {from_id} --> {to_id}")
+    lines.extend(
+        (_LABELLED_EDGE_TEMPLATE if edge.get("label") else _EDGE_TEMPLATE).format(
+            src=edge.get("from", ""),
+            dst=edge.get("to", ""),
+            label=edge.get("label", ""),
+        )
+        for edge in edges
+    )
 
     return "\n".join(lines)
 
 
+@st.cache_data(show_spinner=False, max_entries=128)
 def create_sequence_diagram(participants: list[str], interactions: list[dict]) -> str:
     """
     Create a Mermaid sequence diagram.
@@ -144,6 +167,7 @@ def create_sequence_diagram(participants: list[str], interactions: list[dict]) -
     return "\n".join(lines)
 
 
+@st.cache_data(show_spinner=False, max_entries=128)
 def create_er_diagram(entities: list[dict]) -> str:
     """
     Create a Mermaid ER diagram.
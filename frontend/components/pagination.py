@@ -0,0 +1,74 @@
+"""Pagination controls for Streamlit list pages."""
+import streamlit as st
+
+
+def render_pager(key: str, page: int, total_pages: int):
+    """
+    Render Prev/Next buttons that step a page number input.
+
+    Args:
+        key: Session state key of the page's st.number_input
+        page: The page currently shown
+        total_pages: Number of pages available
+    """
+    col1, col2, col3 = st.columns([1, 1, 4])
+    with col1:
+        st.button(
+            "← Prev",
+            key=f"{key}_prev",
+            disabled=page <= 1,
+            on_click=_set_page,
+            args=(key, page - 1),
+        )
+    with col2:
+        st.button(
+            "Next →",
+            key=f"{key}_next",
+            disabled=page >= total_pages,
+            on_click=_set_page,
+            args=(key, page + 1),
+        )
+
+
+def _set_page(key: str, page: int):
+    """Button callback; runs before the rerun, so the number input picks it up."""
+    st.session_state[key] = page
+
+
+def page_input(key: str) -> int:
+    """
+    Render the page number input, pulled back within the page count seen last run.
+
+    Args:
+        key: Session state key for the page number
+
+    Returns:
+        The page to load
+    """
+    last_total = st.session_state.get(f"{key}_total_pages")
+    if last_total is not None and st.session_state.get(key, 1) > max(last_total, 1):
+        # Still allowed here: the widget has not been created yet this run
+        st.session_state[key] = max(last_total, 1)
+    return st.number_input("Page", min_value=1, step=1, key=key)
+
+
+def check_page(key: str, page: int, total_pages: int):
+    """
+    Record the page count and rerun if the loaded page is past the end.
+
+    Filters narrowing or items leaving the list can shrink the page count
+    under the current page; the rerun lets page_input clamp it.
+
+    Args:
+        key: Session state key for the page number
+        page: The page that was loaded
+        total_pages: Number of pages the server reported
+    """
+    st.session_state[f"{key}_total_pages"] = total_pages
+    if page > max(total_pages, 1):
+        st.rerun()
+
+
+def reset_page(key: str):
+    """Filter widget callback: go back to the first page."""
+    st.session_state[key] = 1
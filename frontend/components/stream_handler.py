@@ -1,16 +1,40 @@
 """SSE stream handler for real-time updates."""
 import json
 import threading
+from collections import deque
 from dataclasses import dataclass
-from queue import Queue
 from typing import Callable, Optional
 
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # Parses and encodes event payloads faster than json
+except ImportError:
+    orjson = None
+
+# Both accept bytes, so lines are never decoded to str first
+_loads = orjson.loads if orjson is not None else json.loads
+_DecodeError = orjson.JSONDecodeError if orjson is not None else json.JSONDecodeError
+
+# Bytes of an event's payload shown in the event log
+_LOG_PAYLOAD_LIMIT = 500
 
 # API base URL
 API_URL = "http://localhost:8000/api/v1"
 
+# Shared by every listener thread so new streams reuse open connections.
+# No retries: a dropped stream is reported as an error event instead
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0))
+
+# Seconds between stream polls while a run is being monitored. Events that
+# arrive in between are drawn together, so the UI redraws at most this often
+# however fast the backend emits
+STREAM_POLL_INTERVAL = 0.1
+
 
 @dataclass
 class SSEEvent:
@@ -26,7 +50,10 @@ class StreamHandler:
     def __init__(self, run_id: int, token: str):
         self.run_id = run_id
         self.token = token
-        self.event_queue: Queue = Queue()
+        # One producer (the listener thread) and one consumer that drains
+        # everything at once, so a locked deque is all that's needed
+        self._events: deque[SSEEvent] = deque()
+        self._events_lock = threading.Lock()
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
 
@@ -42,6 +69,10 @@ class StreamHandler:
         if self._thread:
             self._thread.join(timeout=5)
 
+    def is_running(self) -> bool:
+        """Whether the listener thread is still reading the stream."""
+        return self._thread is not None and self._thread.is_alive()
+
     def _listen(self):
         """Listen to SSE events in background thread."""
         url = f"{API_URL}/stream/{self.run_id}"
@@ -51,38 +82,69 @@ class StreamHandler:
         }
 
         try:
-            with requests.get(url, headers=headers, stream=True, timeout=300) as response:
-                for line in response.iter_lines():
+            with _SESSION.get(url, headers=headers, stream=True, timeout=300) as response:
+                # chunk_size=None hands over data as soon as it arrives instead of
+                # waiting to fill a fixed-size read, so events are never held back
+                data_lines: list[bytes] = []
+                for line in response.iter_lines(chunk_size=None):
                     if self._stop_event.is_set():
                         break
 
-                    if line:
-                        line = line.decode("utf-8")
-                        if line.startswith("data:"):
-                            data_str = line[5:].strip()
-                            try:
-                                event_data = json.loads(data_str)
-                                event = SSEEvent(
-                                    event_type=event_data.get("type", "unknown"),
-                                    data=event_data.get("data", {}),
-                                    timestamp=event_data.get("timestamp", ""),
-                                )
-                                self.event_queue.put(event)
-                            except json.JSONDecodeError:
-                                pass
+                    if line.startswith(b"data:"):
+                        # An event's payload may span several data: lines
+                        data_lines.append(line[5:])
+                    elif not line and data_lines:
+                        # A blank line ends the event
+                        self._dispatch(b"\n".join(data_lines))
+                        data_lines.clear()
         except Exception as e:
-            self.event_queue.put(SSEEvent(
+            self._put(SSEEvent(
                 event_type="error",
                 data={"error": str(e)},
                 timestamp="",
             ))
 
+    def _dispatch(self, payload: bytes):
+        """Parse one event's data payload and queue it; malformed events are skipped."""
+        try:
+            event_data = _loads(payload)
+        except _DecodeError:
+            return
+        self._put(SSEEvent(
+            event_type=event_data.get("type", "unknown"),
+            data=event_data.get("data", {}),
+            timestamp=event_data.get("timestamp", ""),
+        ))
+
+    def _put(self, event: SSEEvent):
+        with self._events_lock:
+            self._events.append(event)
+
     def get_events(self) -> list[SSEEvent]:
-        """Get all pending events from the queue."""
-        events = []
-        while not self.event_queue.empty():
-            events.append(self.event_queue.get_nowait())
-        return events
+        """Get all pending events, taking the lock once for the whole batch."""
+        with self._events_lock:
+            events, self._events = self._events, deque()
+        return list(events)
+
+
+def get_stream_handler(run_id: int) -> StreamHandler:
+    """Get this session's listener for a run, starting it on first use.
+
+    The handler lives in session state, so every rerun, fragment poll and
+    page of the session reuses one stream, while other sessions and tabs
+    get their own and never drain each other's events. A new login gets a
+    new handler, since the old one streams with the old token.
+    """
+    stream_key = f"stream_handler_{run_id}"
+    token = st.session_state.get("token", "")
+    handler = st.session_state.get(stream_key)
+    if handler is None or handler.token != token:
+        if handler is not None:
+            handler.stop()
+        handler = StreamHandler(run_id, token)
+        handler.start()
+        st.session_state[stream_key] = handler
+    return handler
 
 
 def render_stream_status(
@@ -95,86 +157,152 @@ def render_stream_status(
     Args:
         run_id: The run ID to stream
         on_event: Optional callback for each event
-    """
-    # Initialize stream handler in session state
-    stream_key = f"stream_handler_{run_id}"
 
-    if stream_key not in st.session_state:
-        token = st.session_state.get("token", "")
-        handler = StreamHandler(run_id, token)
-        handler.start()
-        st.session_state[stream_key] = handler
-
-    handler = st.session_state[stream_key]
-
-    # Create placeholders
-    status_placeholder = st.empty()
-    progress_placeholder = st.empty()
-    message_placeholder = st.empty()
+    Returns:
+        True once the run has completed or failed and the stream was stopped
+    """
+    handler = get_stream_handler(run_id)
 
-    # Process events
+    # Process events. A burst can hold many updates for the same placeholder,
+    # so keep only the last event for each one. The view outlives the rerun
+    # so polls that bring no new events still show the latest state
+    view_key = f"stream_view_{run_id}"
+    view = st.session_state.setdefault(view_key, {})
     events = handler.get_events()
+    status_event = progress_event = message_event = None
+    should_stop = False
+    event_log = _event_log()
 
     for event in events:
+        event_log.append(_log_line(event))
         if on_event:
             on_event(event)
 
-        # Update UI based on event type
-        if event.event_type == "stage_update":
-            status_placeholder.info(
-                f"Stage: {event.data.get('stage', 'Unknown')} - "
-                f"{event.data.get('message', '')}"
-            )
-            progress = event.data.get("progress", 0)
-            if progress:
-                progress_placeholder.progress(progress / 100)
-
-        elif event.event_type == "progress":
-            current = event.data.get("current", 0)
-            total = event.data.get("total", 1)
-            message = event.data.get("message", "")
-            progress_placeholder.progress(
-                current / total,
-                text=f"{message} ({current}/{total})"
-            )
-
-        elif event.event_type == "completion":
-            success = event.data.get("success", False)
-            message = event.data.get("message", "")
-            if success:
-                status_placeholder.success(f"Completed: {message}")
-            else:
-                status_placeholder.error(f"Failed: {message}")
-            handler.stop()
-
-        elif event.event_type == "error":
-            error = event.data.get("error", "Unknown error")
-            status_placeholder.error(f"Error: {error}")
-            if not event.data.get("recoverable", False):
-                handler.stop()
-
-        elif event.event_type == "approval_required":
-            stage = event.data.get("stage", "")
-            artifact_type = event.data.get("artifact_type", "")
-            message = event.data.get("message", "")
-            status_placeholder.warning(f"Approval Required: {message}")
-            message_placeholder.info(
-                f"Please review the {artifact_type}s and approve or reject them."
-            )
+        event_type = event.event_type
+        if event_type in _STATUS_EVENTS:
+            status_event = event
+        if event_type == "progress" or (event_type == "stage_update" and event.data.get("progress")):
+            progress_event = event
+        if event_type in _MESSAGE_EVENTS:
+            message_event = event
+        if event_type == "completion" or (
+            event_type == "error" and not event.data.get("recoverable", False)
+        ):
+            should_stop = True
+
+    if status_event:
+        view["status"] = status_event
+    if progress_event:
+        view["progress"] = progress_event
+    if message_event:
+        view["message"] = message_event
+
+    if "status" in view:
+        _render_status(st.empty(), view["status"])
+    if "progress" in view:
+        _render_progress(st.empty(), view["progress"])
+    if "message" in view:
+        _render_message(st.empty(), view["message"])
+    if should_stop:
+        handler.stop()
 
-        elif event.event_type == "artifact_created":
-            artifact_type = event.data.get("artifact_type", "")
-            summary = event.data.get("summary", "")
-            message_placeholder.info(f"Created {artifact_type}: {summary}")
+    return should_stop
+
+
+def _event_log() -> deque:
+    """Recent event log lines for the monitor; the deque drops the oldest past 20."""
+    if "event_log" not in st.session_state:
+        st.session_state.event_log = deque(maxlen=20)
+    return st.session_state.event_log
+
+
+def _log_line(event: SSEEvent) -> str:
+    """Format an event for the log once, with its payload as truncated JSON."""
+    if orjson is not None:
+        payload = orjson.dumps(event.data, default=str)
+    else:
+        payload = json.dumps(event.data, default=str, separators=(",", ":")).encode()
+    # Dropping a multi-byte character split by the cut beats showing a mangled one
+    text = payload[:_LOG_PAYLOAD_LIMIT].decode("utf-8", "ignore")
+    return f"[{event.timestamp}] {event.event_type}: {text}"
+
+
+# Event types that write to each render_stream_status placeholder
+_STATUS_EVENTS = frozenset({"stage_update", "completion", "error", "approval_required"})
+_MESSAGE_EVENTS = frozenset({"approval_required", "artifact_created"})
+
+
+def _render_status(placeholder, event: SSEEvent):
+    """Show the status line for a stage, completion, error or approval event."""
+    if event.event_type == "stage_update":
+        placeholder.info(
+            f"Stage: {event.data.get('stage', 'Unknown')} - "
+            f"{event.data.get('message', '')}"
+        )
+
+    elif event.event_type == "completion":
+        success = event.data.get("success", False)
+        message = event.data.get("message", "")
+        if success:
+            placeholder.success(f"Completed: {message}")
+        else:
+            placeholder.error(f"Failed: {message}")
+
+    elif event.event_type == "error":
+        error = event.data.get("error", "Unknown error")
+        placeholder.error(f"Error: {error}")
+
+    elif event.event_type == "approval_required":
+        message = event.data.get("message", "")
+        placeholder.warning(f"Approval Required: {message}")
+
+
+def _render_progress(placeholder, event: SSEEvent):
+    """Show the progress bar for a stage or progress event."""
+    if event.event_type == "stage_update":
+        placeholder.progress(event.data["progress"] / 100)
+    else:
+        current = event.data.get("current", 0)
+        total = event.data.get("total", 1)
+        message = event.data.get("message", "")
+        placeholder.progress(
+            current / total,
+            text=f"{message} ({current}/{total})"
+        )
+
+
+def _render_message(placeholder, event: SSEEvent):
+    """Show the detail message for an approval or artifact event."""
+    artifact_type = event.data.get("artifact_type", "")
+    if event.event_type == "approval_required":
+        placeholder.info(
+            f"Please review the {artifact_type}s and approve or reject them."
+        )
+    else:
+        summary = event.data.get("summary", "")
+        placeholder.info(f"Created {artifact_type}: {summary}")
 
 
 def cleanup_stream(run_id: int):
     """Clean up stream handler for a run."""
     stream_key = f"stream_handler_{run_id}"
     if stream_key in st.session_state:
-        handler = st.session_state[stream_key]
+        handler = st.session_state.pop(stream_key)
         handler.stop()
-        del st.session_state[stream_key]
+    st.session_state.pop(f"stream_view_{run_id}", None)
+
+
+def _render_stream_panel(run_id: int):
+    """Stream status and event log, redrawn on every poll."""
+    if render_stream_status(run_id):
+        # Completion and fatal errors rerun the whole page straight away,
+        # which also turns polling off
+        st.rerun()
+
+    # Event log
+    with st.expander("Event Log"):
+        for line in _event_log():
+            st.text(line)
 
 
 def render_workflow_monitor(run_id: int):
@@ -186,16 +314,9 @@ def render_workflow_monitor(run_id: int):
     """
     st.markdown("### Workflow Progress")
 
-    # Stream status
-    render_stream_status(run_id)
-
-    # Event log
-    with st.expander("Event Log"):
-        if "event_log" not in st.session_state:
-            st.session_state.event_log = []
-
-        for event in st.session_state.event_log[-20:]:  # Show last 20 events
-            st.text(f"[{event.timestamp}] {event.event_type}: {event.data}")
+    # Poll only while the stream is open; each poll reruns just the fragment
+    live = get_stream_handler(run_id).is_running()
+    st.fragment(_render_stream_panel, run_every=STREAM_POLL_INTERVAL if live else None)(run_id)
 
     # Controls
     col1, col2 = st.columns(2)
@@ -1,7 +1,7 @@
 """Projects page for Streamlit."""
 import streamlit as st
 
-from components.auth import api_request, check_authentication
+from components.auth import api_request, cached_api_request, check_authentication, clear_api_cache
 
 st.set_page_config(page_title="Projects", page_icon="📁", layout="wide")
 
@@ -11,10 +11,17 @@ if not check_authentication():
 
 st.markdown("## Projects")
 
+_PROJECT_STATUS_BADGES = {
+    "draft": "⚪ Draft",
+    "in_progress": "🔄 In Progress",
+    "completed": "✅ Completed",
+    "failed": "❌ Failed",
+}
+
 
 def load_projects():
     """Load projects from API."""
-    success, result = api_request("GET", "/projects")
+    success, result = cached_api_request("/projects")
     if success:
         return result.get("items", [])
     else:
@@ -30,6 +37,7 @@ def create_project(name: str, product_request: str):
         data={"name": name, "product_request": product_request},
     )
     if success:
+        clear_api_cache()
         st.success("Project created successfully!")
         return result
     else:
@@ -44,6 +52,7 @@ def start_workflow(project_id: int, constraints: str = None):
         f"/projects/{project_id}/runs",
     )
     if success:
+        clear_api_cache()
         st.success("Workflow started!")
         return result
     else:
@@ -94,15 +103,9 @@ else:
                 st.caption(f"ID: {project['id']} | Status: {project['status']}")
 
             with col2:
-                status = project["status"]
-                if status == "draft":
-                    st.markdown("⚪ Draft")
-                elif status == "in_progress":
-                    st.markdown("🔄 In Progress")
-                elif status == "completed":
-                    st.markdown("✅ Completed")
-                elif status == "failed":
-                    st.markdown("❌ Failed")
+                badge = _PROJECT_STATUS_BADGES.get(project["status"])
+                if badge:
+                    st.markdown(badge)
 
             with col3:
                 if st.button("View", key=f"view_{project['id']}"):
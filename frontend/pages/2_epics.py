@@ -1,7 +1,7 @@
 """Epics page for Streamlit."""
 import streamlit as st
 
-from components.auth import api_request, check_authentication
+from components.auth import api_request, cached_api_request, check_authentication, clear_api_cache
 from components.chat import render_approval_interface
 from components.mermaid import render_mermaid_with_fallback
 
@@ -13,6 +13,13 @@ if not check_authentication():
 
 st.markdown("## Epics")
 
+_EPIC_STATUS_ICONS = {
+    "draft": "⚪",
+    "pending_review": "🔔",
+    "approved": "✅",
+    "rejected": "❌",
+}
+
 
 def load_epics(project_id: int = None):
     """Load epics from API."""
@@ -20,7 +27,7 @@ def load_epics(project_id: int = None):
     if project_id:
         params["project_id"] = project_id
 
-    success, result = api_request("GET", "/epics", params=params)
+    success, result = cached_api_request("/epics", params=params)
     if success:
         return result.get("items", [])
     return []
@@ -34,6 +41,8 @@ def approve_epic(epic_id: int, approved: bool, feedback: str = None):
         data={"approved": approved, "feedback": feedback},
     )
     if success:
+        clear_api_cache()
+        get_dependency_graph.clear()
         st.success("Epic updated!")
         return result
     else:
@@ -41,26 +50,41 @@ def approve_epic(epic_id: int, approved: bool, feedback: str = None):
         return None
 
 
-def get_dependency_graph(project_id: int):
-    """Get epic dependency graph."""
+@st.cache_data(ttl=60, show_spinner=False)
+def get_dependency_graph(project_id: int, token: str | None):
+    """Get epic dependency graph.
+
+    The token is only part of the cache key, so one user's graph is never
+    served to another.
+    """
     success, result = api_request("GET", f"/epics/project/{project_id}/dependency-graph")
     if success:
         return result
     return None
 
 
+@st.fragment
+def render_dependency_graph(project_id: int):
+    """Draw the dependency graph expander; its toggle reruns only this fragment."""
+    with st.expander("Dependency Graph"):
+        # Expander bodies run even while collapsed, so fetch and draw only on request
+        if st.toggle("Show dependency graph", key=f"dep_graph_open_{project_id}"):
+            graph_data = get_dependency_graph(project_id, st.session_state.get("token"))
+            if graph_data and graph_data.get("mermaid"):
+                render_mermaid_with_fallback(graph_data["mermaid"])
+            else:
+                st.info("No dependency graph available")
+
+
 # Sidebar filters
 with st.sidebar:
     st.markdown("### Filters")
 
     # Project filter
-    success, projects = api_request("GET", "/projects")
-    project_options = ["All Projects"]
-    project_map = {}
-    if success:
-        for p in projects.get("items", []):
-            project_options.append(p["name"])
-            project_map[p["name"]] = p["id"]
+    success, projects = cached_api_request("/projects")
+    project_labels = [(p["name"], p["id"]) for p in projects.get("items", [])] if success else []
+    project_map = dict(project_labels)
+    project_options = ["All Projects", *(label for label, _ in project_labels)]
 
     selected_project = st.selectbox("Project", project_options)
     project_id = project_map.get(selected_project)
@@ -79,12 +103,7 @@ if status_filter != "All":
 
 # Display dependency graph if project selected
 if project_id:
-    with st.expander("Dependency Graph"):
-        graph_data = get_dependency_graph(project_id)
-        if graph_data and graph_data.get("mermaid"):
-            render_mermaid_with_fallback(graph_data["mermaid"])
-        else:
-            st.info("No dependency graph available")
+    render_dependency_graph(project_id)
 
 st.divider()
 
@@ -94,9 +113,22 @@ if pending_epics:
     st.markdown("### Pending Approval")
 
     def handle_approval(item_ids, approved, feedback):
-        for idx in item_ids:
-            epic = pending_epics[idx]
-            approve_epic(epic["id"], approved, feedback)
+        # One request for the whole selection instead of one per epic
+        success, result = api_request(
+            "POST",
+            "/epics/bulk-approve",
+            data={
+                "ids": [pending_epics[idx]["id"] for idx in item_ids],
+                "approved": approved,
+                "feedback": feedback,
+            },
+        )
+        if success:
+            clear_api_cache()
+            get_dependency_graph.clear()
+            st.success(f"{len(result)} epics updated!")
+        else:
+            st.error(result)
         st.rerun()
 
     render_approval_interface("epic", pending_epics, handle_approval)
@@ -114,12 +146,7 @@ else:
             col1, col2 = st.columns([4, 1])
 
             with col1:
-                status_icon = {
-                    "draft": "⚪",
-                    "pending_review": "🔔",
-                    "approved": "✅",
-                    "rejected": "❌",
-                }.get(epic.get("status", "draft"), "⚪")
+                status_icon = _EPIC_STATUS_ICONS.get(epic.get("status", "draft"), "⚪")
 
                 st.markdown(f"### {status_icon} {epic['title']}")
 
@@ -135,8 +162,9 @@ else:
                         st.warning(f"**Feedback:** {epic['feedback']}")
 
                     if epic.get("mermaid_diagram"):
-                        st.markdown("**Diagram:**")
-                        render_mermaid_with_fallback(epic["mermaid_diagram"], height=200)
+                        # Each diagram is an iframe loading Mermaid; only build the ones asked for
+                        if st.toggle("Show diagram", key=f"epic_diag_open_{epic['id']}"):
+                            render_mermaid_with_fallback(epic["mermaid_diagram"], height=200)
 
             with col2:
                 st.markdown(f"**v{epic.get('version', 1)}**")
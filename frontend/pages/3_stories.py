@@ -1,8 +1,10 @@
 """Stories page for Streamlit."""
+import pandas as pd
 import streamlit as st
 
-from components.auth import api_request, check_authentication
+from components.auth import api_request, cached_api_request, check_authentication, clear_api_cache
 from components.chat import render_approval_interface
+from components.pagination import check_page, page_input, render_pager, reset_page
 
 st.set_page_config(page_title="Stories", page_icon="📖", layout="wide")
 
@@ -12,17 +14,41 @@ if not check_authentication():
 
 st.markdown("## User Stories")
 
+_STORY_STATUS_ICONS = {
+    "draft": "⚪",
+    "pending_review": "🔔",
+    "approved": "✅",
+    "rejected": "❌",
+}
 
-def load_stories(epic_id: int = None):
-    """Load stories from API."""
-    params = {}
+# Items per page; also caps how many item widgets a rerun builds
+PAGE_SIZE = 25
+
+
+def load_stories(epic_id: int = None, status: str = None, page: int = 1):
+    """Load one page of stories from the API, filtered server-side."""
+    params = {"page": page, "page_size": PAGE_SIZE}
     if epic_id:
         params["epic_id"] = epic_id
+    if status:
+        params["status_filter"] = status
 
-    success, result = api_request("GET", "/stories", params=params)
+    success, result = cached_api_request("/stories", params=params)
     if success:
-        return result.get("items", [])
-    return []
+        return result
+    return {"items": [], "total": 0, "total_pages": 0}
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_epic_options(token: str | None) -> list[tuple[str, int]]:
+    """(label, id) pairs for the epic filter; these change rarely, so keep them 5 min.
+
+    Raises RuntimeError on failure so an error is not cached.
+    """
+    success, result = api_request("GET", "/epics")
+    if not success:
+        raise RuntimeError(result)
+    return [(e["title"][:50], e["id"]) for e in result.get("items", [])]
 
 
 def approve_story(story_id: int, approved: bool, feedback: str = None):
@@ -33,6 +59,7 @@ def approve_story(story_id: int, approved: bool, feedback: str = None):
         data={"approved": approved, "feedback": feedback},
     )
     if success:
+        clear_api_cache()
         st.success("Story updated!")
         return result
     else:
@@ -40,83 +67,126 @@ def approve_story(story_id: int, approved: bool, feedback: str = None):
         return None
 
 
+def bulk_approve_stories(story_ids: list[int], approved: bool, feedback: str = None):
+    """Approve or reject several stories in one request."""
+    success, result = api_request(
+        "POST",
+        "/stories/bulk-approve",
+        data={"ids": story_ids, "approved": approved, "feedback": feedback},
+    )
+    if success:
+        clear_api_cache()
+        st.success(f"{len(result)} stories updated!")
+        return result
+    else:
+        st.error(result)
+        return None
+
+
 # Sidebar filters
 with st.sidebar:
     st.markdown("### Filters")
 
-    # Epic filter
-    success, epics_data = api_request("GET", "/epics")
-    epic_options = ["All Epics"]
-    epic_map = {}
-    if success:
-        for e in epics_data.get("items", []):
-            epic_options.append(e["title"][:50])
-            epic_map[e["title"][:50]] = e["id"]
+    st.button("↻ Refresh filters", on_click=load_epic_options.clear)
 
-    selected_epic = st.selectbox("Epic", epic_options)
+    # Epic filter
+    try:
+        epic_labels = load_epic_options(st.session_state.get("token"))
+    except RuntimeError:
+        epic_labels = []
+    epic_map = dict(epic_labels)
+    epic_options = ["All Epics", *(label for label, _ in epic_labels)]
+
+    selected_epic = st.selectbox("Epic", epic_options, on_change=reset_page, args=("story_page",))
     epic_id = epic_map.get(selected_epic)
 
     # Status filter
     status_filter = st.selectbox(
         "Status",
         ["All", "draft", "pending_review", "approved", "rejected"],
+        on_change=reset_page,
+        args=("story_page",),
     )
 
-# Load stories
-stories = load_stories(epic_id)
+    page = page_input("story_page")
 
-if status_filter != "All":
-    stories = [s for s in stories if s.get("status") == status_filter]
+# Load stories
+stories_page = load_stories(epic_id, None if status_filter == "All" else status_filter, page)
+check_page("story_page", page, stories_page["total_pages"])
+stories = stories_page["items"]
+
+# One frame for the page; filters and counts below are column operations on it.
+# Row i of the frame is stories[i], so masks map back to the original dicts.
+frame = pd.DataFrame(stories).reindex(
+    columns=["title", "status", "priority", "story_points", "version"]
+)
+story_status = frame["status"].fillna("draft")
+pending_mask = story_status == "pending_review"
 
 # Pending approval section
-pending_stories = [s for s in stories if s.get("status") == "pending_review"]
+pending_stories = [stories[i] for i in pending_mask.to_numpy().nonzero()[0]]
 if pending_stories:
     st.markdown("### Pending Approval")
 
     def handle_approval(item_ids, approved, feedback):
-        for idx in item_ids:
-            story = pending_stories[idx]
-            approve_story(story["id"], approved, feedback)
+        bulk_approve_stories([pending_stories[idx]["id"] for idx in item_ids], approved, feedback)
         st.rerun()
 
     render_approval_interface("story", pending_stories, handle_approval)
 
     st.divider()
 
-# Summary statistics
+# Summary statistics; only the total covers every page
 if stories:
+    status_counts = story_status.value_counts()
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Stories", len(stories))
+        st.metric("Total Stories", stories_page["total"])
     with col2:
-        approved_count = len([s for s in stories if s.get("status") == "approved"])
-        st.metric("Approved", approved_count)
+        st.metric("Approved on Page", int(status_counts.get("approved", 0)))
     with col3:
-        total_points = sum(s.get("story_points", 0) or 0 for s in stories)
-        st.metric("Total Points", total_points)
+        st.metric("Points on Page", int(frame["story_points"].fillna(0).sum()))
     with col4:
-        pending_count = len([s for s in stories if s.get("status") == "pending_review"])
-        st.metric("Pending", pending_count)
+        st.metric("Pending on Page", int(pending_mask.sum()))
 
 st.divider()
 
 # All stories list
 st.markdown("### All Stories")
+st.caption(
+    f"Page {page} of {max(stories_page['total_pages'], 1)} · {stories_page['total']} stories"
+)
 
 if not stories:
     st.info("No stories found. Generate stories from approved epics.")
 else:
-    for story in stories:
+    # One table widget for the whole page; the full view with its expanders
+    # and buttons is only built for the selected rows
+    table = pd.DataFrame({
+        "Status": story_status.map(_STORY_STATUS_ICONS).fillna("⚪") + " " + story_status,
+        "Title": frame["title"],
+        "Priority": frame["priority"].fillna("medium"),
+        "Points": frame["story_points"],
+        "Version": frame["version"].fillna(1).astype(int),
+    })
+    selection = st.dataframe(
+        table,
+        key="stories_table",
+        hide_index=True,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="multi-row",
+    )
+    selected = [stories[i] for i in selection.selection.rows if i < len(stories)]
+    if not selected:
+        st.caption("Select stories in the table to see their details.")
+
+    for story in selected:
         with st.container():
             col1, col2 = st.columns([4, 1])
 
             with col1:
-                status_icon = {
-                    "draft": "⚪",
-                    "pending_review": "🔔",
-                    "approved": "✅",
-                    "rejected": "❌",
-                }.get(story.get("status", "draft"), "⚪")
+                status_icon = _STORY_STATUS_ICONS.get(story.get("status", "draft"), "⚪")
 
                 st.markdown(f"### {status_icon} {story['title']}")
 
@@ -167,3 +237,6 @@ else:
                             st.rerun()
 
             st.divider()
+
+# Drawn for empty pages too, so there is always a way back
+render_pager("story_page", page, stories_page["total_pages"])
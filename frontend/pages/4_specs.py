@@ -1,9 +1,11 @@
 """Specs page for Streamlit."""
+import pandas as pd
 import streamlit as st
 
-from components.auth import api_request, check_authentication
+from components.auth import api_request, cached_api_request, check_authentication, clear_api_cache
 from components.chat import render_approval_interface
 from components.mermaid import render_mermaid_with_fallback
+from components.pagination import check_page, page_input, render_pager, reset_page
 
 st.set_page_config(page_title="Specs", page_icon="📝", layout="wide")
 
@@ -13,17 +15,51 @@ if not check_authentication():
 
 st.markdown("## Technical Specifications")
 
+_SPEC_STATUS_ICONS = {
+    "draft": "⚪",
+    "pending_review": "🔔",
+    "approved": "✅",
+    "rejected": "❌",
+}
 
-def load_specs(story_id: int = None):
-    """Load specs from API."""
-    params = {}
+_METHOD_ICONS = {
+    "GET": "🟢",
+    "POST": "🔵",
+    "PUT": "🟡",
+    "DELETE": "🔴",
+}
+
+# Sections of a spec's detail view
+_SPEC_SECTIONS = ["Content", "API Design", "Data Model", "Security", "Diagrams"]
+
+# Items per page; also caps how many item widgets a rerun builds
+PAGE_SIZE = 25
+
+
+def load_specs(story_id: int = None, status: str = None, page: int = 1):
+    """Load one page of specs from the API, filtered server-side."""
+    params = {"page": page, "page_size": PAGE_SIZE}
     if story_id:
         params["story_id"] = story_id
+    if status:
+        params["status_filter"] = status
 
-    success, result = api_request("GET", "/specs", params=params)
+    success, result = cached_api_request("/specs", params=params)
     if success:
-        return result.get("items", [])
-    return []
+        return result
+    return {"items": [], "total": 0, "total_pages": 0}
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_story_options(token: str | None) -> list[tuple[str, int]]:
+    """(label, id) pairs for the story filter; these change rarely, so keep them 5 min.
+
+    Raises RuntimeError on failure so an error is not cached.
+    """
+    success, result = api_request("GET", "/stories")
+    if not success:
+        raise RuntimeError(result)
+    return [(s["title"][:50], s["id"]) for s in result.get("items", [])]
 
 
 def approve_spec(spec_id: int, approved: bool, feedback: str = None):
@@ -34,6 +70,7 @@ def approve_spec(spec_id: int, approved: bool, feedback: str = None):
         data={"approved": approved, "feedback": feedback},
     )
     if success:
+        clear_api_cache()
         st.success("Spec updated!")
         return result
     else:
@@ -43,39 +80,59 @@ def approve_spec(spec_id: int, approved: bool, feedback: str = None):
 
 def get_spec_diagrams(spec_id: int):
     """Get diagrams for a spec."""
-    success, result = api_request("GET", f"/specs/{spec_id}/diagrams")
+    success, result = cached_api_request(f"/specs/{spec_id}/diagrams")
     if success:
         return result.get("diagrams", {})
     return {}
 
 
+def bulk_approve_specs(spec_ids: list[int], approved: bool, feedback: str = None):
+    """Approve or reject several specs in one request."""
+    success, result = api_request(
+        "POST",
+        "/specs/bulk-approve",
+        data={"ids": spec_ids, "approved": approved, "feedback": feedback},
+    )
+    if success:
+        clear_api_cache()
+        st.success(f"{len(result)} specs updated!")
+        return result
+    else:
+        st.error(result)
+        return None
+
+
 # Sidebar filters
 with st.sidebar:
     st.markdown("### Filters")
 
-    # Story filter
-    success, stories_data = api_request("GET", "/stories")
-    story_options = ["All Stories"]
-    story_map = {}
-    if success:
-        for s in stories_data.get("items", []):
-            story_options.append(s["title"][:50])
-            story_map[s["title"][:50]] = s["id"]
+    st.button("↻ Refresh filters", on_click=load_story_options.clear)
 
-    selected_story = st.selectbox("Story", story_options)
+    # Story filter
+    try:
+        story_labels = load_story_options(st.session_state.get("token"))
+    except RuntimeError:
+        story_labels = []
+    story_map = dict(story_labels)
+    story_options = ["All Stories", *(label for label, _ in story_labels)]
+
+    selected_story = st.selectbox("Story", story_options, on_change=reset_page, args=("spec_page",))
     story_id = story_map.get(selected_story)
 
     # Status filter
     status_filter = st.selectbox(
         "Status",
         ["All", "draft", "pending_review", "approved", "rejected"],
+        on_change=reset_page,
+        args=("spec_page",),
     )
 
-# Load specs
-specs = load_specs(story_id)
+    page = page_input("spec_page")
 
-if status_filter != "All":
-    specs = [s for s in specs if s.get("status") == status_filter]
+# Load specs
+specs_page = load_specs(story_id, None if status_filter == "All" else status_filter, page)
+check_page("spec_page", page, specs_page["total_pages"])
+specs = specs_page["items"]
 
 # Pending approval section
 pending_specs = [s for s in specs if s.get("status") == "pending_review"]
@@ -83,9 +140,7 @@ if pending_specs:
     st.markdown("### Pending Approval")
 
     def handle_approval(item_ids, approved, feedback):
-        for idx in item_ids:
-            spec = pending_specs[idx]
-            approve_spec(spec["id"], approved, feedback)
+        bulk_approve_specs([pending_specs[idx]["id"] for idx in item_ids], approved, feedback)
         st.rerun()
 
     render_approval_interface("spec", pending_specs, handle_approval)
@@ -94,18 +149,39 @@ if pending_specs:
 
 # All specs list
 st.markdown("### All Specifications")
+st.caption(
+    f"Page {page} of {max(specs_page['total_pages'], 1)} · {specs_page['total']} specs"
+)
 
 if not specs:
     st.info("No specifications found. Generate specs from approved stories.")
 else:
-    for spec in specs:
+    # One table widget for the whole page; the full view with its tabs is
+    # only built for the selected rows
+    table = pd.DataFrame({
+        "Status": [
+            f"{_SPEC_STATUS_ICONS.get(s.get('status', 'draft'), '⚪')} {s.get('status', 'draft')}"
+            for s in specs
+        ],
+        "Spec": [f"Spec #{s['id']}" for s in specs],
+        "Story": [s.get("story_id") for s in specs],
+        "Version": [s.get("version", 1) for s in specs],
+    })
+    selection = st.dataframe(
+        table,
+        key="specs_table",
+        hide_index=True,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="multi-row",
+    )
+    selected = [specs[i] for i in selection.selection.rows if i < len(specs)]
+    if not selected:
+        st.caption("Select specs in the table to see their details.")
+
+    for spec in selected:
         with st.container():
-            status_icon = {
-                "draft": "⚪",
-                "pending_review": "🔔",
-                "approved": "✅",
-                "rejected": "❌",
-            }.get(spec.get("status", "draft"), "⚪")
+            status_icon = _SPEC_STATUS_ICONS.get(spec.get("status", "draft"), "⚪")
 
             col1, col2 = st.columns([5, 1])
 
@@ -116,19 +192,24 @@ else:
                 st.markdown(f"**v{spec.get('version', 1)}**")
                 st.caption(spec.get("status", "draft"))
 
-            # Tabs for different spec sections
-            tab1, tab2, tab3, tab4, tab5 = st.tabs([
-                "Content", "API Design", "Data Model", "Security", "Diagrams"
-            ])
-
-            with tab1:
+            # st.tabs runs every tab's body, Mermaid iframes included; a radio
+            # picks one section and only that one is built
+            view = st.radio(
+                "Section",
+                _SPEC_SECTIONS,
+                key=f"spec_view_{spec['id']}",
+                horizontal=True,
+                label_visibility="collapsed",
+            )
+
+            if view == "Content":
                 st.markdown(spec.get("content", "No content available"))
 
                 if spec.get("requirements"):
                     with st.expander("Requirements"):
                         st.json(spec["requirements"])
 
-            with tab2:
+            elif view == "API Design":
                 api_design = spec.get("api_design", {})
                 if api_design:
                     endpoints = api_design.get("endpoints", [])
@@ -138,12 +219,7 @@ else:
                             path = ep.get("path", "/")
                             desc = ep.get("description", "")
 
-                            method_color = {
-                                "GET": "🟢",
-                                "POST": "🔵",
-                                "PUT": "🟡",
-                                "DELETE": "🔴",
-                            }.get(method, "⚪")
+                            method_color = _METHOD_ICONS.get(method, "⚪")
 
                             st.markdown(f"**{method_color} {method}** `{path}`")
                             st.caption(desc)
@@ -160,7 +236,7 @@ else:
                 else:
                     st.info("No API design available")
 
-            with tab3:
+            elif view == "Data Model":
                 data_model = spec.get("data_model", {})
                 if data_model:
                     models = data_model.get("models", [])
@@ -180,14 +256,14 @@ else:
                 else:
                     st.info("No data model available")
 
-            with tab4:
+            elif view == "Security":
                 security = spec.get("security_requirements", {})
                 if security:
                     st.json(security)
                 else:
                     st.info("No security requirements defined")
 
-            with tab5:
+            elif view == "Diagrams":
                 diagrams = spec.get("mermaid_diagrams", {})
                 if diagrams:
                     for name, diagram in diagrams.items():
@@ -214,3 +290,6 @@ else:
                         st.rerun()
 
             st.divider()
+
+# Drawn for empty pages too, so there is always a way back
+render_pager("spec_page", page, specs_page["total_pages"])
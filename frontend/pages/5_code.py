@@ -1,7 +1,14 @@
 """Code page for Streamlit."""
+import io
+import os
+import zipfile
+from collections import Counter
+
+import pandas as pd
 import streamlit as st
 
-from components.auth import api_request, check_authentication
+from components.auth import api_request, cached_api_request, check_authentication
+from components.pagination import check_page, page_input, render_pager, reset_page
 
 st.set_page_config(page_title="Code", page_icon="💻", layout="wide")
 
@@ -11,93 +18,250 @@ if not check_authentication():
 
 st.markdown("## Generated Code")
 
-
-def load_code_artifacts(spec_id: int = None):
-    """Load code artifacts from API."""
-    params = {}
+_CODE_STATUS_ICONS = {
+    "draft": "⚪",
+    "validating": "🔄",
+    "valid": "✅",
+    "invalid": "❌",
+    "fixing": "🔧",
+}
+
+# Syntax highlighting language by file extension; anything else is Python
+_LANG_BY_EXT = {
+    ".txt": "text",
+    ".toml": "toml",
+    ".json": "json",
+    ".md": "markdown",
+}
+
+# Items per page; also caps how many item widgets a rerun builds
+PAGE_SIZE = 25
+
+
+def load_code_artifacts(spec_id: int = None, status: str = None, page: int = 1):
+    """Load one page of code artifacts from the API, filtered server-side."""
+    params = {"page": page, "page_size": PAGE_SIZE}
     if spec_id:
         params["spec_id"] = spec_id
+    if status:
+        params["status_filter"] = status
 
-    success, result = api_request("GET", "/code", params=params)
+    success, result = cached_api_request("/code", params=params)
     if success:
-        return result.get("items", [])
-    return []
+        return result
+    return {"items": [], "total": 0, "total_pages": 0}
 
 
-def get_validation_report(artifact_id: int):
-    """Get validation report for an artifact."""
-    success, result = api_request("GET", f"/code/{artifact_id}/validation-report")
-    if success:
-        return result
-    return None
+@st.cache_data(ttl=300, show_spinner=False)
+def load_spec_options(token: str | None) -> list[tuple[str, int]]:
+    """(label, id) pairs for the spec filter; these change rarely, so keep them 5 min.
 
+    Raises RuntimeError on failure so an error is not cached.
+    """
+    success, result = api_request("GET", "/specs")
+    if not success:
+        raise RuntimeError(result)
+    return [(f"Spec #{s['id']}", s["id"]) for s in result.get("items", [])]
 
-def download_code(artifact_id: int):
-    """Get download URL for code artifact."""
-    # This would typically return a download link
-    return f"/api/v1/code/{artifact_id}/export"
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_validation_reports(artifact_ids: tuple, token: str | None) -> dict:
+    """Get validation reports for several artifacts in one request, by artifact ID.
+
+    The token is only part of the cache key, so one user's reports are never
+    served to another.
+    """
+    success, result = api_request(
+        "POST",
+        "/code/validation-reports",
+        data={"ids": list(artifact_ids)},
+    )
+    if success:
+        return {report["artifact_id"]: report for report in result.get("reports", [])}
+    return {}
+
+
+def _write_files(archive: zipfile.ZipFile, files: dict, prefix: str = ""):
+    """Add an artifact's files to an open archive, laid out as /code/{id}/export does."""
+    for filename, content in files.items():
+        archive.writestr(f"{prefix}{filename}", content)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def artifact_zip(artifact_id: int, version: int, _files: dict) -> bytes:
+    """ZIP of an artifact version, built from the files the page already loaded.
+
+    Files only change with the version, so _files is left out of the cache key.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        _write_files(archive, _files)
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def export_zip(versions: tuple, _artifacts: list) -> bytes:
+    """One ZIP holding every given artifact under an artifact_<id>/ folder.
+
+    versions is the (id, version) pairs of _artifacts and serves as the cache key.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for artifact in _artifacts:
+            _write_files(archive, artifact.get("files", {}), f"artifact_{artifact['id']}/")
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def sorted_file_names(artifact_id: int, version: int, names: tuple) -> list[str]:
+    """Sorted file names of an artifact version, reused across reruns."""
+    return sorted(names)
+
+
+def render_validation_report(report: dict | None):
+    """Show a validation report, or a note when there is none."""
+    if report:
+        st.markdown(f"**Status:** {report.get('status', 'N/A')}")
+        st.markdown(f"**Fix Attempts:** {report.get('fix_attempts', 0)}")
+
+        # Validation Report
+        if report.get("validation_report"):
+            st.markdown("### Validation Report")
+            st.json(report["validation_report"])
+
+        # Lint Results
+        if report.get("lint_results"):
+            st.markdown("### Lint Results")
+            lint_errors = report["lint_results"]
+            if lint_errors:
+                for error in lint_errors:
+                    st.error(
+                        f"**{error.get('file', 'unknown')}:{error.get('line', 0)}** "
+                        f"[{error.get('code', 'ERR')}] {error.get('message', '')}"
+                    )
+            else:
+                st.success("No lint errors!")
+
+        # Test Results
+        if report.get("test_results"):
+            st.markdown("### Test Results")
+            for test in report["test_results"]:
+                if test.get("passed"):
+                    st.success(f"✓ {test.get('test_name', 'Test')}")
+                else:
+                    st.error(
+                        f"✗ {test.get('test_name', 'Test')}: "
+                        f"{test.get('error_message', 'Failed')}"
+                    )
+
+        # Error Log
+        if report.get("error_log"):
+            st.markdown("### Error Log")
+            st.code(report["error_log"])
+    else:
+        st.info("No validation report available")
 
 
 # Sidebar filters
 with st.sidebar:
     st.markdown("### Filters")
 
-    # Spec filter
-    success, specs_data = api_request("GET", "/specs")
-    spec_options = ["All Specs"]
-    spec_map = {}
-    if success:
-        for s in specs_data.get("items", []):
-            spec_options.append(f"Spec #{s['id']}")
-            spec_map[f"Spec #{s['id']}"] = s["id"]
+    st.button("↻ Refresh filters", on_click=load_spec_options.clear)
 
-    selected_spec = st.selectbox("Spec", spec_options)
+    # Spec filter
+    try:
+        spec_labels = load_spec_options(st.session_state.get("token"))
+    except RuntimeError:
+        spec_labels = []
+    spec_map = dict(spec_labels)
+    spec_options = ["All Specs", *(label for label, _ in spec_labels)]
+
+    selected_spec = st.selectbox("Spec", spec_options, on_change=reset_page, args=("artifact_page",))
     spec_id = spec_map.get(selected_spec)
 
     # Status filter
     status_filter = st.selectbox(
         "Status",
         ["All", "draft", "validating", "valid", "invalid", "fixing"],
+        on_change=reset_page,
+        args=("artifact_page",),
     )
 
-# Load artifacts
-artifacts = load_code_artifacts(spec_id)
-
-if status_filter != "All":
-    artifacts = [a for a in artifacts if a.get("status") == status_filter]
+    page = page_input("artifact_page")
 
-# Summary
+# Load artifacts
+artifacts_page = load_code_artifacts(spec_id, None if status_filter == "All" else status_filter, page)
+check_page("artifact_page", page, artifacts_page["total_pages"])
+artifacts = artifacts_page["items"]
+
+# One pass over this page's artifacts for the summary metrics and the export list
+status_counts = Counter()
+total_files = 0
+valid_artifacts = []
+for a in artifacts:
+    status = a.get("status", "draft")
+    status_counts[status] += 1
+    total_files += len(a.get("files", {}))
+    if status == "valid":
+        valid_artifacts.append(a)
+
+# Summary; only the total covers every page
 if artifacts:
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Artifacts", len(artifacts))
+        st.metric("Total Artifacts", artifacts_page["total"])
     with col2:
-        valid_count = len([a for a in artifacts if a.get("status") == "valid"])
-        st.metric("Valid", valid_count)
+        st.metric("Valid on Page", status_counts["valid"])
     with col3:
-        invalid_count = len([a for a in artifacts if a.get("status") == "invalid"])
-        st.metric("Invalid", invalid_count)
+        st.metric("Invalid on Page", status_counts["invalid"])
     with col4:
-        total_files = sum(len(a.get("files", {})) for a in artifacts)
-        st.metric("Total Files", total_files)
+        st.metric("Files on Page", total_files)
 
 st.divider()
 
 # Code artifacts list
 st.markdown("### Code Artifacts")
+st.caption(
+    f"Page {page} of {max(artifacts_page['total_pages'], 1)} · {artifacts_page['total']} artifacts"
+)
 
 if not artifacts:
     st.info("No code artifacts found. Generate code from approved specs.")
 else:
-    for artifact in artifacts:
+    # One table widget for the whole page; the full view with its tabs is
+    # only built for the selected rows
+    table = pd.DataFrame({
+        "Status": [
+            f"{_CODE_STATUS_ICONS.get(a.get('status', 'draft'), '⚪')} {a.get('status', 'draft')}"
+            for a in artifacts
+        ],
+        "Artifact": [f"#{a['id']}" for a in artifacts],
+        "Spec": [a.get("spec_id") for a in artifacts],
+        "Version": [a.get("version", 1) for a in artifacts],
+        "Files": [len(a.get("files", {})) for a in artifacts],
+        "Fix attempts": [a.get("fix_attempts", 0) for a in artifacts],
+    })
+    selection = st.dataframe(
+        table,
+        key="artifacts_table",
+        hide_index=True,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="multi-row",
+    )
+    selected = [artifacts[i] for i in selection.selection.rows if i < len(artifacts)]
+    if not selected:
+        st.caption("Select artifacts in the table to see their files and validation.")
+
+    # Reports for every Validation tab that is switched on, in one request
+    shown_reports = tuple(
+        a["id"] for a in selected if st.session_state.get(f"show_validation_{a['id']}")
+    )
+    reports = load_validation_reports(shown_reports, st.session_state.get("token")) if shown_reports else {}
+
+    for artifact in selected:
         with st.container():
-            status_icon = {
-                "draft": "⚪",
-                "validating": "🔄",
-                "valid": "✅",
-                "invalid": "❌",
-                "fixing": "🔧",
-            }.get(artifact.get("status", "draft"), "⚪")
+            status_icon = _CODE_STATUS_ICONS.get(artifact.get("status", "draft"), "⚪")
 
             col1, col2, col3 = st.columns([4, 1, 1])
 
@@ -113,10 +277,17 @@ else:
 
             with col3:
                 if artifact.get("status") == "valid":
-                    if st.button("Download", key=f"download_{artifact['id']}"):
-                        st.markdown(
-                            f"[Download ZIP]({download_code(artifact['id'])})"
-                        )
+                    # The browser would open a plain link without the session's
+                    # token, so hand it the bytes instead
+                    st.download_button(
+                        "Download",
+                        data=artifact_zip(
+                            artifact["id"], artifact.get("version", 1), artifact.get("files", {})
+                        ),
+                        file_name=f"artifact_{artifact['id']}.zip",
+                        mime="application/zip",
+                        key=f"download_{artifact['id']}",
+                    )
 
             # Tabs for code and validation
             tab1, tab2 = st.tabs(["Files", "Validation"])
@@ -125,7 +296,9 @@ else:
                 files = artifact.get("files", {})
                 if files:
                     # File tree
-                    file_list = sorted(files.keys())
+                    file_list = sorted_file_names(
+                        artifact["id"], artifact.get("version", 1), tuple(files)
+                    )
 
                     selected_file = st.selectbox(
                         "Select File",
@@ -135,15 +308,7 @@ else:
 
                     if selected_file:
                         # Determine language for syntax highlighting
-                        lang = "python"
-                        if selected_file.endswith(".txt"):
-                            lang = "text"
-                        elif selected_file.endswith(".toml"):
-                            lang = "toml"
-                        elif selected_file.endswith(".json"):
-                            lang = "json"
-                        elif selected_file.endswith(".md"):
-                            lang = "markdown"
+                        lang = _LANG_BY_EXT.get(os.path.splitext(selected_file)[1], "python")
 
                         st.code(files[selected_file], language=lang)
 
@@ -151,74 +316,41 @@ else:
                     st.divider()
                     st.markdown("**File Statistics:**")
 
-                    file_stats = []
-                    for fname, content in files.items():
-                        lines = len(content.split("\n"))
-                        file_stats.append({
-                            "File": fname,
-                            "Lines": lines,
-                            "Size": f"{len(content)} bytes",
-                        })
+                    # count() scans each file once without building a list of its lines
+                    file_stats = pd.DataFrame({
+                        "File": list(files),
+                        "Lines": [content.count("\n") + 1 for content in files.values()],
+                        "Size": [f"{len(content)} bytes" for content in files.values()],
+                    })
 
                     st.dataframe(file_stats, use_container_width=True)
                 else:
                     st.info("No files in this artifact")
 
             with tab2:
-                report = get_validation_report(artifact["id"])
-
-                if report:
-                    st.markdown(f"**Status:** {report.get('status', 'N/A')}")
-                    st.markdown(f"**Fix Attempts:** {report.get('fix_attempts', 0)}")
-
-                    # Validation Report
-                    if report.get("validation_report"):
-                        st.markdown("### Validation Report")
-                        st.json(report["validation_report"])
-
-                    # Lint Results
-                    if report.get("lint_results"):
-                        st.markdown("### Lint Results")
-                        lint_errors = report["lint_results"]
-                        if lint_errors:
-                            for error in lint_errors:
-                                st.error(
-                                    f"**{error.get('file', 'unknown')}:{error.get('line', 0)}** "
-                                    f"[{error.get('code', 'ERR')}] {error.get('message', '')}"
-                                )
-                        else:
-                            st.success("No lint errors!")
-
-                    # Test Results
-                    if report.get("test_results"):
-                        st.markdown("### Test Results")
-                        for test in report["test_results"]:
-                            if test.get("passed"):
-                                st.success(f"✓ {test.get('test_name', 'Test')}")
-                            else:
-                                st.error(
-                                    f"✗ {test.get('test_name', 'Test')}: "
-                                    f"{test.get('error_message', 'Failed')}"
-                                )
-
-                    # Error Log
-                    if report.get("error_log"):
-                        st.markdown("### Error Log")
-                        st.code(report["error_log"])
-                else:
-                    st.info("No validation report available")
+                # Tab bodies run even when the tab is not selected, so only
+                # fetch the report once it is asked for
+                if st.toggle("Load validation report", key=f"show_validation_{artifact['id']}"):
+                    render_validation_report(reports.get(artifact["id"]))
 
             st.divider()
 
-# Export all code section
-st.markdown("### Export All Code")
+# Drawn for empty pages too, so there is always a way back
+render_pager("artifact_page", page, artifacts_page["total_pages"])
 
-valid_artifacts = [a for a in artifacts if a.get("status") == "valid"]
-if valid_artifacts:
-    st.markdown(f"**{len(valid_artifacts)} valid artifact(s) available for export**")
+# Export section; covers the artifacts loaded for this page only
+st.markdown("### Export Code")
 
-    if st.button("Export All Valid Artifacts"):
-        for artifact in valid_artifacts:
-            st.markdown(f"- [Download Artifact #{artifact['id']}]({download_code(artifact['id'])})")
+if valid_artifacts:
+    st.markdown(f"**{len(valid_artifacts)} valid artifact(s) on this page available for export**")
+
+    st.download_button(
+        "Export Valid Artifacts on This Page",
+        data=export_zip(
+            tuple((a["id"], a.get("version", 1)) for a in valid_artifacts), valid_artifacts
+        ),
+        file_name=f"code_artifacts_page_{page}.zip",
+        mime="application/zip",
+    )
 else:
-    st.info("No valid code artifacts available for export")
+    st.info("No valid code artifacts on this page to export")
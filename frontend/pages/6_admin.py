@@ -1,7 +1,7 @@
 """Admin page for Streamlit."""
 import streamlit as st
 
-from components.auth import api_request, check_authentication
+from components.auth import API_URL, api_request, api_request_many, check_authentication
 
 st.set_page_config(page_title="Admin", page_icon="⚙️", layout="wide")
 
@@ -17,43 +17,46 @@ if user.get("role") != "admin":
 
 st.markdown("## Admin Dashboard")
 
-
-def load_stats():
-    """Load system statistics."""
-    success, result = api_request("GET", "/admin/stats")
-    if success:
-        return result
-    return None
-
-
-def load_users(page: int = 1, page_size: int = 20):
-    """Load users."""
-    success, result = api_request(
-        "GET",
-        "/admin/users",
-        params={"page": page, "page_size": page_size},
-    )
-    if success:
-        return result
-    return {"items": [], "total": 0}
-
-
-def load_all_projects(page: int = 1, page_size: int = 20):
-    """Load all projects."""
-    success, result = api_request(
-        "GET",
-        "/admin/projects",
-        params={"page": page, "page_size": page_size},
-    )
-    if success:
-        return result
-    return {"items": [], "total": 0}
+_PROJECT_STATUS_ICONS = {
+    "draft": "⚪",
+    "in_progress": "🔄",
+    "completed": "✅",
+    "failed": "❌",
+}
+
+
+# The health check lives at the server root, outside the API prefix
+HEALTH_URL = f"{API_URL.removesuffix('/api/v1')}/health"
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def load_dashboard(token: str | None, page: int = 1, page_size: int = 20) -> dict:
+    """Load stats, users, projects and backend health with concurrent requests.
+
+    The dashboard waits for the slowest request instead of all four in turn.
+    The token is only part of the cache key, so one admin's view is never
+    served to another.
+    """
+    paging = {"page": page, "page_size": page_size}
+    stats, users, projects, health = api_request_many([
+        ("GET", "/admin/stats"),
+        ("GET", "/admin/users", None, paging),
+        ("GET", "/admin/projects", None, paging),
+        ("GET", HEALTH_URL),
+    ])
+    return {
+        "stats": stats[1] if stats[0] else None,
+        "users": users[1] if users[0] else {"items": [], "total": 0},
+        "projects": projects[1] if projects[0] else {"items": [], "total": 0},
+        "healthy": health[0],
+    }
 
 
 def promote_user(user_id: int):
     """Promote user to admin."""
     success, result = api_request("POST", f"/admin/users/{user_id}/promote")
     if success:
+        load_dashboard.clear()
         st.success("User promoted to admin!")
         return result
     else:
@@ -65,6 +68,7 @@ def demote_user(user_id: int):
     """Demote admin to user."""
     success, result = api_request("POST", f"/admin/users/{user_id}/demote")
     if success:
+        load_dashboard.clear()
         st.success("User demoted!")
         return result
     else:
@@ -76,6 +80,7 @@ def delete_user(user_id: int):
     """Delete a user."""
     success, result = api_request("DELETE", f"/admin/users/{user_id}")
     if success:
+        load_dashboard.clear()
         st.success("User deleted!")
         return True
     else:
@@ -86,7 +91,8 @@ def delete_user(user_id: int):
 # System Statistics
 st.markdown("### System Statistics")
 
-stats = load_stats()
+dashboard = load_dashboard(st.session_state.get("token"))
+stats = dashboard["stats"]
 
 if stats:
     col1, col2, col3 = st.columns(3)
@@ -139,7 +145,7 @@ tab1, tab2 = st.tabs(["Users", "All Projects"])
 with tab1:
     st.markdown("### User Management")
 
-    users_data = load_users()
+    users_data = dashboard["users"]
     users = users_data.get("items", [])
 
     if users:
@@ -178,7 +184,7 @@ with tab1:
 with tab2:
     st.markdown("### All Projects")
 
-    projects_data = load_all_projects()
+    projects_data = dashboard["projects"]
     projects = projects_data.get("items", [])
 
     if projects:
@@ -209,12 +215,7 @@ with tab2:
 
                 with col2:
                     status = project.get("status", "draft")
-                    status_icon = {
-                        "draft": "⚪",
-                        "in_progress": "🔄",
-                        "completed": "✅",
-                        "failed": "❌",
-                    }.get(status, "⚪")
+                    status_icon = _PROJECT_STATUS_ICONS.get(status, "⚪")
                     st.markdown(f"{status_icon} {status}")
 
                 with col3:
@@ -232,8 +233,7 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     st.markdown("#### Backend API")
-    success, _ = api_request("GET", "/../health")
-    if success:
+    if dashboard["healthy"]:
         st.success("✓ Healthy")
     else:
         st.error("✗ Unhealthy")